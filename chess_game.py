@@ -2,6 +2,7 @@ import pygame
 import sys
 from python_chess import chess_logic
 from python_chess import chess_ai
+from python_chess.time_manager import TimeManager
 
 
 WIDTH = HEIGHT = 512  # For dimensions of board
@@ -12,6 +13,13 @@ IMAGES = {}
 X_CENTER = (WIDTH + MOVE_LOG_WIDTH) // 2  # Gets the horizontal center of the screen
 Y_CENTER = HEIGHT // 2  # Gets the vertical center of the screen
 
+# There is no clock, so the AI plans its time as if it had AI_CLOCK_TIME seconds left for the
+# next AI_MOVES_TO_GO moves, which is about 2 seconds a move. It thinks for longer if its best
+# move keeps changing or its evaluation drops, but never for more than AI_TIME_LIMIT seconds
+AI_CLOCK_TIME = 60
+AI_MOVES_TO_GO = 30
+AI_TIME_LIMIT = 5
+
 # Integers corresponding to the AIs
 AI = {
     1: chess_ai.random_move_ai,
@@ -29,11 +37,6 @@ player_black = False
 
 def main() -> None:
 
-    # Default AI is the negamax AI at depth 3 ply
-    global ai
-    global depth
-    ai, depth = 4, 3
-
     screen = pygame.display.set_mode((WIDTH + MOVE_LOG_WIDTH, HEIGHT))
     clock = pygame.time.Clock()
     screen.fill(pygame.Color("white"))
@@ -101,7 +104,7 @@ def main() -> None:
 
 
 def options_screen(screen, clock) -> None:
-    """The options menu, where users choose the AI and depth"""
+    """The options menu, where users choose if a human or the AI plays each colour"""
 
     pygame.display.set_caption("Options")
     options_font = pygame.font.SysFont("arial", 25, False, False)
@@ -359,31 +362,28 @@ def play_screen(screen: pygame.display, clock: pygame.time) -> None:
 
                     else:
 
-                        move = chess_logic.Move(
-                            piece_move[0], piece_move[1], game_state.board
-                        )
+                        move = game_state.get_legal_move(piece_move[0], piece_move[1])
 
                         # If move is valid, make move
-                        for i in range(len(valid_moves)):
-                            if move == valid_moves[i]:
+                        if move:
 
-                                promotion_piece = ""
+                            promotion_piece = ""
 
-                                # If it is a pawn promotion, prompt user for which piece
-                                if move.is_pawn_promotion:
-                                    promotion_piece = input(
-                                        "Piece to be promoted (Q, N, B, R): "
-                                    )
+                            # If it is a pawn promotion, prompt user for which piece
+                            if move.is_pawn_promotion:
+                                promotion_piece = input(
+                                    "Piece to be promoted (Q, N, B, R): "
+                                )
 
-                                    # TODO: add GUI for this input
+                                # TODO: add GUI for this input
 
-                                game_state.make_move(valid_moves[i], promotion_piece)
+                            game_state.make_move(move, promotion_piece)
 
-                                move_made = True
-                                animate = True
+                            move_made = True
+                            animate = True
 
-                                square_selected = ()
-                                piece_move = []
+                            square_selected = ()
+                            piece_move = []
 
                         # If no moves made as it is illegal, deselect
                         if not move_made:
@@ -412,8 +412,13 @@ def play_screen(screen: pygame.display, clock: pygame.time) -> None:
 
         # Calls the required chess engine
         if not game_over and not is_human_turn:
-            ai_move, ai_promotion_type, evaluation = chess_ai.negamax_ai(
-                game_state, valid_moves, depth=3
+            ai_move, ai_promotion_type, evaluation = chess_ai.iterative_deepening_ai(
+                game_state,
+                valid_moves,
+                depth=chess_ai.MAX_DEPTH,
+                time_manager=TimeManager(
+                    AI_CLOCK_TIME, moves_to_go=AI_MOVES_TO_GO, max_time=AI_TIME_LIMIT
+                ),
             )
             game_state.make_move(ai_move, ai_promotion_type)
             print(f"move:{ai_move.get_chess_notation()}, evaluation: {evaluation}")
@@ -430,12 +435,12 @@ def play_screen(screen: pygame.display, clock: pygame.time) -> None:
             move_made = False
 
             # Test for checkmate and stalemate
-            if not valid_moves or game_state.draw_log[-1].check_for_draw():
+            if not valid_moves or game_state.check_for_draw():
                 game_over = True
 
         if game_over:
 
-            if game_state.draw_log[-1].check_for_draw():
+            if game_state.check_for_draw():
                 draw_endgame_text(screen, f"Draw!")
 
             else:
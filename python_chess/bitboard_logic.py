@@ -0,0 +1,602 @@
+from .chess_logic import (
+    ALL_MOVES,
+    BLACK_KING_SIDE,
+    BLACK_QUEEN_SIDE,
+    CAPTURED_IDS,
+    CASTLE_FLAG,
+    DIRECTIONS,
+    END_SHIFT,
+    EN_PASSANT_FLAG,
+    INDEX_PIECES,
+    KNIGHT_OFFSETS,
+    MOVED_IDS,
+    NOISY_MOVES,
+    PIECE_CAPTURED_SHIFT,
+    PIECE_MOVED_SHIFT,
+    PROMOTION_FLAG,
+    QUIET_MOVES,
+    SQUARES,
+    WHITE_KING_SIDE,
+    WHITE_QUEEN_SIDE,
+    GameState,
+    Move,
+)
+from .magic_bitboards import get_bishop_attacks, get_rook_attacks
+
+# Squares are numbered row * 8 + column, so bit 0 is a8 and bit 63 is h1
+
+FULL_BOARD = (1 << 64) - 1
+
+# Masks for a single row or column of the board
+ROW_MASKS = [0xFF << (8 * row) for row in range(8)]
+COLUMN_MASKS = [sum(1 << (8 * row + column) for row in range(8)) for column in range(8)]
+
+# Pawns moving onto either end row are promoting
+PROMOTION_ROWS = ROW_MASKS[0] | ROW_MASKS[7]
+
+PIECES = ("wp", "wN", "wB", "wR", "wQ", "wK", "bp", "bN", "bB", "bR", "bQ", "bK")
+
+
+def get_jump_attacks(offsets: tuple) -> list[int]:
+    """Returns a list of the attack sets of a piece which jumps by the offsets, for each square"""
+
+    attacks = []
+
+    for row, column in SQUARES:
+        bitboard = 0
+
+        for row_offset, column_offset in offsets:
+            new_row, new_column = row + row_offset, column + column_offset
+
+            if 0 <= new_row < 8 and 0 <= new_column < 8:
+                bitboard |= 1 << (new_row * 8 + new_column)
+
+        attacks.append(bitboard)
+
+    return attacks
+
+
+def get_rays() -> list[list[int]]:
+    """Returns the squares reachable on an empty board in each direction, for each square"""
+
+    rays = []
+
+    for row_offset, column_offset in DIRECTIONS:
+        direction_rays = []
+
+        for row, column in SQUARES:
+            bitboard = 0
+            new_row, new_column = row + row_offset, column + column_offset
+
+            while 0 <= new_row < 8 and 0 <= new_column < 8:
+                bitboard |= 1 << (new_row * 8 + new_column)
+                new_row, new_column = new_row + row_offset, new_column + column_offset
+
+            direction_rays.append(bitboard)
+
+        rays.append(direction_rays)
+
+    return rays
+
+
+KNIGHT_ATTACKS = get_jump_attacks(KNIGHT_OFFSETS)
+KING_ATTACKS = get_jump_attacks(DIRECTIONS)
+
+# The squares a pawn of each colour attacks from each square
+PAWN_ATTACKS = {
+    "w": get_jump_attacks(((-1, -1), (-1, 1))),
+    "b": get_jump_attacks(((1, -1), (1, 1))),
+}
+
+RAYS = get_rays()
+
+
+def get_lines() -> tuple[list[list[int]], list[list[int]]]:
+    """
+    Returns the tables of squares between two squares (exclusive) and the full line
+    through two squares, both are empty if the squares are not on the same line
+    """
+
+    between = [[0] * 64 for _ in range(64)]
+    lines = [[0] * 64 for _ in range(64)]
+
+    for square in range(64):
+        for direction in range(8):
+            ray = RAYS[direction][square]
+            opposite_ray = RAYS[direction ^ 3 if direction < 4 else direction ^ 2][
+                square
+            ]
+
+            full_line = ray | opposite_ray | (1 << square)
+
+            bitboard = ray
+            while bitboard:
+                target_bit = bitboard & -bitboard
+                bitboard ^= target_bit
+                target = target_bit.bit_length() - 1
+
+                lines[square][target] = full_line
+                between[square][target] = ray & ~RAYS[direction][target] & ~target_bit
+
+    return between, lines
+
+
+BETWEEN, LINES = get_lines()
+
+
+class BitboardGameState(GameState):
+    """
+    Game state which keeps a bitboard (64 bit integer) for every piece as well as
+    the occupancy of both colours, and uses them to generate moves.
+
+    The list of lists board is still kept updated so that Move and the evaluation work unchanged.
+    """
+
+    def __init__(self, pseudo_legal: bool = False) -> None:
+        """
+        Args:
+            pseudo_legal (bool): whether get_valid_moves skips the pin and check analysis, so that
+                the moves have to be checked with king_left_in_check once they are made
+        """
+
+        super().__init__(pseudo_legal)
+
+        self.set_bitboards()
+
+    def set_position(self, *args, **kwargs) -> None:
+        """Sets the position, along with the bitboards"""
+
+        super().set_position(*args, **kwargs)
+
+        self.set_bitboards()
+
+    def clone(self) -> "BitboardGameState":
+        """Returns a copy of the game state, along with the bitboards"""
+
+        game_state = super().clone()
+
+        game_state.bitboards = self.bitboards.copy()
+        game_state.occupancy = self.occupancy.copy()
+
+        return game_state
+
+    def set_bitboards(self) -> None:
+        """Sets all the bitboards from the current board"""
+
+        self.bitboards = {piece: 0 for piece in PIECES}
+
+        for square, (row, column) in enumerate(SQUARES):
+            if piece := self.board[row][column]:
+                self.bitboards[piece] |= 1 << square
+
+        self.occupancy = {
+            "w": sum(self.bitboards[piece] for piece in PIECES[:6]),
+            "b": sum(self.bitboards[piece] for piece in PIECES[6:]),
+        }
+
+    def make_move(self, move, promotion_type: str = "") -> None:
+        """Makes a move, updating both the board and the bitboards"""
+
+        super().make_move(move, promotion_type)
+
+        self.toggle_move(move)
+
+    def undo_move(self) -> None:
+        """Undoes the last move, updating both the board and the bitboards"""
+
+        if self.move_log:
+            self.toggle_move(self.move_log[-1])
+
+        super().undo_move()
+
+    def toggle_move(self, move: Move) -> None:
+        """
+        Toggles the bits of the squares affected by a move, as the bits are flipped
+        using xor, calling this twice on the same move undoes it. The board has to be in the
+        position after the move
+        """
+
+        bitboards = self.bitboards
+        occupancy = self.occupancy
+
+        # Unpack the move once rather than going through its properties
+        move_id = move.id
+        start_square = move_id & 63
+        end_square = move_id >> END_SHIFT & 63
+        piece_moved = INDEX_PIECES[move_id >> PIECE_MOVED_SHIFT & 15]
+        colour = piece_moved[0]
+
+        start_bit = 1 << start_square
+        end_bit = 1 << end_square
+
+        occupancy[colour] ^= start_bit | end_bit
+
+        # The piece on the end square is not the piece moved if it was a promotion
+        if move_id & PROMOTION_FLAG:
+            end_row, end_column = SQUARES[end_square]
+            bitboards[piece_moved] ^= start_bit
+            bitboards[self.board[end_row][end_column]] ^= end_bit
+
+        else:
+            bitboards[piece_moved] ^= start_bit | end_bit
+
+        if move_id >> PIECE_CAPTURED_SHIFT:
+            piece_captured = INDEX_PIECES[move_id >> PIECE_CAPTURED_SHIFT & 15]
+
+            # The pawn captured en passant is on the starting row, in the end column
+            if move_id & EN_PASSANT_FLAG:
+                captured_bit = 1 << (start_square & 56 | end_square & 7)
+
+            else:
+                captured_bit = end_bit
+
+            bitboards[piece_captured] ^= captured_bit
+            occupancy[piece_captured[0]] ^= captured_bit
+
+        # Move the rook for castling moves
+        elif move_id & CASTLE_FLAG:
+            if end_square & 7 == 6:
+                rook_bits = end_bit << 1 | end_bit >> 1
+
+            else:
+                rook_bits = end_bit >> 2 | end_bit << 1
+
+            bitboards[colour + "R"] ^= rook_bits
+            occupancy[colour] ^= rook_bits
+
+    def get_attackers(self, square: int, colour: str, occupied: int) -> int:
+        """Returns a bitboard of the pieces of the colour that attack the square"""
+
+        bitboards = self.bitboards
+        opponent = "b" if colour == "w" else "w"
+
+        queens = bitboards[colour + "Q"]
+
+        return (
+            (KNIGHT_ATTACKS[square] & bitboards[colour + "N"])
+            | (KING_ATTACKS[square] & bitboards[colour + "K"])
+            | (PAWN_ATTACKS[opponent][square] & bitboards[colour + "p"])
+            | (
+                get_bishop_attacks(square, occupied)
+                & (bitboards[colour + "B"] | queens)
+            )
+            | (get_rook_attacks(square, occupied) & (bitboards[colour + "R"] | queens))
+        ) & self.occupancy[colour]
+
+    def is_attacked(self, square: tuple, by_colour: str) -> bool:
+        """Returns bool of if the square is attacked by a colour"""
+
+        occupied = self.occupancy["w"] | self.occupancy["b"]
+
+        return bool(self.get_attackers(square[0] * 8 + square[1], by_colour, occupied))
+
+    def get_pinned(self, king_square: int, turn: str, opponent: str) -> int:
+        """Returns a bitboard of the pieces of the player to move which are pinned to their king"""
+
+        bitboards = self.bitboards
+        own = self.occupancy[turn]
+        opponents = self.occupancy[opponent]
+        queens = bitboards[opponent + "Q"]
+
+        # Opponent sliders which would attack the king if the player's pieces were not there
+        snipers = (
+            get_bishop_attacks(king_square, opponents)
+            & (bitboards[opponent + "B"] | queens)
+        ) | (
+            get_rook_attacks(king_square, opponents)
+            & (bitboards[opponent + "R"] | queens)
+        )
+
+        pinned = 0
+
+        while snipers:
+            sniper_bit = snipers & -snipers
+            snipers ^= sniper_bit
+
+            blockers = BETWEEN[king_square][sniper_bit.bit_length() - 1] & (
+                own | opponents
+            )
+
+            # Only pinned if there is exactly one piece in between, and it is the player's piece
+            if blockers and not blockers & (blockers - 1) and blockers & own:
+                pinned |= blockers
+
+        return pinned
+
+    def get_valid_moves(self, move_types: int = ALL_MOVES) -> list:
+        """
+        Returns all the valid moves in the current game state
+
+        Args:
+            move_types (int): whether to get all, only noisy or only quiet moves
+
+        Returns:
+            list: list of all valid moves
+        """
+
+        moves = []
+        bitboards = self.bitboards
+        board = self.board
+
+        turn, opponent = ("w", "b") if self.white_move else ("b", "w")
+        own = self.occupancy[turn]
+        opponents = self.occupancy[opponent]
+        occupied = own | opponents
+
+        king_bit = bitboards[turn + "K"]
+        king_square = king_bit.bit_length() - 1
+
+        checkers = self.get_attackers(king_square, opponent, occupied)
+        self.in_check = bool(checkers)
+
+        # Pseudo legal moves ignore pins and checks, except that castling still needs to know about check
+        pseudo_legal = self.pseudo_legal
+
+        # Noisy moves are the ones onto an opponent's piece, quiet moves onto an empty square
+        if move_types == NOISY_MOVES:
+            types_mask = opponents
+
+        elif move_types == QUIET_MOVES:
+            types_mask = ~occupied & FULL_BOARD
+
+        else:
+            types_mask = FULL_BOARD
+
+        # King moves, the king is removed from the board so that it cannot block a check on itself
+        targets = KING_ATTACKS[king_square] & ~own & types_mask
+        king_id = king_square | MOVED_IDS[turn + "K"]
+        while targets:
+            target_bit = targets & -targets
+            targets ^= target_bit
+            target = target_bit.bit_length() - 1
+
+            if pseudo_legal or not self.get_attackers(
+                target, opponent, occupied ^ king_bit
+            ):
+                end_row, end_column = SQUARES[target]
+                moves.append(
+                    Move.from_id(
+                        king_id
+                        | target << END_SHIFT
+                        | CAPTURED_IDS[board[end_row][end_column]]
+                    )
+                )
+
+        # If it is double check, only the king can move
+        if checkers & (checkers - 1) and not pseudo_legal:
+            return moves
+
+        # Squares the other pieces have to move to, in order to capture or block the checking piece
+        if checkers and not pseudo_legal:
+            check_mask = checkers | BETWEEN[king_square][checkers.bit_length() - 1]
+
+        else:
+            check_mask = FULL_BOARD
+
+            if move_types != NOISY_MOVES and not checkers:
+                self.get_castle_bitboard_moves(
+                    king_square, turn, opponent, occupied, moves
+                )
+
+        pinned = 0 if pseudo_legal else self.get_pinned(king_square, turn, opponent)
+        targets_mask = ~own & check_mask & types_mask
+
+        # Knights, pinned knights can never move
+        knights = bitboards[turn + "N"] & ~pinned
+        while knights:
+            start_bit = knights & -knights
+            knights ^= start_bit
+            start = start_bit.bit_length() - 1
+
+            self.add_moves(start, KNIGHT_ATTACKS[start] & targets_mask, moves)
+
+        # Sliding pieces, pinned pieces can only move along the line of the pin
+        queens = bitboards[turn + "Q"]
+        for sliders, get_attacks in (
+            (bitboards[turn + "B"] | queens, get_bishop_attacks),
+            (bitboards[turn + "R"] | queens, get_rook_attacks),
+        ):
+            while sliders:
+                start_bit = sliders & -sliders
+                sliders ^= start_bit
+                start = start_bit.bit_length() - 1
+
+                targets = get_attacks(start, occupied) & targets_mask
+
+                if start_bit & pinned:
+                    targets &= LINES[king_square][start]
+
+                self.add_moves(start, targets, moves)
+
+        self.get_pawn_bitboard_moves(
+            king_square,
+            turn,
+            opponent,
+            occupied,
+            pinned,
+            check_mask,
+            moves,
+            move_types,
+        )
+
+        return moves
+
+    def add_moves(self, start: int, targets: int, moves: list) -> None:
+        """Appends a move from the starting square to every square in the targets bitboard"""
+
+        board = self.board
+        start_row, start_column = SQUARES[start]
+        start_id = start | MOVED_IDS[board[start_row][start_column]]
+
+        while targets:
+            target_bit = targets & -targets
+            targets ^= target_bit
+            target = target_bit.bit_length() - 1
+            end_row, end_column = SQUARES[target]
+
+            moves.append(
+                Move.from_id(
+                    start_id
+                    | target << END_SHIFT
+                    | CAPTURED_IDS[board[end_row][end_column]]
+                )
+            )
+
+    def get_pawn_bitboard_moves(
+        self,
+        king_square: int,
+        turn: str,
+        opponent: str,
+        occupied: int,
+        pinned: int,
+        check_mask: int,
+        moves: list,
+        move_types: int = ALL_MOVES,
+    ) -> None:
+        """Appends to list all the pawn moves, generating the moves of all the pawns at once"""
+
+        board = self.board
+        pawn_id = MOVED_IDS[turn + "p"]
+        pawns = self.bitboards[turn + "p"]
+        empty = ~occupied & FULL_BOARD
+        opponents = self.occupancy[opponent]
+
+        # White pawns move towards row 0 and black pawns towards row 7
+        if turn == "w":
+            single_pushes = (pawns >> 8) & empty
+            double_pushes = ((single_pushes & ROW_MASKS[5]) >> 8) & empty
+            left_captures = ((pawns & ~COLUMN_MASKS[0]) >> 9) & opponents
+            right_captures = ((pawns & ~COLUMN_MASKS[7]) >> 7) & opponents
+            shifts = (8, 16, 9, 7)
+
+        else:
+            single_pushes = (pawns << 8) & empty
+            double_pushes = ((single_pushes & ROW_MASKS[2]) << 8) & empty
+            left_captures = ((pawns & ~COLUMN_MASKS[0]) << 7) & opponents
+            right_captures = ((pawns & ~COLUMN_MASKS[7]) << 9) & opponents
+            shifts = (-8, -16, -7, -9)
+
+        # Pushes are only noisy if they promote, while captures are always noisy
+        if move_types == NOISY_MOVES:
+            single_pushes &= PROMOTION_ROWS
+            double_pushes = 0
+
+        elif move_types == QUIET_MOVES:
+            single_pushes &= ~PROMOTION_ROWS
+            left_captures = right_captures = 0
+
+        king_lines = LINES[king_square]
+
+        for targets, shift in zip(
+            (single_pushes, double_pushes, left_captures, right_captures), shifts
+        ):
+            targets &= check_mask
+
+            while targets:
+                target_bit = targets & -targets
+                targets ^= target_bit
+                target = target_bit.bit_length() - 1
+                start = target + shift
+
+                # A pinned pawn can only move along the line of the pin
+                if (1 << start) & pinned and not king_lines[start] & target_bit:
+                    continue
+
+                end_row, end_column = SQUARES[target]
+                move_id = (
+                    start
+                    | target << END_SHIFT
+                    | pawn_id
+                    | CAPTURED_IDS[board[end_row][end_column]]
+                )
+
+                if target_bit & PROMOTION_ROWS:
+                    move_id |= PROMOTION_FLAG
+
+                moves.append(Move.from_id(move_id))
+
+        # En passant, checked by removing both pawns from the board and looking for attacks on the king
+        if self.en_passant_square and move_types != QUIET_MOVES:
+            row, column = self.en_passant_square
+            target = row * 8 + column
+            captured = target + (8 if turn == "w" else -8)
+
+            attackers = PAWN_ATTACKS[opponent][target] & pawns
+
+            while attackers:
+                start_bit = attackers & -attackers
+                attackers ^= start_bit
+
+                new_occupied = (occupied ^ start_bit ^ (1 << captured)) | (1 << target)
+
+                # Only sliders can be uncovered, and the captured pawn can no longer attack
+                if not self.pseudo_legal and (
+                    self.get_attackers(king_square, opponent, new_occupied)
+                    & ~(1 << captured)
+                    & new_occupied
+                ):
+                    continue
+
+                moves.append(
+                    Move.from_id(
+                        start_bit.bit_length() - 1
+                        | target << END_SHIFT
+                        | EN_PASSANT_FLAG
+                        | pawn_id
+                        | CAPTURED_IDS[opponent + "p"]
+                    )
+                )
+
+    def get_castle_bitboard_moves(
+        self,
+        king_square: int,
+        turn: str,
+        opponent: str,
+        occupied: int,
+        moves: list,
+    ) -> None:
+        """Appends to list all of the castle moves, assuming that the king is not in check"""
+
+        if turn == "w":
+            king_side = self.castle_rights & WHITE_KING_SIDE
+            queen_side = self.castle_rights & WHITE_QUEEN_SIDE
+
+        else:
+            king_side = self.castle_rights & BLACK_KING_SIDE
+            queen_side = self.castle_rights & BLACK_QUEEN_SIDE
+
+        if king_side:
+            path = (1 << (king_square + 1)) | (1 << (king_square + 2))
+
+            if not occupied & path and not (
+                self.get_attackers(king_square + 1, opponent, occupied)
+                or self.get_attackers(king_square + 2, opponent, occupied)
+            ):
+                moves.append(
+                    Move(
+                        SQUARES[king_square],
+                        SQUARES[king_square + 2],
+                        is_castle=True,
+                        piece_moved=turn + "K",
+                    )
+                )
+
+        if queen_side:
+            path = (
+                (1 << (king_square - 1))
+                | (1 << (king_square - 2))
+                | (1 << (king_square - 3))
+            )
+
+            if not occupied & path and not (
+                self.get_attackers(king_square - 1, opponent, occupied)
+                or self.get_attackers(king_square - 2, opponent, occupied)
+            ):
+                moves.append(
+                    Move(
+                        SQUARES[king_square],
+                        SQUARES[king_square - 2],
+                        is_castle=True,
+                        piece_moved=turn + "K",
+                    )
+                )
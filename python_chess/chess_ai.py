@@ -1,6 +1,36 @@
 from .chess_logic import *
+from .time_manager import TimeManager
+from .transposition import EXACT_BOUND, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+from collections.abc import Iterator
 import random
-import copy
+import time
+
+# Values used to order captures, a king can always capture safely as its moves are valid
+CAPTURE_VALUES = {"p": 1, "N": 3, "B": 3, "R": 5, "Q": 9, "K": 0}
+
+# The killer moves of each ply, quiet moves which caused a cutoff in a sibling position
+killer_moves = {}
+
+# How many plies shallower the search after a null move is
+NULL_MOVE_REDUCTION = 2
+
+# The results of searched positions, kept between moves so that a search can reuse the last one
+transposition_table = TranspositionTable()
+
+# The deepest iteration of an iterative deepening search
+MAX_DEPTH = 64
+
+# How many positions are searched between checks of the search limits
+NODES_PER_CHECK = 1024
+
+# The limits of the current search, the search unwinds once stop_search is set
+stop_search = False
+search_deadline = None
+node_limit = None
+next_check = 0
+
+# The best move of each position of the last principal variation, searched first
+principal_variation_moves = {}
 
 
 def return_move(move: Move, evaluation) -> tuple[Move, str, int]:
@@ -102,7 +132,7 @@ def materialistic_minimax_ai(
     An AI which only considers material, except that it will recursively call itself up
     to a maximum depth of "depth" ply using a minimax algorithm.
 
-    No alpha beta pruning used
+    No alpha beta pruning used, the moves are made and undone on the game state given
     """
 
     # Keeps track of the number of ply
@@ -110,6 +140,7 @@ def materialistic_minimax_ai(
 
     # Keep track of who's turn it is
     white_move = game_state.white_move
+    in_check = game_state.king_in_check()
 
     # Keep track of the move which gains/ captures the most points
     best_net_evaluation = -100000 if white_move else 100000
@@ -120,30 +151,28 @@ def materialistic_minimax_ai(
     # Finds the best moves for the current iteration
     for move in valid_moves:
 
-        # Creates a copy of the game state so that it is not altered and gets a new evaluation
-        copied_game_state = copy.deepcopy(game_state)
-        copied_game_state.make_move(move)
+        if move.is_pawn_promotion:
+            game_state.make_move(move, "Q")
+
+        else:
+            game_state.make_move(move)
+
+        # Pseudo legal moves are only checked once they are made
+        if game_state.pseudo_legal and game_state.king_left_in_check(in_check):
+            game_state.undo_move()
+            continue
 
         # If it is the last iteration, we simply get the evaluation so we don't have to generate all valid moves
         if current_depth == depth:
-            evaluation = (
-                copied_game_state.white_material - copied_game_state.black_material
-            )
-            best_net_evaluation, best_net_moves = compare_evaluations(
-                move,
-                evaluation,
-                best_net_evaluation,
-                best_net_moves,
-                white_move,
-            )
+            evaluation = game_state.white_material - game_state.black_material
 
         else:
-            copied_valid_moves = copied_game_state.get_valid_moves()
+            next_valid_moves = game_state.get_valid_moves()
 
             # If there are no valid moves, it is either checkmate or stalemate, and update accordingly
-            if not copied_valid_moves:
+            if not game_state.has_legal_move(next_valid_moves):
                 if game_state.in_check:
-                    evaluation = -10000 if white_move else 10000
+                    evaluation = 10000 if white_move else -10000
 
                 else:
                     evaluation = 0
@@ -151,19 +180,21 @@ def materialistic_minimax_ai(
             else:
                 # Call recursion to get the evaluation for every move
                 _, _, evaluation = materialistic_minimax_ai(
-                    copied_game_state,
-                    copied_valid_moves,
+                    game_state,
+                    next_valid_moves,
                     depth,
                     current_depth=current_depth,
                 )
 
-            best_net_evaluation, best_net_moves = compare_evaluations(
-                move,
-                evaluation,
-                best_net_evaluation,
-                best_net_moves,
-                white_move,
-            )
+        game_state.undo_move()
+
+        best_net_evaluation, best_net_moves = compare_evaluations(
+            move,
+            evaluation,
+            best_net_evaluation,
+            best_net_moves,
+            white_move,
+        )
 
     best_move = return_random_move(best_net_moves)
 
@@ -177,9 +208,146 @@ def negamax_ai(
     A negamax AI which has a much more complex evaluation function, did not make use of copy
     """
 
-    global counter
+    start_search()
+
+    best_net_moves, max_evaluation = search_root(game_state, valid_moves, depth)
+    best_move = return_random_move(best_net_moves)
+
+    if best_move:
+        transposition_table.store(
+            game_state.hash, depth, EXACT_BOUND, max_evaluation, best_move.id
+        )
+
+    print(f"Positions searched: {counter}")
+    return return_move(best_move, max_evaluation)
+
+
+def iterative_deepening_ai(
+    game_state: GameState,
+    valid_moves: list[Move],
+    depth: int = MAX_DEPTH,
+    time_limit: float | None = None,
+    nodes: int | None = None,
+    time_manager: TimeManager | None = None,
+) -> tuple[Move, str, float]:
+    """
+    Searches with the negamax AI at depth 1, 2, 3... until the depth, the time limit or the
+    number of nodes is reached. The search is stopped part way through an iteration once a
+    limit is reached, and the best move of the last completed iteration is returned
+
+    With a time manager, no iteration is started after its soft limit or if it is unlikely to
+    finish, and the search is stopped at its hard limit
+
+    Args:
+        game_state (GameState): the position to search
+        valid_moves (list[Move]): the valid moves of the position
+        depth (int): the deepest iteration
+        time_limit (float | None): the number of seconds to search for
+        nodes (int | None): the number of positions to search
+        time_manager (TimeManager | None): decides when to stop searching from the clock
+
+    Returns:
+        tuple[Move, str, float]: the best move, the piece promoted to and its evaluation
+    """
+
+    global search_deadline, node_limit, principal_variation_moves
+
+    start_time = time.perf_counter()
+    start_search()
+
+    deadline = None if time_limit is None else start_time + time_limit
+
+    if time_manager is not None:
+        deadline = min(time_manager.get_deadline(), deadline or float("inf"))
+
+    best_move = None
+    max_evaluation = 0
+    principal_variation = []
+
+    for iteration_depth in range(1, depth + 1):
+        best_net_moves, evaluation = search_root(
+            game_state, valid_moves, iteration_depth
+        )
+
+        if stop_search or not best_net_moves:
+            break
+
+        # Keep the first of equally good moves, so that it is searched first next iteration
+        best_move = best_net_moves[0]
+        max_evaluation = evaluation
+
+        transposition_table.store(
+            game_state.hash, iteration_depth, EXACT_BOUND, max_evaluation, best_move.id
+        )
+
+        principal_variation = get_principal_variation(game_state, iteration_depth)
+        principal_variation_moves = get_principal_variation_moves(
+            game_state, principal_variation
+        )
+
+        print(
+            f"Depth {iteration_depth}: {' '.join(map(str, principal_variation))},"
+            f" evaluation: {max_evaluation}"
+        )
+
+        # The shortest mate is found first, so there is no need to search deeper
+        if abs(max_evaluation) >= 10000:
+            break
+
+        if time_manager is not None:
+            time_manager.update(best_move, max_evaluation)
+
+            if not time_manager.should_start_iteration():
+                break
+
+        # The first iteration always completes, so that there is a move to return
+        search_deadline = deadline
+        node_limit = nodes
+
+    search_deadline = node_limit = None
+    principal_variation_moves = {}
+
+    print(f"Positions searched: {counter}")
+    return return_move(best_move, max_evaluation)
+
+
+def start_search() -> None:
+    """Resets the node count, killer moves and search limits before a search"""
+
+    global counter, killer_moves, stop_search, search_deadline, node_limit, next_check
 
     counter = 0
+    killer_moves = {}
+    stop_search = False
+    search_deadline = node_limit = None
+    next_check = NODES_PER_CHECK
+    transposition_table.new_search()
+
+
+def check_search_limits() -> bool:
+    """Sets stop_search if the time or node limit has been reached, returning stop_search"""
+
+    global stop_search, next_check
+
+    next_check = counter + NODES_PER_CHECK
+
+    if (search_deadline is not None and time.perf_counter() >= search_deadline) or (
+        node_limit is not None and counter >= node_limit
+    ):
+        stop_search = True
+
+    return stop_search
+
+
+def search_root(
+    game_state: GameState, valid_moves: list[Move], depth: int
+) -> tuple[list[Move], float]:
+    """
+    Searches each valid move to the depth, returning the moves with the best evaluation and
+    the evaluation. The moves are not complete if the search was stopped
+    """
+
+    global counter
 
     # To hold the max score among the moves
     max_evaluation = -100000
@@ -187,9 +355,20 @@ def negamax_ai(
     best_net_moves = []
 
     turn_multiplier = 1 if game_state.white_move else -1
-    
+    in_check = game_state.king_in_check()
+
     valid_moves = order_moves(valid_moves)
 
+    # Search the best move of the last principal variation or search of this position first
+    hash_move = principal_variation_moves.get(game_state.hash)
+
+    if not hash_move and (entry := transposition_table.probe(game_state.hash)):
+        hash_move = Move.from_id(entry[3]) if entry[3] else None
+
+    if hash_move in valid_moves:
+        valid_moves.remove(hash_move)
+        valid_moves.insert(0, hash_move)
+
     for move in valid_moves:
 
         if move.is_pawn_promotion:
@@ -198,11 +377,15 @@ def negamax_ai(
         else:
             game_state.make_move(move)
 
-        next_valid_moves = game_state.get_valid_moves()
+        # Pseudo legal moves are only checked once they are made
+        if game_state.pseudo_legal and game_state.king_left_in_check(in_check):
+            game_state.undo_move()
+            continue
+
         counter += 1
 
         evaluation = -get_negamax_evaluation(
-            game_state, next_valid_moves, depth - 1, -turn_multiplier, -100000, 100000
+            game_state, depth - 1, -turn_multiplier, -100000, 100000
         )
 
         # Compare the evaluations, we do not need to call the function since we only check for max
@@ -215,68 +398,311 @@ def negamax_ai(
 
         game_state.undo_move()
 
-    print(f"Positions searched: {counter}")
-    return return_move(return_random_move(best_net_moves), max_evaluation)
+        if stop_search:
+            break
+
+    return best_net_moves, max_evaluation
+
+
+def get_principal_variation(game_state: GameState, depth: int) -> list[Move]:
+    """Returns the best moves from the position found in the transposition table"""
+
+    principal_variation = []
+
+    for _ in range(depth):
+        entry = transposition_table.probe(game_state.hash)
+
+        if not entry or not entry[3]:
+            break
+
+        move = Move.from_id(entry[3])
+
+        # A different position with the same bucket and key could have stored the move
+        if not game_state.is_legal(move):
+            break
+
+        principal_variation.append(move)
+        game_state.make_move(move, "Q" if move.is_pawn_promotion else "")
+
+    for _ in principal_variation:
+        game_state.undo_move()
+
+    return principal_variation
+
+
+def get_principal_variation_moves(
+    game_state: GameState, principal_variation: list[Move]
+) -> dict[int, Move]:
+    """Returns the hash of each position of the principal variation to its move"""
+
+    principal_variation_moves = {}
+
+    for move in principal_variation:
+        principal_variation_moves[game_state.hash] = move
+        game_state.make_move(move, "Q" if move.is_pawn_promotion else "")
+
+    for _ in principal_variation:
+        game_state.undo_move()
+
+    return principal_variation_moves
 
 
 def get_negamax_evaluation(
     game_state: GameState,
-    valid_moves: list[Move],
     depth: int,
     turn_multiplier: int,
     alpha: float,
     beta: float,
+    ply: int = 1,
+    allow_null: bool = True,
 ) -> float:
     """
     Returns the evaluation of a given position using the negamax algorithm
 
-    Alpha beta pruning used.
+    Alpha beta pruning used, the moves are generated lazily in stages so that a cutoff
+    saves generating the rest of the moves. Null move pruning is used unless allow_null is
+    False, which it is right after a null move. Positions already searched deep enough are
+    looked up in the transposition table.
     """
 
     global counter
 
+    # The result is thrown away once the search is stopped, so return as soon as possible
+    if stop_search or (counter >= next_check and check_search_limits()):
+        return 0
+
+    # Neither side can win, so there is nothing to search
+    if game_state.is_insufficient_material():
+        return 0
+
+    in_check = game_state.king_in_check()
+
+    # If a move inside the search gave check, search a ply deeper. The moves of the root are
+    # searched to the given depth whether or not they give check
+    if in_check and ply > 1:
+        depth += 1
+
     if not depth:
+        valid_moves = game_state.get_valid_moves()
+
+        # Pseudo legal moves only have to be checked until there is one legal move
+        if not game_state.has_legal_move(valid_moves):
+            valid_moves = []
+
         return turn_multiplier * get_board_evaluation(game_state, valid_moves)
 
-    # Move ordering - find moves that are better (check and captures first)
-    valid_moves = order_moves(valid_moves)
+    hash_move = None
+
+    if entry := transposition_table.probe(game_state.hash):
+        entry_depth, bound, score, move_id = entry
+
+        # The stored score can be used if it was searched as deep and is within its bound
+        if entry_depth >= depth and (
+            bound == EXACT_BOUND
+            or (bound == LOWER_BOUND and score >= beta)
+            or (bound == UPPER_BOUND and score <= alpha)
+        ):
+            return score
+
+        if move_id:
+            hash_move = Move.from_id(move_id)
+
+    # The move of the last principal variation is searched first, even if it was replaced
+    hash_move = principal_variation_moves.get(game_state.hash, hash_move)
+
+    # If passing the turn still does better than beta, a move is almost sure to as well. Not
+    # done in check, where passing is not possible, or with only pawns, where passing could
+    # be better than any move
+    if (
+        allow_null
+        and not in_check
+        and depth > NULL_MOVE_REDUCTION
+        and has_pieces(game_state)
+    ):
+        game_state.make_null_move()
+
+        evaluation = -get_negamax_evaluation(
+            game_state,
+            depth - 1 - NULL_MOVE_REDUCTION,
+            -turn_multiplier,
+            -beta,
+            -beta + 1,
+            ply + 1,
+            False,
+        )
+
+        game_state.undo_null_move()
+
+        if stop_search:
+            return 0
+
+        if evaluation >= beta:
+            return beta
 
     max_evaluation = -100000
+    moves_searched = 0
+    best_move = None
+    original_alpha = alpha
 
-    for move in valid_moves:
+    killers = killer_moves.setdefault(ply, [None, None])
+
+    for move in get_staged_moves(game_state, hash_move, killers):
         if move.is_pawn_promotion:
             game_state.make_move(move, "Q")
 
         else:
             game_state.make_move(move)
 
-        next_valid_moves = game_state.get_valid_moves()
+        # Pseudo legal moves are only checked once they are made
+        if game_state.pseudo_legal and game_state.king_left_in_check(in_check):
+            game_state.undo_move()
+            continue
+
         counter += 1
-        
-        if game_state.in_check:
-            new_depth = depth
-        
-        else:
-            new_depth = depth - 1
+        moves_searched += 1
 
         evaluation = -get_negamax_evaluation(
-            game_state, next_valid_moves, new_depth, -turn_multiplier, -beta, -alpha
+            game_state, depth - 1, -turn_multiplier, -beta, -alpha, ply + 1
         )
 
         if evaluation > max_evaluation:
             max_evaluation = evaluation
+            best_move = move
 
         game_state.undo_move()
 
+        if stop_search:
+            return 0
+
         # Pruning - as long as the eval is greater than the upper bound, we are going to choose that tree
         if max_evaluation > alpha:
             alpha = max_evaluation
 
         if alpha >= beta:
+
+            # A quiet move which causes a cutoff is likely to do so in sibling positions too
+            if (
+                not (move.piece_captured or move.is_pawn_promotion)
+                and move != killers[0]
+            ):
+                killers[1] = killers[0]
+                killers[0] = move
+
             break
+
+    # If there are no valid moves, it is either checkmate or stalemate
+    if not moves_searched:
+        game_state.in_check = in_check
+
+        return turn_multiplier * get_board_evaluation(game_state, [])
+
+    if max_evaluation <= original_alpha:
+        bound = UPPER_BOUND
+
+    elif max_evaluation >= beta:
+        bound = LOWER_BOUND
+
+    else:
+        bound = EXACT_BOUND
+
+    transposition_table.store(
+        game_state.hash, depth, bound, max_evaluation, best_move.id if best_move else 0
+    )
+
     return max_evaluation
 
 
+def has_pieces(game_state: GameState) -> bool:
+    """Returns bool of if the player to move has any pieces other than the king and pawns"""
+
+    colour = "w" if game_state.white_move else "b"
+
+    return any(game_state.piece_squares[colour + piece_type] for piece_type in "NBRQ")
+
+
+def get_staged_moves(
+    game_state: GameState, hash_move: Move = None, killers: list[Move] = ()
+) -> Iterator[Move]:
+    """
+    Yields the valid moves in the order they should be searched, in stages:
+    1) The hash move
+    2) Winning captures and promotions
+    3) Killer moves
+    4) Losing captures, then quiet moves
+
+    A stage is only generated once the previous stage has been searched, so if a move
+    causes a cutoff the quiet moves are never generated
+    """
+
+    searched = []
+
+    # The hash and killer moves come from other positions, so only check the moves of their piece
+    if hash_move and hash_move in game_state.get_piece_moves(
+        hash_move.start_row, hash_move.start_column
+    ):
+        searched.append(hash_move)
+        yield hash_move
+
+    noisy_moves = sorted(
+        game_state.get_valid_moves(NOISY_MOVES), key=get_capture_score, reverse=True
+    )
+    losing_captures = []
+
+    for move in noisy_moves:
+        if move in searched:
+            continue
+
+        # Leave captures of a cheaper piece which is defended until after the killer moves
+        if (
+            not move.is_pawn_promotion
+            and CAPTURE_VALUES[move.piece_captured[1]]
+            < CAPTURE_VALUES[move.piece_moved[1]]
+            and is_defended(game_state, move)
+        ):
+            losing_captures.append(move)
+
+        else:
+            yield move
+
+    for killer in killers:
+        if (
+            killer
+            and killer not in searched
+            and killer
+            in game_state.get_piece_moves(
+                killer.start_row, killer.start_column, QUIET_MOVES
+            )
+        ):
+            searched.append(killer)
+            yield killer
+
+    yield from losing_captures
+
+    for move in game_state.get_valid_moves(QUIET_MOVES):
+        if move not in searched:
+            yield move
+
+
+def get_capture_score(move: Move) -> int:
+    """Returns the score of a capture or promotion for ordering, most valuable victim first"""
+
+    score = (
+        10 * CAPTURE_VALUES.get(move.piece_captured[1:], 0)
+        - CAPTURE_VALUES[move.piece_moved[1]]
+    )
+
+    if move.is_pawn_promotion:
+        score += 100
+
+    return score
+
+
+def is_defended(game_state: GameState, move: Move) -> bool:
+    """Returns bool of if the piece captured by a move is defended"""
+
+    return game_state.is_attacked(move.end, move.piece_captured[0])
+
+
 def get_board_evaluation(game_state: GameState, valid_moves: list[Move]) -> float:
     """
     Returns the board evaluation, with a larger number being better for white and vice versa
@@ -294,13 +720,11 @@ def get_board_evaluation(game_state: GameState, valid_moves: list[Move]) -> floa
         else:
             return 0
 
-    if game_state.draw_log[-1].check_for_draw():
+    if game_state.check_for_draw():
         return 0
     
     # Calculates the evaluation of the position otherwise
-    peSTO_evaluation = peSTO_pst.get_board_evaluation(game_state.board)
-
-    return peSTO_evaluation
+    return game_state.get_evaluation()
 
 
 def compare_evaluations(
@@ -363,235 +787,3 @@ def order_moves(valid_moves: list[Move]) -> list[Move]:
             sort["None"].append(move)
             
     return sort["promotion"] + sort["Q"] + sort["R"] + sort["B"] + sort["N"] + sort["p"] + sort["None"]
-        
-
-class peSTO_pst:
-
-    mg_values = {"p": 82, "N": 337, "B": 365, "R": 477, "Q": 1025, "K": 0}
-
-    eg_values = {"p": 94, "N": 281, "B": 297, "R": 512, "Q": 936, "K": 0}
-
-    mg_pawn_table = [
-        [0, 0, 0, 0, 0, 0, 0, 0],
-        [98, 134, 61, 95, 68, 126, 34, -11],
-        [-6, 7, 26, 31, 65, 56, 25, -20],
-        [-14, 13, 6, 21, 23, 12, 17, -23],
-        [-27, -2, -5, 18, 18, 6, 10, -25],
-        [-26, -4, -4, -10, 3, 3, 33, -12],
-        [-35, -1, -20, -23, -15, 24, 38, -22],
-        [0, 0, 0, 0, 0, 0, 0, 0],
-    ]
-
-    eg_pawn_table = [
-        [0, 0, 0, 0, 0, 0, 0, 0],
-        [178, 173, 158, 134, 147, 132, 165, 187],
-        [94, 100, 85, 67, 56, 53, 82, 84],
-        [32, 24, 13, 5, -2, 4, 17, 17],
-        [13, 9, -3, -7, -7, -8, 3, -1],
-        [4, 7, -6, 1, 0, -5, -1, -8],
-        [13, 8, 8, 10, 13, 0, 2, -7],
-        [0, 0, 0, 0, 0, 0, 0, 0],
-    ]
-
-    mg_knight_table = [
-        [-167, -89, -34, -49, 61, -97, -15, -107],
-        [-73, -41, 72, 36, 23, 62, 7, -17],
-        [-47, 60, 37, 65, 84, 129, 73, 44],
-        [-9, 17, 19, 53, 37, 69, 18, 22],
-        [-13, 4, 16, 13, 28, 19, 21, -8],
-        [-23, -9, 12, 10, 19, 17, 25, -16],
-        [-29, -53, -12, -3, -1, 18, -14, -19],
-        [-105, -21, -58, -33, -17, -28, -19, -23],
-    ]
-
-    eg_knight_table = [
-        [-58, -38, -13, -28, -31, -27, -63, -99],
-        [-25, -8, -25, -2, -9, -25, -24, -52],
-        [-24, -20, 10, 9, -1, -9, -19, -41],
-        [-17, 3, 22, 22, 22, 11, 8, -18],
-        [-18, -6, 16, 25, 16, 17, 4, -18],
-        [-23, -3, -1, 15, 10, -3, -20, -22],
-        [-42, -20, -10, -5, -2, -20, -23, -44],
-        [-29, -51, -23, -15, -22, -18, -50, -64],
-    ]
-
-    mg_bishop_table = [
-        [-29, 4, -82, -37, -25, -42, 7, -8],
-        [-26, 16, -18, -13, 30, 59, 18, -47],
-        [-16, 37, 43, 40, 35, 50, 37, -2],
-        [-4, 5, 19, 50, 37, 37, 7, -2],
-        [-6, 13, 13, 26, 34, 12, 10, 4],
-        [0, 15, 15, 15, 14, 27, 18, 10],
-        [4, 15, 16, 0, 7, 21, 33, 1],
-        [-33, -3, -14, -21, -13, -12, -39, -21],
-    ]
-
-    eg_bishop_table = [
-        [-8, -4, 7, -12, -3, -13, -4, -14],
-        [-14, -21, -11, -8, -7, -9, -17, -24],
-        [2, -8, 0, -1, -2, 6, 0, 4],
-        [-3, 9, 12, 9, 14, 10, 3, 2],
-        [-6, 3, 13, 19, 7, 10, -3, -9],
-        [-12, -3, 8, 10, 13, 3, -7, -15],
-        [-14, -18, -7, -1, 4, -9, -15, -27],
-        [-23, -9, -23, -5, -9, -16, -5, -17],
-    ]
-
-    mg_rook_table = [
-        [32, 42, 32, 51, 63, 9, 31, 43],
-        [27, 32, 58, 62, 80, 67, 26, 44],
-        [-5, 19, 26, 36, 17, 45, 61, 16],
-        [-24, -11, 7, 26, 24, 35, -8, -20],
-        [-36, -26, -12, -1, 9, -7, 6, -23],
-        [-45, -25, -16, -17, 3, 0, -5, -33],
-        [-44, -16, -20, -9, -1, 11, -6, -71],
-        [-19, -13, 1, 17, 16, 7, -37, -26],
-    ]
-
-    eg_rook_table = [
-        [13, 10, 18, 15, 12, 12, 8, 5],
-        [11, 13, 13, 11, -3, 3, 8, 3],
-        [7, 7, 7, 5, 4, -3, -5, -3],
-        [4, 3, 13, 1, 2, 1, -1, 2],
-        [3, 5, 8, 4, -5, -6, -8, -11],
-        [-4, 0, -5, -1, -7, -12, -8, -16],
-        [-6, -6, 0, 2, -9, -9, -11, -3],
-        [-9, 2, 3, -1, -5, -13, 4, -20],
-    ]
-
-    mg_queen_table = [
-        [-28, 0, 29, 12, 59, 44, 43, 45],
-        [-24, -39, -5, 1, -16, 57, 28, 54],
-        [-13, -17, 7, 8, 29, 56, 47, 57],
-        [-27, -27, -16, -16, -1, 17, -2, 1],
-        [-9, -26, -9, -10, -2, -4, 3, -3],
-        [-14, 2, -11, -2, -5, 2, 14, 5],
-        [-35, -8, 11, 2, 8, 15, -3, 1],
-        [-1, -18, -9, 10, -15, -25, -31, -50],
-    ]
-
-    eg_queen_table = [
-        [-9, 22, 22, 27, 27, 19, 10, 20],
-        [-17, 20, 32, 41, 58, 25, 30, 0],
-        [-20, 6, 9, 49, 47, 35, 19, 9],
-        [3, 22, 24, 45, 57, 40, 57, 36],
-        [-18, 28, 19, 47, 31, 34, 39, 23],
-        [-16, -27, 15, 6, 9, 17, 10, 5],
-        [-22, -23, -30, -16, -16, -23, -36, -32],
-        [-33, -28, -22, -43, -5, -32, -20, -41],
-    ]
-
-    mg_king_table = [
-        [-65, 23, 16, -15, -56, -34, 2, 13],
-        [29, -1, -20, -7, -8, -4, -38, -29],
-        [-9, 24, 2, -16, -20, 6, 22, -22],
-        [-17, -20, -12, -27, -30, -25, -14, -36],
-        [-49, -1, -27, -39, -46, -44, -33, -51],
-        [-14, -14, -22, -46, -44, -30, -15, -27],
-        [1, 7, -8, -64, -43, -16, 9, 8],
-        [-15, 36, 12, -54, 8, -28, 24, 14],
-    ]
-
-    eg_king_table = [
-        [-74, -35, -18, -18, -11, 15, 4, -17],
-        [-12, 17, 14, 17, 17, 38, 23, 11],
-        [10, 17, 23, 15, 20, 45, 44, 13],
-        [-8, 22, 24, 27, 26, 33, 26, 3],
-        [-18, -4, 21, 24, 27, 23, 9, -11],
-        [-19, -3, 11, 21, 23, 16, 7, -9],
-        [-27, -11, 4, 13, 14, 4, -5, -17],
-        [-53, -34, -21, -11, -28, -14, -24, -43],
-    ]
-
-    mg_tables = {
-        "p": mg_pawn_table,
-        "N": mg_knight_table,
-        "B": mg_bishop_table,
-        "R": mg_rook_table,
-        "Q": mg_queen_table,
-        "K": mg_king_table,
-    }
-
-    eg_tables = {
-        "p": eg_pawn_table,
-        "N": eg_knight_table,
-        "B": eg_bishop_table,
-        "R": eg_rook_table,
-        "Q": eg_queen_table,
-        "K": eg_king_table,
-    }
-
-    game_phase_indicator = {"p": 0, "N": 1, "B": 1, "R": 2, "Q": 4, "K": 0}
-
-    def __init__(self) -> None:
-        pass
-
-    @classmethod
-    def get_square_evaluation(
-        cls, square: tuple, colour: str, piece_type: str
-    ) -> tuple[int, int]:
-        """
-        Returns the evaluation of a specific piece on a specific square
-
-        Returns a tuple of [middle game eval, end game eval]
-        """
-
-        row, column = square
-
-        # If it is a black piece, we need to swap the square and column to be from their perspective
-        if colour == "b":
-            row = 7 - row
-
-        # Calculate middle game and endgame score
-        mg_score = cls.mg_tables[piece_type][row][column] + cls.mg_values[piece_type]
-        eg_score = cls.eg_tables[piece_type][row][column] + cls.eg_values[piece_type]
-
-        return mg_score, eg_score
-
-    @classmethod
-    def get_board_evaluation(cls, board: list[list[str]]) -> float:
-        """
-        Returns the evaluation of the entire board
-
-        A larger number means that its better for white and vice versa
-        """
-
-        # To keep track of which phase it is
-        mg_phase = 0
-
-        # To keep track of both side's scores
-        white_mg_score = white_eg_score = 0
-        black_mg_score = black_eg_score = 0
-
-        for row in range(8):
-            for column in range(8):
-
-                # If there is a piece on the square
-                if piece := board[row][column]:
-
-                    colour, piece_type = piece
-                    mg_phase += cls.game_phase_indicator[piece_type]
-
-                    # Get the tuple of scores of the piece
-                    mg_score, eg_score = cls.get_square_evaluation(
-                        (row, column), colour, piece_type
-                    )
-
-                    # Adds the scores to the respective counters
-                    if colour == "w":
-                        white_mg_score += mg_score
-                        white_eg_score += eg_score
-
-                    else:
-                        black_mg_score += mg_score
-                        black_eg_score += eg_score
-
-        if mg_phase > 24:
-            mg_phase = 24
-
-        eg_phase = 24 - mg_phase
-
-        mg_score = white_mg_score - black_mg_score
-        eg_score = white_eg_score - black_eg_score
-
-        return (mg_score * mg_phase + eg_score * eg_phase) / 24
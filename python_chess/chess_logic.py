@@ -1,4 +1,220 @@
-import copy
+import random
+from .pesto import EG_SCORES, GAME_PHASES, MG_SCORES, peSTO_pst
+
+
+# Directions in (row, column), the first 4 are diagonals and the last 4 are straight lines
+DIRECTIONS = (
+    (-1, -1),
+    (-1, 1),
+    (1, -1),
+    (1, 1),
+    (-1, 0),
+    (0, -1),
+    (1, 0),
+    (0, 1),
+)
+
+# All the moves that a knight can make from its position
+KNIGHT_OFFSETS = (
+    (-2, -1),
+    (-2, 1),
+    (-1, -2),
+    (-1, 2),
+    (1, -2),
+    (1, 2),
+    (2, -1),
+    (2, 1),
+)
+
+# All the moves that a king can make from its position
+KING_OFFSETS = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, 0),
+    (1, -1),
+    (1, 1),
+)
+
+
+def get_jump_table(offsets: tuple) -> list[list[tuple]]:
+    """
+    Returns a table of the squares that a piece which jumps by the offsets can reach
+    from each square, indexed by [row][column]
+    """
+
+    return [
+        [
+            tuple(
+                (row + row_offset, column + column_offset)
+                for row_offset, column_offset in offsets
+                if 0 <= row + row_offset < 8 and 0 <= column + column_offset < 8
+            )
+            for column in range(8)
+        ]
+        for row in range(8)
+    ]
+
+
+def get_ray_table() -> list[list[tuple]]:
+    """
+    Returns a table of the squares in each of the directions from each square, indexed by
+    [row][column][direction], with the squares in order of distance from the square
+    """
+
+    return [
+        [
+            tuple(
+                tuple(
+                    (row + row_offset * i, column + column_offset * i)
+                    for i in range(1, 8)
+                    if 0 <= row + row_offset * i < 8
+                    and 0 <= column + column_offset * i < 8
+                )
+                for row_offset, column_offset in DIRECTIONS
+            )
+            for column in range(8)
+        ]
+        for row in range(8)
+    ]
+
+
+# Tables of the squares each piece can reach, built once so that the move generators
+# don't have to check if each square is in the board
+KNIGHT_SQUARES = get_jump_table(KNIGHT_OFFSETS)
+KING_SQUARES = get_jump_table(KING_OFFSETS)
+RAY_SQUARES = get_ray_table()
+
+# Which moves the move generators produce, noisy moves being captures and promotions
+ALL_MOVES = 0
+NOISY_MOVES = 1
+QUIET_MOVES = 2
+
+
+def get_zobrist_keys(seed: int = 0) -> tuple:
+    """
+    Returns the random keys which are XORed together to give the hash of a position: a key
+    for each piece on each square, for black to move, for each set of castling rights and
+    for each column of an en passant square. The keys are seeded, so hashes are the same
+    every run
+    """
+
+    generator = random.Random(seed)
+
+    piece_keys = {
+        colour + piece_type: [generator.getrandbits(64) for _ in range(64)]
+        for colour in "wb"
+        for piece_type in "pNBRQK"
+    }
+    black_move_key = generator.getrandbits(64)
+
+    # One key for each of the 4 castling rights, combined for every set of the rights
+    castle_keys = [generator.getrandbits(64) for _ in range(4)]
+    castle_rights_keys = [0] * 16
+
+    for castle_mask in range(16):
+        for i in range(4):
+            if castle_mask & 1 << i:
+                castle_rights_keys[castle_mask] ^= castle_keys[i]
+
+    en_passant_keys = [generator.getrandbits(64) for _ in range(8)]
+
+    return piece_keys, black_move_key, castle_rights_keys, en_passant_keys
+
+
+(
+    ZOBRIST_PIECES,
+    ZOBRIST_BLACK_MOVE,
+    ZOBRIST_CASTLE_RIGHTS,
+    ZOBRIST_EN_PASSANT,
+) = get_zobrist_keys()
+
+# Castling rights are kept as 4 bits, one for each side of each colour
+WHITE_KING_SIDE = 1
+BLACK_KING_SIDE = 2
+WHITE_QUEEN_SIDE = 4
+BLACK_QUEEN_SIDE = 8
+ALL_CASTLE_RIGHTS = 15
+
+
+def get_castle_rights_kept() -> list[int]:
+    """
+    Returns a table of the castling rights which are kept after a move from or to each
+    square, as the rights are lost once the king or rook moves or the rook is captured
+    """
+
+    castle_rights_kept = [ALL_CASTLE_RIGHTS] * 64
+
+    for square, castle_rights in (
+        (60, WHITE_KING_SIDE | WHITE_QUEEN_SIDE),
+        (63, WHITE_KING_SIDE),
+        (56, WHITE_QUEEN_SIDE),
+        (4, BLACK_KING_SIDE | BLACK_QUEEN_SIDE),
+        (7, BLACK_KING_SIDE),
+        (0, BLACK_QUEEN_SIDE),
+    ):
+        castle_rights_kept[square] &= ~castle_rights
+
+    return castle_rights_kept
+
+
+CASTLE_RIGHTS_KEPT = get_castle_rights_kept()
+
+# The king and rook each castling right needs on their starting squares
+CASTLE_RIGHT_PIECES = {
+    WHITE_KING_SIDE: (("wK", (7, 4)), ("wR", (7, 7))),
+    WHITE_QUEEN_SIDE: (("wK", (7, 4)), ("wR", (7, 0))),
+    BLACK_KING_SIDE: (("bK", (0, 4)), ("bR", (0, 7))),
+    BLACK_QUEEN_SIDE: (("bK", (0, 4)), ("bR", (0, 0))),
+}
+
+# Each undo record is an int of what a move can't give back: the castling rights in the first
+# 4 bits, then the en passant column plus 1 (0 for none), the halfmove clock and the hash
+UNDO_EN_PASSANT_SHIFT = 4
+UNDO_HALFMOVE_SHIFT = 8
+UNDO_HASH_SHIFT = 24
+UNDO_STACK_SIZE = 256
+
+# The pieces of each letter in a FEN, white's pieces being upper case
+FEN_PIECES = {
+    "P": "wp",
+    "N": "wN",
+    "B": "wB",
+    "R": "wR",
+    "Q": "wQ",
+    "K": "wK",
+    "p": "bp",
+    "n": "bN",
+    "b": "bB",
+    "r": "bR",
+    "q": "bQ",
+    "k": "bK",
+}
+PIECE_LETTERS = {piece: letter for letter, piece in FEN_PIECES.items()}
+
+# The castling right of each letter in a FEN, in the order they are written
+FEN_CASTLE_RIGHTS = {
+    "K": WHITE_KING_SIDE,
+    "Q": WHITE_QUEEN_SIDE,
+    "k": BLACK_KING_SIDE,
+    "q": BLACK_QUEEN_SIDE,
+}
+
+STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# The material signature of a position counts each piece other than the kings in 4 bits, so
+# adding a piece's key adds one to its count
+MATERIAL_KEYS = {
+    piece: 0 if piece[1] == "K" else 1 << 4 * i for i, piece in enumerate(PIECE_LETTERS)
+}
+
+# The signatures where neither side can checkmate: king against king, and king and a single
+# bishop or knight against king
+INSUFFICIENT_MATERIAL = frozenset(
+    [0] + [MATERIAL_KEYS[piece] for piece in ("wN", "wB", "bN", "bB")]
+)
 
 
 class GameState:
@@ -17,7 +233,12 @@ class GameState:
         "K": 10000,
     }
 
-    def __init__(self) -> None:
+    def __init__(self, pseudo_legal: bool = False) -> None:
+        """
+        Args:
+            pseudo_legal (bool): whether get_valid_moves skips the pin and check analysis, so that
+                the moves have to be checked with king_left_in_check once they are made
+        """
 
         # Generates a list of list which represents the initial board state
         self.board = [
@@ -37,6 +258,9 @@ class GameState:
         # List to keep track of moves made
         self.move_log = []
 
+        # The number of moves made before the move log, for the move number of a FEN
+        self.start_ply = 0
+
         # Dimensions of a board
         self.dimensions = 8
 
@@ -44,23 +268,431 @@ class GameState:
         self.white_king_location = (7, 4)
         self.black_king_location = (0, 4)
 
+        # Whether the moves generated may leave the king in check
+        self.pseudo_legal = pseudo_legal
+
         # Other useful states to hold in memory
         self.in_check = False
-        self.pins = []
+        self.pins = {}
         self.checks = []
 
         # Keep track of coordinate of square where en passant is possible
         self.en_passant_square = ()
 
-        # Keep track of castling rights
-        self.current_castle_rights = CastleRights(True, True, True, True)
-        self.castle_rights_log = [self.current_castle_rights.copy()]
+        # Keep track of castling rights, as bits of WHITE_KING_SIDE and so on
+        self.castle_rights = ALL_CASTLE_RIGHTS
 
         # Keep track of both side's materials, both sides start off with 39 points of material
         self.white_material = self.black_material = 39
+
+        # Keep track of the squares of every piece, so that the board doesn't have to be scanned
+        self.piece_squares = self.get_piece_squares()
         
-        # Keeps track of the draw status of the board
-        self.draw_log = [DrawChecker(self.board, 0)]
+        # The PeSTO mid game and end game scores, the game phase and the material signature,
+        # kept up to date by make_move and undo_move. If debug_evaluation is set,
+        # get_evaluation checks the scores against an evaluation of the whole board
+        self.set_evaluation()
+        self.debug_evaluation = False
+
+        # The number of moves since the last capture or pawn move, for the 50 move rule
+        self.halfmove_clock = 0
+
+        # The Zobrist hash of the position, kept up to date by make_move and undo_move
+        self.hash = self.get_hash()
+
+        # The undo record of each move in the move log, which also holds the hashes of the
+        # positions before each move to find repetitions. The stack grows for longer games
+        self.undo_stack = [0] * UNDO_STACK_SIZE
+
+        # The legal moves of the current position, built when they are looked up
+        self.move_index = None
+
+    @classmethod
+    def from_fen(cls, fen: str, **kwargs) -> "GameState":
+        """
+        Returns a game state of the position of a FEN, the keyword arguments being passed on
+        to the class. To load many positions, set_fen can be called on one game state instead
+
+        Args:
+            fen (str): the FEN of the position, the move clocks can be left out
+
+        Returns:
+            GameState: the game state of the position
+        """
+
+        game_state = cls(**kwargs)
+        game_state.set_fen(fen)
+
+        return game_state
+
+    def set_fen(self, fen: str) -> None:
+        """
+        Sets the position to the one of a FEN, clearing the move log
+
+        Args:
+            fen (str): the FEN of the position, the move clocks can be left out
+        """
+
+        fields = fen.split()
+
+        if len(fields) == 4:
+            fields += ("0", "1")
+
+        if len(fields) != 6:
+            raise ValueError(f"Incorrect number of fields in FEN: {fen}")
+
+        placement, turn, castling, en_passant, halfmove_clock, fullmove_number = fields
+        rows = placement.split("/")
+
+        if len(rows) != 8 or turn not in ("w", "b"):
+            raise ValueError(f"Incorrect FEN: {fen}")
+
+        board = []
+
+        for fen_row in rows:
+            board_row = []
+
+            for letter in fen_row:
+                if letter.isdigit():
+                    board_row += [""] * int(letter)
+
+                elif letter in FEN_PIECES:
+                    board_row.append(FEN_PIECES[letter])
+
+                else:
+                    raise ValueError(f"Incorrect FEN: {fen}")
+
+            if len(board_row) != 8:
+                raise ValueError(f"Incorrect FEN: {fen}")
+
+            board.append(board_row)
+
+        castle_rights = 0
+
+        if castling != "-":
+            for letter in castling:
+                if letter not in FEN_CASTLE_RIGHTS:
+                    raise ValueError(f"Incorrect FEN: {fen}")
+
+                castle_rights |= FEN_CASTLE_RIGHTS[letter]
+
+        if en_passant != "-":
+            if (
+                len(en_passant) != 2
+                or en_passant[0] not in "abcdefgh"
+                or en_passant[1] not in "12345678"
+            ):
+                raise ValueError(f"Incorrect FEN: {fen}")
+
+            en_passant_square = (
+                8 - int(en_passant[1]),
+                "abcdefgh".index(en_passant[0]),
+            )
+
+        else:
+            en_passant_square = ()
+
+        self.set_position(
+            board,
+            turn == "w",
+            castle_rights,
+            en_passant_square,
+            int(halfmove_clock),
+            int(fullmove_number),
+        )
+
+    def set_position(
+        self,
+        board: list[list[str]],
+        white_move: bool,
+        castle_rights: int,
+        en_passant_square: tuple = (),
+        halfmove_clock: int = 0,
+        fullmove_number: int = 1,
+    ) -> None:
+        """
+        Sets the position, clearing the move log. The king locations, piece squares, material,
+        evaluation and hash are all set in one pass over the board. Raises ValueError if either
+        colour does not have exactly one king, a castling right doesn't have its king and rook
+        on their starting squares, or the en passant square is not on the row behind a pawn
+        which could have just moved two squares
+
+        Args:
+            board (list[list[str]]): the board, which is kept rather than copied
+            white_move (bool): whether it is white to move
+            castle_rights (int): the castling rights, as bits of WHITE_KING_SIDE and so on
+            en_passant_square (tuple): the square where en passant is possible, if any
+            halfmove_clock (int): the number of moves since the last capture or pawn move
+            fullmove_number (int): the move number, starting at 1
+        """
+
+        piece_squares = {piece: set() for piece in PIECE_LETTERS}
+        material = {"w": 0, "b": 0}
+        mg_score = eg_score = game_phase = material_signature = position_hash = 0
+
+        for square, (row, column) in enumerate(SQUARES):
+            if not (piece := board[row][column]):
+                continue
+
+            piece_squares[piece].add(SQUARES[square])
+            mg_score += MG_SCORES[piece][square]
+            eg_score += EG_SCORES[piece][square]
+            game_phase += GAME_PHASES[piece]
+            material_signature += MATERIAL_KEYS[piece]
+            position_hash ^= ZOBRIST_PIECES[piece][square]
+
+            if piece[1] != "K":
+                material[piece[0]] += self.values[piece[1]]
+
+        # Nothing is changed unless the position is valid
+        if len(piece_squares["wK"]) != 1 or len(piece_squares["bK"]) != 1:
+            raise ValueError("Each colour has to have exactly one king")
+
+        if not 0 <= castle_rights <= ALL_CASTLE_RIGHTS:
+            raise ValueError(f"Incorrect castling rights: {castle_rights}")
+
+        for castle_right, pieces in CASTLE_RIGHT_PIECES.items():
+            if castle_rights & castle_right and any(
+                board[row][column] != piece for piece, (row, column) in pieces
+            ):
+                raise ValueError(
+                    "A castling right needs its king and rook on their starting squares"
+                )
+
+        # The square a pawn of the other colour has just passed over
+        if en_passant_square and (
+            en_passant_square[0] != (2 if white_move else 5)
+            or not 0 <= en_passant_square[1] < 8
+        ):
+            raise ValueError(f"Incorrect en passant square: {en_passant_square}")
+
+        (self.white_king_location,) = piece_squares["wK"]
+        (self.black_king_location,) = piece_squares["bK"]
+
+        self.board = board
+        self.white_move = white_move
+        self.castle_rights = castle_rights
+        self.en_passant_square = en_passant_square
+        self.halfmove_clock = halfmove_clock
+        self.start_ply = (fullmove_number - 1) * 2 + (not white_move)
+
+        self.piece_squares = piece_squares
+        self.white_material, self.black_material = material["w"], material["b"]
+        self.mg_score, self.eg_score, self.game_phase = mg_score, eg_score, game_phase
+        self.material_signature = material_signature
+
+        position_hash ^= ZOBRIST_CASTLE_RIGHTS[castle_rights]
+
+        if not white_move:
+            position_hash ^= ZOBRIST_BLACK_MOVE
+
+        if en_passant_square:
+            position_hash ^= ZOBRIST_EN_PASSANT[en_passant_square[1]]
+
+        self.hash = position_hash
+
+        # Nothing from the position before is kept
+        self.move_log = []
+        self.move_index = None
+        self.in_check = False
+        self.pins = {}
+        self.checks = []
+
+    def to_fen(self) -> str:
+        """Returns the FEN of the current position"""
+
+        fen_rows = []
+
+        for board_row in self.board:
+            fen_row = ""
+            empty_squares = 0
+
+            for piece in board_row:
+                if not piece:
+                    empty_squares += 1
+                    continue
+
+                if empty_squares:
+                    fen_row += str(empty_squares)
+                    empty_squares = 0
+
+                fen_row += PIECE_LETTERS[piece]
+
+            if empty_squares:
+                fen_row += str(empty_squares)
+
+            fen_rows.append(fen_row)
+
+        castling = "".join(
+            letter
+            for letter, castle_right in FEN_CASTLE_RIGHTS.items()
+            if self.castle_rights & castle_right
+        )
+
+        if self.en_passant_square:
+            row, column = self.en_passant_square
+            en_passant = "abcdefgh"[column] + str(8 - row)
+
+        else:
+            en_passant = "-"
+
+        fullmove_number = (self.start_ply + len(self.move_log)) // 2 + 1
+
+        return " ".join(
+            (
+                "/".join(fen_rows),
+                "w" if self.white_move else "b",
+                castling or "-",
+                en_passant,
+                str(self.halfmove_clock),
+                str(fullmove_number),
+            )
+        )
+
+    def clone(self) -> "GameState":
+        """
+        Returns a copy of the game state which can be changed without changing this one. Only
+        the lists, dicts and sets which are changed in place are copied, everything else is
+        immutable and shared
+        """
+
+        game_state = object.__new__(type(self))
+        game_state.__dict__.update(self.__dict__)
+
+        game_state.board = [row[:] for row in self.board]
+        game_state.move_log = self.move_log[:]
+        game_state.undo_stack = self.undo_stack[:]
+        game_state.piece_squares = {
+            piece: squares.copy() for piece, squares in self.piece_squares.items()
+        }
+        game_state.pins = self.pins.copy()
+        game_state.checks = self.checks[:]
+        game_state.move_index = None
+
+        return game_state
+
+    def get_piece_squares(self) -> dict[str, set]:
+        """Returns a dict of every piece to the set of squares it is on, by scanning the board"""
+
+        piece_squares = {
+            colour + piece_type: set() for colour in "wb" for piece_type in "pNBRQK"
+        }
+
+        for row in range(self.dimensions):
+            for column in range(self.dimensions):
+                if piece := self.board[row][column]:
+                    piece_squares[piece].add((row, column))
+
+        return piece_squares
+
+    def get_hash(self) -> int:
+        """
+        Returns the Zobrist hash of the position by going through the whole board, which
+        covers the pieces, the side to move, the castling rights and the en passant square
+        """
+
+        position_hash = ZOBRIST_CASTLE_RIGHTS[self.castle_rights]
+
+        for piece, squares in self.piece_squares.items():
+            for row, column in squares:
+                position_hash ^= ZOBRIST_PIECES[piece][row * 8 + column]
+
+        if not self.white_move:
+            position_hash ^= ZOBRIST_BLACK_MOVE
+
+        if self.en_passant_square:
+            position_hash ^= ZOBRIST_EN_PASSANT[self.en_passant_square[1]]
+
+        return position_hash
+
+    def set_evaluation(self) -> None:
+        """
+        Sets the mid game and end game scores, the game phase and the material signature from
+        the piece squares
+        """
+
+        self.mg_score = self.eg_score = self.game_phase = self.material_signature = 0
+
+        for piece, squares in self.piece_squares.items():
+            for row, column in squares:
+                self.mg_score += MG_SCORES[piece][row * 8 + column]
+                self.eg_score += EG_SCORES[piece][row * 8 + column]
+                self.game_phase += GAME_PHASES[piece]
+                self.material_signature += MATERIAL_KEYS[piece]
+
+    def update_evaluation(self, move_id: int, sign: int) -> None:
+        """
+        Adds the change in the scores, game phase and material signature made by a move, or
+        takes it away if the sign is -1. The piece the move leaves on its end square has to be
+        on the board
+
+        Args:
+            move_id (int): the id of the move
+            sign (int): 1 after making the move, -1 before undoing it
+        """
+
+        start_square = move_id & 63
+        end_square = move_id >> END_SHIFT & 63
+        piece_moved = INDEX_PIECES[move_id >> PIECE_MOVED_SHIFT & 15]
+        piece_placed = self.board[end_square >> 3][end_square & 7]
+
+        mg_change = (
+            MG_SCORES[piece_placed][end_square] - MG_SCORES[piece_moved][start_square]
+        )
+        eg_change = (
+            EG_SCORES[piece_placed][end_square] - EG_SCORES[piece_moved][start_square]
+        )
+        phase_change = material_change = 0
+
+        if piece_captured := INDEX_PIECES[move_id >> PIECE_CAPTURED_SHIFT & 15]:
+
+            # A pawn captured en passant is on the start row and the end column
+            if move_id & EN_PASSANT_FLAG:
+                captured_square = start_square & 56 | end_square & 7
+
+            else:
+                captured_square = end_square
+
+            mg_change -= MG_SCORES[piece_captured][captured_square]
+            eg_change -= EG_SCORES[piece_captured][captured_square]
+            phase_change -= GAME_PHASES[piece_captured]
+            material_change -= MATERIAL_KEYS[piece_captured]
+
+        if move_id & PROMOTION_FLAG:
+            phase_change += GAME_PHASES[piece_placed]
+            material_change += MATERIAL_KEYS[piece_placed] - MATERIAL_KEYS[piece_moved]
+
+        if move_id & CASTLE_FLAG:
+            rook = piece_moved[0] + "R"
+
+            if end_square & 7 == 6:
+                rook_start, rook_end = end_square + 1, end_square - 1
+
+            else:
+                rook_start, rook_end = end_square - 2, end_square + 1
+
+            mg_change += MG_SCORES[rook][rook_end] - MG_SCORES[rook][rook_start]
+            eg_change += EG_SCORES[rook][rook_end] - EG_SCORES[rook][rook_start]
+
+        self.mg_score += sign * mg_change
+        self.eg_score += sign * eg_change
+        self.game_phase += sign * phase_change
+        self.material_signature += sign * material_change
+
+    def get_evaluation(self) -> float:
+        """
+        Returns the tapered PeSTO evaluation of the position from the running scores, a larger
+        number being better for white and vice versa
+        """
+
+        # The phase can go over 24 with promotions
+        mg_phase = min(self.game_phase, 24)
+        evaluation = (self.mg_score * mg_phase + self.eg_score * (24 - mg_phase)) / 24
+
+        if self.debug_evaluation:
+            assert evaluation == peSTO_pst.get_board_evaluation(self.piece_squares)
+
+        return evaluation
 
     def make_move(self, move, promotion_type: str = "") -> None:
         """
@@ -68,30 +700,74 @@ class GameState:
 
         Args:
             move (Move): A Move class of the move to be made
+            promotion_type (str): the piece type promoted to, "Q", "R", "B" or "N"
         """
 
+        # Checked before anything is changed, so that a bad type can't leave the board half updated
+        if promotion_type:
+            promotion_type = promotion_type.upper()
+
+            if promotion_type not in PROMOTION_INDICES:
+                raise ValueError(f"Incorrect promotion type: {promotion_type}")
+
+        # Unpack the move once rather than going through its properties
+        move_id = move.id
+        start_row, start_column = start = SQUARES[move_id & 63]
+        end_row, end_column = end = SQUARES[move_id >> END_SHIFT & 63]
+        piece_moved = INDEX_PIECES[move_id >> PIECE_MOVED_SHIFT & 15]
+        piece_captured = INDEX_PIECES[move_id >> PIECE_CAPTURED_SHIFT & 15]
+
+        start_square = move_id & 63
+        end_square = move_id >> END_SHIFT & 63
+
+        # Save what the move can't give back to the undo stack, at the index of the move
+        ply = len(self.move_log)
+
+        if ply == len(self.undo_stack):
+            self.undo_stack.extend([0] * ply)
+
+        en_passant_column = (
+            self.en_passant_square[1] + 1 if self.en_passant_square else 0
+        )
+        self.undo_stack[ply] = (
+            self.hash << UNDO_HASH_SHIFT
+            | self.halfmove_clock << UNDO_HALFMOVE_SHIFT
+            | en_passant_column << UNDO_EN_PASSANT_SHIFT
+            | self.castle_rights
+        )
+
         # Keep track of if the 50 move rule has been reset
         fifty_move_rule_reset = False
-        
+
         # Update location of pieces
-        self.board[move.start_row][move.start_column] = ""
-        self.board[move.end_row][move.end_column] = move.piece_moved
+        self.board[start_row][start_column] = ""
+        self.board[end_row][end_column] = piece_moved
+
+        piece_squares = self.piece_squares
+        piece_squares[piece_moved].discard(start)
 
         self.move_log.append(move)
+        self.move_index = None
 
-        if move.piece_moved == "wK":
-            self.white_king_location = (move.end_row, move.end_column)
+        if piece_moved == "wK":
+            self.white_king_location = end
 
-        elif move.piece_moved == "bK":
-            self.black_king_location = (move.end_row, move.end_column)
+        elif piece_moved == "bK":
+            self.black_king_location = end
 
         # If a piece was captured
-        if move.piece_captured:
+        if piece_captured:
             
             fifty_move_rule_reset = True
 
+            if move_id & EN_PASSANT_FLAG:
+                piece_squares[piece_captured].discard((start_row, end_column))
+
+            else:
+                piece_squares[piece_captured].discard(end)
+
             # Get the value of the piece and subtract it from the player
-            value = self.values[move.piece_captured[1]]
+            value = self.values[piece_captured[1]]
 
             if self.white_move:
                 self.black_material -= value
@@ -99,15 +775,19 @@ class GameState:
             else:
                 self.white_material -= value
 
-        if move.piece_moved[1] == "p":
+        if piece_moved[1] == "p":
             fifty_move_rule_reset = True
 
         # If it is a pawn promotion
-        if move.is_pawn_promotion:
-            self.board[move.end_row][move.end_column] = (
-                move.piece_moved[0] + promotion_type
+        if move_id & PROMOTION_FLAG:
+            # If no promotion type is given, use the one stored in the move
+            promotion_type = (
+                promotion_type or INDEX_PROMOTIONS[move_id >> PROMOTION_SHIFT & 7]
             )
 
+            self.board[end_row][end_column] = piece_moved[0] + promotion_type
+            piece_squares[piece_moved[0] + promotion_type].add(end)
+
             # Update the material count
             # TODO: Update to ensure that other possible promotion types are accounted for
             if self.white_move:
@@ -117,56 +797,89 @@ class GameState:
                 self.black_material += 8
 
         # En passant
-        elif move.is_en_passant:
+        elif move_id & EN_PASSANT_FLAG:
+            piece_squares[piece_moved].add(end)
 
             # Capture the pawn
-            self.board[move.start_row][move.end_column] = ""
+            self.board[start_row][end_column] = ""
+
+        else:
+            piece_squares[piece_moved].add(end)
 
         # Check and update for squares where en passant is possible
-        if move.piece_moved[1] == "p" and abs(move.start_row - move.end_row) == 2:
+        if piece_moved[1] == "p" and abs(start_row - end_row) == 2:
 
-            self.en_passant_square = (
-                (move.start_row + move.end_row) // 2,
-                move.end_column,
-            )
+            self.en_passant_square = SQUARES[(start_square + end_square) // 2]
 
         # Else make sure no en passant is possible
         else:
             self.en_passant_square = ()
 
         # If it is a king side castle, moves rook to new square
-        if move.king_side_castle:
-            self.board[move.end_row][move.end_column - 1] = self.board[move.end_row][
-                move.end_column + 1
-            ]
-            self.board[move.end_row][move.end_column + 1] = ""
+        if move_id & CASTLE_FLAG and end_column == 6:
+            self.board[end_row][end_column - 1] = self.board[end_row][end_column + 1]
+            self.board[end_row][end_column + 1] = ""
+
+            rook_squares = piece_squares[piece_moved[0] + "R"]
+            rook_squares.discard((end_row, end_column + 1))
+            rook_squares.add((end_row, end_column - 1))
 
         # Else it is a queen side castle, do the same except for the queen side
-        elif move.queen_side_castle:
-            self.board[move.end_row][move.end_column + 1] = self.board[move.end_row][
-                move.end_column - 2
-            ]
-            self.board[move.end_row][move.end_column - 2] = ""
+        elif move_id & CASTLE_FLAG and end_column == 2:
+            self.board[end_row][end_column + 1] = self.board[end_row][end_column - 2]
+            self.board[end_row][end_column - 2] = ""
+
+            rook_squares = piece_squares[piece_moved[0] + "R"]
+            rook_squares.discard((end_row, end_column - 2))
+            rook_squares.add((end_row, end_column + 1))
 
-        # If either side could still castle, update castling rights
-        if self.current_castle_rights.can_castle():
-            self.current_castle_rights.update_castle_rights(move)
+        self.update_evaluation(move_id, 1)
 
-        self.castle_rights_log.append(self.current_castle_rights.copy())
+        # Update castling rights, which are lost by moving from or to a king or rook square
+        castle_rights = self.castle_rights
+        self.castle_rights &= (
+            CASTLE_RIGHTS_KEPT[start_square] & CASTLE_RIGHTS_KEPT[end_square]
+        )
+
+        # Update the hash with only the parts of the position which the move changed
+        position_hash = (
+            self.hash
+            ^ ZOBRIST_BLACK_MOVE
+            ^ ZOBRIST_PIECES[piece_moved][start_square]
+            ^ ZOBRIST_PIECES[self.board[end_row][end_column]][end_square]
+            ^ ZOBRIST_CASTLE_RIGHTS[castle_rights]
+            ^ ZOBRIST_CASTLE_RIGHTS[self.castle_rights]
+        )
+
+        if piece_captured:
+            if move_id & EN_PASSANT_FLAG:
+                position_hash ^= ZOBRIST_PIECES[piece_captured][
+                    start_row * 8 + end_column
+                ]
+
+            else:
+                position_hash ^= ZOBRIST_PIECES[piece_captured][end_square]
+
+        if move_id & CASTLE_FLAG:
+            rook_keys = ZOBRIST_PIECES[piece_moved[0] + "R"]
+
+            if end_column == 6:
+                position_hash ^= rook_keys[end_square + 1] ^ rook_keys[end_square - 1]
+
+            else:
+                position_hash ^= rook_keys[end_square - 2] ^ rook_keys[end_square + 1]
+
+        if en_passant_column:
+            position_hash ^= ZOBRIST_EN_PASSANT[en_passant_column - 1]
+
+        if self.en_passant_square:
+            position_hash ^= ZOBRIST_EN_PASSANT[self.en_passant_square[1]]
+
+        self.hash = position_hash
 
         self.white_move = not self.white_move
-        
-        if move.piece_moved[1] == "p":
-            fifty_move_rule_reset = True
-        
-        new_draw_checker = copy.deepcopy(self.draw_log[-1])
-        new_draw_checker.update_checker(self.board, 1)
-        
-        if fifty_move_rule_reset:
-            new_draw_checker.move_counter = 0
-        
-        self.draw_log.append(new_draw_checker)
-        
+
+        self.halfmove_clock = 0 if fifty_move_rule_reset else self.halfmove_clock + 1
 
     def undo_move(self) -> None:
         """
@@ -175,46 +888,72 @@ class GameState:
 
         if self.move_log:
             move = self.move_log.pop()
+            self.move_index = None
+
+            # Unpack the move once rather than going through its properties
+            move_id = move.id
+            start_row, start_column = start = SQUARES[move_id & 63]
+            end_row, end_column = end = SQUARES[move_id >> END_SHIFT & 63]
+            piece_moved = INDEX_PIECES[move_id >> PIECE_MOVED_SHIFT & 15]
+            piece_captured = INDEX_PIECES[move_id >> PIECE_CAPTURED_SHIFT & 15]
 
-            self.board[move.start_row][move.start_column] = move.piece_moved
-            self.board[move.end_row][move.end_column] = move.piece_captured
+            self.update_evaluation(move_id, -1)
 
-            if move.piece_moved == "wK":
-                self.white_king_location = (move.start_row, move.start_column)
+            # Move the piece back, which may have been promoted
+            piece_squares = self.piece_squares
+            piece_squares[self.board[end_row][end_column]].discard(end)
+            piece_squares[piece_moved].add(start)
 
-            elif move.piece_moved == "bK":
-                self.black_king_location = (move.start_row, move.start_column)
+            self.board[start_row][start_column] = piece_moved
+            self.board[end_row][end_column] = piece_captured
+
+            if piece_moved == "wK":
+                self.white_king_location = start
+
+            elif piece_moved == "bK":
+                self.black_king_location = start
 
             self.white_move = not self.white_move
 
             # Undo en passant
-            if move.is_en_passant:
-                self.board[move.end_row][move.end_column] = ""
-                self.board[move.start_row][move.end_column] = move.piece_captured
-                self.en_passant_square = (move.end_row, move.end_column)
+            if move_id & EN_PASSANT_FLAG:
+                self.board[end_row][end_column] = ""
+                self.board[start_row][end_column] = piece_captured
+
+                piece_squares[piece_captured].add((start_row, end_column))
+
+            elif piece_captured:
+                piece_squares[piece_captured].add(end)
 
-            # Undo castling rights
-            self.castle_rights_log.pop()
-            self.current_castle_rights = copy.deepcopy(self.castle_rights_log[-1])
+            # Restore what the move couldn't give back from its undo record
+            self.restore_undo_record()
 
             # Undo castle move
             # If it is a king side castle, moves rook to new square
-            if move.king_side_castle:
-                self.board[move.end_row][move.end_column + 1] = self.board[
-                    move.end_row
-                ][move.end_column - 1]
-                self.board[move.end_row][move.end_column - 1] = ""
+            if move_id & CASTLE_FLAG and end_column == 6:
+                self.board[end_row][end_column + 1] = self.board[end_row][
+                    end_column - 1
+                ]
+                self.board[end_row][end_column - 1] = ""
+
+                rook_squares = piece_squares[piece_moved[0] + "R"]
+                rook_squares.discard((end_row, end_column - 1))
+                rook_squares.add((end_row, end_column + 1))
 
             # Else it is a queen side castle, do the same except for the queen side
-            elif move.queen_side_castle:
-                self.board[move.end_row][move.end_column - 2] = self.board[
-                    move.end_row
-                ][move.end_column + 1]
-                self.board[move.end_row][move.end_column + 1] = ""
+            elif move_id & CASTLE_FLAG and end_column == 2:
+                self.board[end_row][end_column - 2] = self.board[end_row][
+                    end_column + 1
+                ]
+                self.board[end_row][end_column + 1] = ""
+
+                rook_squares = piece_squares[piece_moved[0] + "R"]
+                rook_squares.discard((end_row, end_column + 1))
+                rook_squares.add((end_row, end_column - 2))
 
             # Undoing the material count
-            if move.piece_captured:
-                value = self.values[move.piece_captured[1]]
+            if piece_captured:
+                value = self.values[piece_captured[1]]
 
                 if self.white_move:
                     self.black_material += value
@@ -222,27 +961,135 @@ class GameState:
                 else:
                     self.white_material += value
 
-            if move.is_pawn_promotion:
+            if move_id & PROMOTION_FLAG:
                 if self.white_move:
                     self.white_material -= 8
 
                 else:
                     self.black_material -= 8
-                    
-            # Removes the last draw checker
-            self.draw_log.pop()
-            
 
-    def get_valid_moves(self) -> list:
+    def restore_undo_record(self) -> None:
+        """
+        Restores the castling rights, halfmove clock, hash and en passant square from the undo
+        record of the last move, once the move has been taken off the move log and the side to
+        move has been switched back
+        """
+
+        undo_record = self.undo_stack[len(self.move_log)]
+
+        self.castle_rights = undo_record & ALL_CASTLE_RIGHTS
+        self.halfmove_clock = undo_record >> UNDO_HALFMOVE_SHIFT & 0xFFFF
+        self.hash = undo_record >> UNDO_HASH_SHIFT
+
+        # The en passant square is behind the pawn of the side which is not to move
+        if en_passant_column := undo_record >> UNDO_EN_PASSANT_SHIFT & 15:
+            self.en_passant_square = (
+                2 if self.white_move else 5,
+                en_passant_column - 1,
+            )
+
+        else:
+            self.en_passant_square = ()
+
+    def make_null_move(self) -> None:
+        """
+        Passes the turn to the other player without moving a piece, for null move pruning. It
+        must be undone with undo_null_move, and should not be made when in check.
+
+        The halfmove clock is reset so that no repetition is found across the null move, as
+        the positions before it can't be reached by the moves after it
+        """
+
+        ply = len(self.move_log)
+
+        if ply == len(self.undo_stack):
+            self.undo_stack.extend([0] * ply)
+
+        en_passant_column = (
+            self.en_passant_square[1] + 1 if self.en_passant_square else 0
+        )
+        self.undo_stack[ply] = (
+            self.hash << UNDO_HASH_SHIFT
+            | self.halfmove_clock << UNDO_HALFMOVE_SHIFT
+            | en_passant_column << UNDO_EN_PASSANT_SHIFT
+            | self.castle_rights
+        )
+
+        # A null move is logged as None, to keep the move log in step with the undo stack
+        self.move_log.append(None)
+        self.move_index = None
+
+        self.hash ^= ZOBRIST_BLACK_MOVE
+
+        if en_passant_column:
+            self.hash ^= ZOBRIST_EN_PASSANT[en_passant_column - 1]
+            self.en_passant_square = ()
+
+        self.halfmove_clock = 0
+        self.white_move = not self.white_move
+
+    def undo_null_move(self) -> None:
+        """Undoes the null move made last"""
+
+        self.move_log.pop()
+        self.move_index = None
+
+        self.white_move = not self.white_move
+        self.restore_undo_record()
+
+    def get_repetitions(self) -> int:
+        """
+        Returns the number of times the current position has come up before. Only positions
+        since the last capture or pawn move can be the same, and only every other one has
+        the same side to move
+        """
+
+        repetitions = 0
+        plies = len(self.move_log)
+        undo_stack = self.undo_stack
+
+        for ply in range(plies - 2, max(plies - self.halfmove_clock, 0) - 1, -2):
+            if undo_stack[ply] >> UNDO_HASH_SHIFT == self.hash:
+                repetitions += 1
+
+        return repetitions
+
+    def is_insufficient_material(self) -> bool:
+        """Returns bool of if neither side has enough material left to checkmate"""
+
+        return self.material_signature in INSUFFICIENT_MATERIAL
+
+    def check_for_draw(self) -> bool:
+        """
+        Returns bool of if the game is drawn by insufficient material, threefold repetition or
+        the 50 move rule
+        """
+
+        return (
+            self.material_signature in INSUFFICIENT_MATERIAL
+            or self.halfmove_clock >= 100
+            or self.get_repetitions() >= 2
+        )
+
+    def get_valid_moves(self, move_types: int = ALL_MOVES) -> list:
         """
         Returns all the valid moves in the current game state
 
+        Args:
+            move_types (int): whether to get all, only noisy or only quiet moves
+
         Returns:
             list: list of all valid moves
         """
 
         moves = []
 
+        # Pseudo legal moves ignore pins and checks, except that castling still needs to know about check
+        if self.pseudo_legal:
+            self.in_check, self.pins, self.checks = self.king_in_check(), {}, []
+
+            return self.get_all_moves(move_types=move_types)
+
         self.in_check, self.pins, self.checks = self.check_for_pins_checks()
 
         # Getting the location of the king
@@ -252,224 +1099,533 @@ class GameState:
         else:
             king_row, king_column = self.black_king_location
 
+        # Only the moves which get out of check are generated
         if self.in_check:
+            self.get_evasion_moves(king_row, king_column, moves, move_types)
 
-            # If there is only 1 check, we must block the check, capture the piece, or move the king
-            if len(self.checks) == 1:
-                moves = self.get_all_moves()
+        # If king not in check, all moves are valid moves except for pins
+        else:
+            moves = self.get_all_moves(move_types=move_types)
 
-                # Check if the move can block the check
-                check = self.checks[0]
-                piece_checking = self.board[check[0]][check[1]]
+        return moves
 
-                valid_squares = []
+    def get_piece_moves(
+        self, row: int, column: int, move_types: int = ALL_MOVES
+    ) -> list:
+        """
+        Returns the valid moves of the piece on a square, without generating the moves of
+        every other piece
 
-                # If it is a knight, must move the king or capture the knight
-                if piece_checking[1] == "N":
-                    valid_squares.append((check[0], check[1]))
+        Args:
+            row (int): row of the piece
+            column (int): column of the piece
+            move_types (int): whether to get all, only noisy or only quiet moves
 
-                # Else, it can block the check where piece can move from king to attacking piece
-                else:
-                    for i in range(1, 8):
+        Returns:
+            list: list of the valid moves of the piece, empty if it is not the player's piece
+        """
+
+        moves = []
+        piece = self.board[row][column]
+
+        if not piece or piece[0] != ("w" if self.white_move else "b"):
+            return moves
+
+        if self.pseudo_legal:
+            self.in_check, self.pins, self.checks = self.king_in_check(), {}, []
+
+        else:
+            self.in_check, self.pins, self.checks = self.check_for_pins_checks()
+
+        # The piece has to get out of check, so only look at its evasions
+        if self.in_check and not self.pseudo_legal:
+            if self.white_move:
+                king_row, king_column = self.white_king_location
+
+            else:
+                king_row, king_column = self.black_king_location
+
+            self.get_evasion_moves(king_row, king_column, moves, move_types)
+
+            return [move for move in moves if move.start == (row, column)]
+
+        if piece[1] == "K":
+            self.get_king_moves(row, column, moves, move_types)
+
+            if move_types != NOISY_MOVES:
+                self.get_castle_moves(row, column, moves, piece[0])
+
+            return moves
+
+        if piece[1] == "p":
+            self.get_pawn_moves(row, column, moves, move_types)
+
+        elif piece[1] == "N":
+            self.get_knight_moves(row, column, moves, move_types)
+
+        elif piece[1] == "B":
+            self.get_bishop_moves(row, column, moves, move_types)
+
+        elif piece[1] == "R":
+            self.get_rook_moves(row, column, moves, move_types)
+
+        else:
+            self.get_queen_moves(row, column, moves, move_types)
+
+        return moves
+
+    def get_captures(self) -> list:
+        """Returns all the valid captures and promotions, for searching only the noisy moves"""
+
+        return self.get_valid_moves(NOISY_MOVES)
+
+    def get_evasions(self) -> list:
+        """
+        Returns all the valid moves if the player is in check, i.e. the king moves, the
+        captures of the checking piece and the moves which block the check
+
+        The list is empty if the player is not in check
+        """
+
+        moves = []
+        self.in_check, self.pins, self.checks = self.check_for_pins_checks()
+
+        if self.in_check:
+            if self.white_move:
+                king_row, king_column = self.white_king_location
+
+            else:
+                king_row, king_column = self.black_king_location
 
-                        square = (king_row + check[2] * i, king_column + check[3] * i)
+            self.get_evasion_moves(king_row, king_column, moves)
 
+        return moves
+
+    def get_check_block_squares(self, king_row: int, king_column: int) -> list:
+        """Returns the squares a piece can move to in order to block or capture the one check"""
+
+        check = self.checks[0]
+        piece_checking = self.board[check[0]][check[1]]
+
+        valid_squares = []
+
+        # If it is a knight, must move the king or capture the knight
+        if piece_checking[1] == "N":
+            valid_squares.append((check[0], check[1]))
+
+        # Else, it can block the check where piece can move from king to attacking piece
+        else:
+            direction = DIRECTIONS.index((check[2], check[3]))
+
+            for square in RAY_SQUARES[king_row][king_column][direction]:
+                valid_squares.append(square)
+
+                # If it is the square where the piece can be captured
+                if square == (check[0], check[1]):
+                    break
+
+        return valid_squares
+
+    def get_evasion_moves(
+        self, king_row: int, king_column: int, moves: list, move_types: int = ALL_MOVES
+    ) -> None:
+        """
+        Appends to list all the moves which get out of check, looking from each square which
+        blocks or captures the checking piece for the pieces which can move there
+        """
+
+        self.get_king_moves(king_row, king_column, moves, move_types)
+
+        # If it is double check, only the king can move
+        if len(self.checks) > 1:
+            return
+
+        turn = "w" if self.white_move else "b"
+        pawn_direction = -1 if self.white_move else 1
+        check_row, check_column = self.checks[0][:2]
+        pins = self.pins
+
+        for row, column in self.get_check_block_squares(king_row, king_column):
+            piece_captured = self.board[row][column]
+            end_id = (row * 8 + column) << END_SHIFT | CAPTURED_IDS[piece_captured]
+            starts = []
+
+            # A pinned piece can never block or capture the checking piece
+            for start in KNIGHT_SQUARES[row][column]:
+                if self.board[start[0]][start[1]] == turn + "N" and start not in pins:
+                    starts.append(start)
+
+            # The first piece in each direction, if it is a slider which moves that way
+            for j, ray in enumerate(RAY_SQUARES[row][column]):
+                for start in ray:
+                    if piece := self.board[start[0]][start[1]]:
                         if (
-                            0 <= square[0] < self.dimensions
-                            and 0 <= square[1] < self.dimensions
+                            piece[0] == turn
+                            and (piece[1] == "Q" or piece[1] == ("B" if j < 4 else "R"))
+                            and start not in pins
                         ):
-                            valid_squares.append(square)
+                            starts.append(start)
+
+                        break
+
+            # Pawns capture diagonally onto the checking piece, but can only block by moving forward
+            pawn_row = row - pawn_direction
+            if 0 <= pawn_row < 8:
+                if piece_captured:
+                    pawn_starts = [
+                        (pawn_row, pawn_column)
+                        for pawn_column in (column - 1, column + 1)
+                        if 0 <= pawn_column < 8
+                    ]
+
+                else:
+                    pawn_starts = [(pawn_row, column)]
+
+                    # A double push from the starting row
+                    if not self.board[pawn_row][column] and row == (
+                        4 if self.white_move else 3
+                    ):
+                        pawn_starts.append((pawn_row - pawn_direction, column))
+
+                for start in pawn_starts:
+                    if (
+                        self.board[start[0]][start[1]] == turn + "p"
+                        and start not in pins
+                    ):
+                        starts.append(start)
+
+            for start_row, start_column in starts:
+                piece_moved = self.board[start_row][start_column]
+                move_id = start_row * 8 + start_column | end_id | MOVED_IDS[piece_moved]
+
+                # Pawns moving to the last row are promoting
+                promoting = piece_moved[1] == "p" and (row == 0 or row == 7)
+                if promoting:
+                    move_id |= PROMOTION_FLAG
+
+                # Captures of the checking piece are noisy and blocks are quiet, unless promoting
+                if move_types != ALL_MOVES and (move_types == NOISY_MOVES) != (
+                    promoting or bool(piece_captured)
+                ):
+                    continue
+
+                moves.append(Move.from_id(move_id))
+
+        # A pawn which just moved 2 squares and gives check can be captured en passant
+        if (
+            self.en_passant_square
+            and move_types != QUIET_MOVES
+            and check_row == self.en_passant_square[0] - pawn_direction
+            and check_column == self.en_passant_square[1]
+        ):
+            for column in (check_column - 1, check_column + 1):
+                if 0 <= column < 8 and self.board[check_row][column] == turn + "p":
+                    pawn_moves = []
+                    self.get_pawn_moves(check_row, column, pawn_moves, NOISY_MOVES)
+
+                    moves.extend(move for move in pawn_moves if move.is_en_passant)
+
+    def check_for_pins_checks(self) -> tuple[bool, dict, list]:
+        """
+        Returns a tuple for if the king is in check, the pins and the checks that are in the game state (if any)
+
+        Returns:
+            tuple: a tuple of (in check, dict of pinned squares to pin direction, list of checks)
+        """
+
+        pins = {}
+        checks = []
+        in_check = False
+
+        if self.white_move:
+            opponent_colour, turn_colour = "b", "w"
+            start_row, start_column = self.white_king_location
+
+        else:
+            opponent_colour, turn_colour = "w", "b"
+            start_row, start_column = self.black_king_location
+
+        # Check for all directions, i.e. movement of queen
+        for j, ray in enumerate(RAY_SQUARES[start_row][start_column]):
+            direction = DIRECTIONS[j]
+            possible_pin = ()
+
+            # For each direction, check all the squares in order of distance from the king
+            for i, (counter_row, counter_column) in enumerate(ray, 1):
+
+                # If there is a piece on the specific square
+                if end_piece := self.board[counter_row][counter_column]:
+
+                    # If it is an ally piece
+                    if end_piece[0] == turn_colour and end_piece[1] != "K":
+
+                        # If it is the first ally piece, it may be pinned, otherwise no pins
+                        if not possible_pin:
+                            possible_pin = (counter_row, counter_column)
+
                         else:
                             break
 
-                        # If it is the square where the piece can be captured
-                        if square == (check[0], check[1]):
+                    # Else if it is an opponent's piece
+                    elif end_piece[0] == opponent_colour:
+                        type = end_piece[1]
+
+                        # Checking if a piece can put the king in check given its direction
+                        if (
+                            (0 <= j < 4 and type == "B")
+                            or (4 <= j < 8 and type == "R")
+                            or (type == "Q")
+                            or (i == 1 and type == "K")
+                            or (
+                                i == 1
+                                and type == "p"
+                                and (
+                                    (opponent_colour == "w" and j in (2, 3))
+                                    or (opponent_colour == "b" and j in (0, 1))
+                                )
+                            )
+                        ):
+
+                            # If no piece is blocking sight, it is in check
+                            if not possible_pin:
+                                in_check = True
+                                checks.append(
+                                    (
+                                        counter_row,
+                                        counter_column,
+                                        direction[0],
+                                        direction[1],
+                                    )
+                                )
+
+                                break
+
+                            # Else if there is a piece, it is a pin
+                            else:
+                                pins[possible_pin] = direction
+
+                                break
+
+                        else:
                             break
 
-                # Get rid of moves that don't block the check or move the king
-                for move in moves.copy():
+        # Check for knight checks
+        for counter_row, counter_column in KNIGHT_SQUARES[start_row][start_column]:
+            if piece := self.board[counter_row][counter_column]:
+
+                # If it is a knight
+                if piece[0] == opponent_colour and piece[1] == "N":
+                    in_check = True
+                    checks.append(
+                        (
+                            counter_row,
+                            counter_column,
+                            counter_row - start_row,
+                            counter_column - start_column,
+                        )
+                    )
+
+        return in_check, pins, checks
 
-                    if move.piece_moved[1] != "K":
+    def king_in_check(self) -> bool:
+        """Returns bool of if the current turn's player is in check"""
 
-                        if not (move.end_row, move.end_column) in valid_squares:
-                            moves.remove(move)
+        if self.white_move:
+            return self.is_attacked(self.white_king_location, "b")
 
-            # Else it is double or triple check, and the king has to move
-            else:
-                self.get_king_moves(king_row, king_column, moves)
+        else:
+            return self.is_attacked(self.black_king_location, "w")
+
+    def king_left_in_check(self, was_in_check: bool = True) -> bool:
+        """
+        Returns bool of if the last move made left the king of the player who made it in check,
+        i.e. if the move was not legal. Used to check pseudo legal moves once they are made
+
+        Args:
+            was_in_check (bool): if the player was in check before the move
+        """
+
+        # The player who made the move is the one not to move now
+        if self.white_move:
+            king_location, opponent = self.black_king_location, "w"
+
+        else:
+            king_location, opponent = self.white_king_location, "b"
+
+        if not self.can_leave_king_in_check(
+            self.move_log[-1], king_location, was_in_check
+        ):
+            return False
+
+        return self.is_attacked(king_location, opponent)
+
+    def can_leave_king_in_check(
+        self, move, king_location: tuple, was_in_check: bool
+    ) -> bool:
+        """
+        Returns bool of if a pseudo legal move could leave the king in check, without making it.
+        If the player was not in check, only a king move, en passant or a piece moving off a
+        line from the king can do so
+        """
+
+        move_id = move.id
+
+        if (
+            was_in_check
+            or move_id & EN_PASSANT_FLAG
+            or INDEX_PIECES[move_id >> PIECE_MOVED_SHIFT & 15][1] == "K"
+        ):
+            return True
 
-        # If king not in check, all moves are valid moves except for pins
-        else:
-            moves = self.get_all_moves()
+        start_row, start_column = SQUARES[move_id & 63]
+        row_offset = start_row - king_location[0]
+        column_offset = start_column - king_location[1]
 
-        return moves
+        return (
+            not row_offset or not column_offset or abs(row_offset) == abs(column_offset)
+        )
 
-    def check_for_pins_checks(self) -> tuple[bool, list, list]:
+    def has_legal_move(self, moves: list) -> bool:
         """
-        Returns a tuple for if the king is in check, the pins and the checks that are in the game state (if any)
-
-        Returns:
-            tuple: a tuple of (in check, list of pins, list of checks)
+        Returns bool of if any of the moves generated in the current game state is legal, which
+        for pseudo legal moves means making them until one does not leave the king in check
         """
 
-        pins = []
-        checks = []
-        in_check = False
-
-        if self.white_move:
-            opponent_colour, turn_colour = "b", "w"
-            start_row, start_column = self.white_king_location
-
-        else:
-            opponent_colour, turn_colour = "w", "b"
-            start_row, start_column = self.black_king_location
+        if not self.pseudo_legal:
+            return bool(moves)
 
-        # Check for all directions, i.e. movement of queen
-        directions = (
-            (-1, -1),
-            (-1, 1),
-            (1, -1),
-            (1, 1),
-            (-1, 0),
-            (0, -1),
-            (1, 0),
-            (0, 1),
+        was_in_check = self.in_check
+        king_location = (
+            self.white_king_location if self.white_move else self.black_king_location
         )
 
-        for j in range(len(directions)):
-            direction = directions[j]
-            possible_pin = ()
+        for move in moves:
+            if not self.can_leave_king_in_check(move, king_location, was_in_check):
+                return True
 
-            # For each direction, move and check for all possible squares in direction
-            for i in range(1, 8):
-                counter_row = start_row + direction[0] * i
-                counter_column = start_column + direction[1] * i
+            # The piece promoted to does not matter for legality
+            self.make_move(move, "Q")
+            illegal = self.king_left_in_check(was_in_check)
+            self.undo_move()
 
-                # To make sure it is within board
-                if 0 <= counter_row < 8 and 0 <= counter_column < 8:
+            if not illegal:
+                return True
 
-                    # If there is a piece on the specific square
-                    if end_piece := self.board[counter_row][counter_column]:
+        return False
 
-                        # If it is an ally piece
-                        if end_piece[0] == turn_colour and end_piece[1] != "K":
+    def get_move_index(self) -> dict[tuple, "Move"]:
+        """
+        Returns a dict of (start, end, promotion type) to each legal move, which is only built
+        once per position. A promotion can be looked up with a promotion type of "" as well,
+        otherwise the move found has the promotion type in it
+        """
 
-                            # If it is the first ally piece, it may be pinned, otherwise no pins
-                            if not possible_pin:
-                                possible_pin = (
-                                    counter_row,
-                                    counter_column,
-                                    direction[0],
-                                    direction[1],
-                                )
+        if self.move_index is None:
+            move_index = {}
 
-                            else:
-                                break
+            for move in self.get_valid_moves():
+                if not self.has_legal_move([move]):
+                    continue
 
-                        # Else if it is an opponent's piece
-                        elif end_piece[0] == opponent_colour:
-                            type = end_piece[1]
-
-                            # Checking if a piece can put the king in check given its direction
-                            if (
-                                (0 <= j < 4 and type == "B")
-                                or (4 <= j < 8 and type == "R")
-                                or (type == "Q")
-                                or (i == 1 and type == "K")
-                                or (
-                                    i == 1
-                                    and type == "p"
-                                    and (
-                                        (opponent_colour == "w" and j in (2, 3))
-                                        or (opponent_colour == "b" and j in (0, 1))
-                                    )
-                                )
-                            ):
-
-                                # If no piece is blocking sight, it is in check
-                                if not possible_pin:
-                                    in_check = True
-                                    checks.append(
-                                        (
-                                            counter_row,
-                                            counter_column,
-                                            direction[0],
-                                            direction[1],
-                                        )
-                                    )
+                move_index[(move.start, move.end, "")] = move
 
-                                    break
+                if move.is_pawn_promotion:
+                    for promotion_type in ("Q", "R", "B", "N"):
+                        promotion_id = (
+                            PROMOTION_INDICES[promotion_type] << PROMOTION_SHIFT
+                        )
+                        move_index[(move.start, move.end, promotion_type)] = (
+                            Move.from_id(move.id | promotion_id)
+                        )
 
-                                # Else if there is a piece, it is a pin
-                                else:
-                                    pins.append(possible_pin)
+            # Set after the moves are checked, as making moves clears the index
+            self.move_index = move_index
 
-                                    break
+        return self.move_index
 
-                            else:
-                                break
+    def get_legal_move(self, start: tuple, end: tuple, promotion_type: str = ""):
+        """
+        Returns the legal move from the start square to the end square, or None if there is none
 
-                else:
-                    break
+        Args:
+            start (tuple): row, column of the starting square
+            end (tuple): row, column of the square moved to
+            promotion_type (str): the piece type to promote to, if it is known
+        """
 
-        # Check for knight checks
-        knight_moves = (
-            (-2, -1),
-            (-2, 1),
-            (-1, -2),
-            (-1, 2),
-            (1, -2),
-            (1, 2),
-            (2, -1),
-            (2, 1),
-        )
+        return self.get_move_index().get((start, end, promotion_type))
 
-        for move in knight_moves:
-            counter_row = start_row + move[0]
-            counter_column = start_column + move[1]
+    def is_legal(self, move) -> bool:
+        """Returns bool of if a move is legal, only generating the moves of the piece being moved"""
 
-            # To make sure it is within the board
-            if 0 <= counter_row < 8 and 0 <= counter_column < 8:
-                if piece := self.board[counter_row][counter_column]:
+        if self.move_index is not None:
+            return (
+                self.move_index.get((move.start, move.end, move.promotion_type)) == move
+            )
 
-                    # If it is a knight
-                    if piece[0] == opponent_colour and piece[1] == "N":
-                        in_check = True
-                        checks.append((counter_row, counter_column, move[0], move[1]))
+        # The generators don't know which piece a pawn promotes to, so it is not compared
+        move_id = move.id & ~(7 << PROMOTION_SHIFT)
 
-        return in_check, pins, checks
+        for piece_move in self.get_piece_moves(move.start_row, move.start_column):
+            if piece_move.id == move_id:
+                return self.has_legal_move([piece_move])
 
-    def king_in_check(self) -> bool:
-        """Returns bool of if the current turn's player is in check"""
+        return False
 
-        if self.white_move:
-            return self.square_attacked(self.white_king_location)
+    def is_attacked(self, square: tuple, by_colour: str) -> bool:
+        """
+        Returns bool of if the square is attacked by a colour, looking outwards from the square
+        for the pieces which can attack it instead of generating the colour's moves
 
-        else:
-            return self.square_attacked(self.black_king_location)
+        Args:
+            square (tuple): row, column of the square
+            by_colour (str): the colour of the attacking pieces, "w" or "b"
+        """
 
-    def square_attacked(self, square: tuple) -> bool:
-        """Returns bool of if the square is under attack by opponent"""
+        row, column = square
 
-        # Switch turns to get the opponents turns
-        self.white_move = not self.white_move
-        opponents_moves = self.get_all_moves(True)
-        self.white_move = not self.white_move
+        board = self.board
+
+        knight, king, pawn = by_colour + "N", by_colour + "K", by_colour + "p"
+        bishop, rook, queen = by_colour + "B", by_colour + "R", by_colour + "Q"
 
-        for move in opponents_moves:
+        for attacker_row, attacker_column in KNIGHT_SQUARES[row][column]:
+            if board[attacker_row][attacker_column] == knight:
+                return True
 
-            # If the opponent can attack the square
-            if move.end_row == square[0] and move.end_column == square[1]:
+        for attacker_row, attacker_column in KING_SQUARES[row][column]:
+            if board[attacker_row][attacker_column] == king:
                 return True
 
+        # Pawns attack diagonally forwards, so look diagonally backwards for them
+        attacker_row = row + 1 if by_colour == "w" else row - 1
+        if 0 <= attacker_row < 8:
+            for attacker_column in (column - 1, column + 1):
+                if (
+                    0 <= attacker_column < 8
+                    and board[attacker_row][attacker_column] == pawn
+                ):
+                    return True
+
+        # Only the first piece in each direction can attack the square
+        for j, ray in enumerate(RAY_SQUARES[row][column]):
+            slider = bishop if j < 4 else rook
+
+            for attacker_row, attacker_column in ray:
+                if piece := board[attacker_row][attacker_column]:
+                    if piece == slider or piece == queen:
+                        return True
+
+                    break
+
         return False
 
-    def get_all_moves(self, for_square_under_attack: bool = False) -> list:
+    def get_all_moves(self, move_types: int = ALL_MOVES) -> list:
         """
         Returns all moves in current game state (without considering checks)
 
         Args:
-            for_square_under_attack (bool): if the current function is being called by that function
+            move_types (int): whether to get all, only noisy or only quiet moves
 
         Returns:
             list: list of all moves
@@ -479,57 +1635,57 @@ class GameState:
 
         # Setting a variable to hold who's turn it is
         turn = "w" if self.white_move else "b"
+        piece_squares = self.piece_squares
 
-        # Iterate through all the pieces to determine which pieces belong to the player's turn
-        for row in range(self.dimensions):
-            for column in range(self.dimensions):
-
-                if colour_piece := self.board[row][column]:
-
-                    if turn == colour_piece[0]:
-
-                        match colour_piece[1]:
-
-                            # How each piece moves
-                            case "p":
-                                self.get_pawn_moves(row, column, moves)
+        # Only go through the squares which has the player's pieces
+        for row, column in piece_squares[turn + "p"]:
+            self.get_pawn_moves(row, column, moves, move_types)
 
-                            case "R":
-                                self.get_rook_moves(row, column, moves)
+        for row, column in piece_squares[turn + "N"]:
+            self.get_knight_moves(row, column, moves, move_types)
 
-                            case "B":
-                                self.get_bishop_moves(row, column, moves)
+        for row, column in piece_squares[turn + "B"]:
+            self.get_bishop_moves(row, column, moves, move_types)
 
-                            case "N":
-                                self.get_knight_moves(row, column, moves)
+        for row, column in piece_squares[turn + "R"]:
+            self.get_rook_moves(row, column, moves, move_types)
 
-                            case "Q":
-                                self.get_queen_moves(row, column, moves)
+        for row, column in piece_squares[turn + "Q"]:
+            self.get_queen_moves(row, column, moves, move_types)
 
-                            case "K":
-                                self.get_king_moves(row, column, moves)
+        for row, column in piece_squares[turn + "K"]:
+            self.get_king_moves(row, column, moves, move_types)
 
-                                if not for_square_under_attack:
-                                    self.get_castle_moves(row, column, moves, turn)
+            if move_types != NOISY_MOVES:
+                self.get_castle_moves(row, column, moves, turn)
 
         return moves
 
-    def get_pawn_moves(self, row: int, column: int, moves: list) -> None:
+    def get_pawn_moves(
+        self, row: int, column: int, moves: list, move_types: int = ALL_MOVES
+    ) -> None:
         """Appends to list all the pawn moves"""
 
-        # For if the piece is pinned
-        piece_pinned = False
-        pin_direction = ()
+        # For if the piece is pinned, it can move either way along the line of the pin
+        pin_direction = self.pins.get((row, column), ())
+        piece_pinned = bool(pin_direction)
+
+        pawn, opponent_pawn = ("wp", "bp") if self.white_move else ("bp", "wp")
 
-        for pin in self.pins.copy():
-            if pin[0] == row and pin[1] == column:
-                piece_pinned = True
-                pin_direction = (pin[2], pin[3])
+        # Moves are built straight from their encoding, as this is the hottest loop
+        start_id = row * 8 + column | MOVED_IDS[pawn]
+        en_passant_id = start_id | EN_PASSANT_FLAG | CAPTURED_IDS[opponent_pawn]
 
-                self.pins.remove(pin)
+        # Pawns moving to the last row are promoting
+        promoting = row == (1 if self.white_move else 6)
+        if promoting:
+            start_id |= PROMOTION_FLAG
 
-                # A piece can only be pinned from one direction
-                break
+        # Pushes are only noisy if they promote, while captures are always noisy
+        include_pushes = (
+            move_types == ALL_MOVES or (move_types == NOISY_MOVES) == promoting
+        )
+        include_captures = move_types != QUIET_MOVES
 
         # For white pawns
         if self.white_move:
@@ -538,35 +1694,45 @@ class GameState:
             king_row, king_column = self.white_king_location
 
             # Check if square in front is empty and not pinned (but moving in direction of pin is fine)
-            if not self.board[row - 1][column]:
-                if not piece_pinned or pin_direction == (-1, 0):
-                    moves.append(Move((row, column), (row - 1, column), self.board))
+            if include_pushes and not self.board[row - 1][column]:
+                if not piece_pinned or pin_direction in ((-1, 0), (1, 0)):
+                    moves.append(
+                        Move.from_id(start_id | ((row - 1) * 8 + column) << END_SHIFT)
+                    )
 
                     # If it is on starting row, check if the 2nd square in front is empty
                     if row == 6:
                         if not self.board[row - 2][column]:
                             moves.append(
-                                Move((row, column), (row - 2, column), self.board)
+                                Move.from_id(
+                                    start_id | ((row - 2) * 8 + column) << END_SHIFT
+                                )
                             )
 
             # Check for captures
 
             # If can capture to left
-            if column - 1 >= 0:
+            if include_captures and column - 1 >= 0:
 
                 # Check if piece that can be captured is black
-                if self.board[row - 1][column - 1].startswith("b"):
+                captured = self.board[row - 1][column - 1]
+
+                if captured.startswith("b"):
 
                     # Checking for pins
-                    if not piece_pinned or pin_direction == (-1, -1):
+                    if not piece_pinned or pin_direction in ((-1, -1), (1, 1)):
                         moves.append(
-                            Move((row, column), (row - 1, column - 1), self.board)
+                            Move.from_id(
+                                start_id
+                                | ((row - 1) * 8 + column - 1) << END_SHIFT
+                                | CAPTURED_IDS[captured]
+                            )
                         )
 
                 # If it is empty, check if it is the square where en passant is possible
                 elif (row - 1, column - 1) == self.en_passant_square:
 
-                    if not piece_pinned or pin_direction == (-1, -1):
+                    if not piece_pinned or pin_direction in ((-1, -1), (1, 1)):
 
                         # Fixing weird en passant bug
                         attacking_piece = blocking_piece = None
@@ -583,39 +1749,45 @@ class GameState:
                                 if piece := self.board[row][i]:
                                     blocking_piece = piece
 
+                            # Only the first piece along the row can attack the king
                             for i in outside_range:
-                                square = self.board[row][i]
-                                if square.startswith("b"):
-                                    if square[1] == "R" or square[1] == "Q":
+                                if square := self.board[row][i]:
+                                    if square[0] == "b" and square[1] in ("R", "Q"):
                                         attacking_piece = square[1]
 
-                                elif square:
-                                    blocking_piece = square
+                                    else:
+                                        blocking_piece = square
+
+                                    break
 
                         if not attacking_piece or blocking_piece:
                             moves.append(
-                                Move(
-                                    (row, column),
-                                    (row - 1, column - 1),
-                                    self.board,
-                                    True,
+                                Move.from_id(
+                                    en_passant_id
+                                    | ((row - 1) * 8 + column - 1) << END_SHIFT
                                 )
                             )
 
             # If can capture to right
-            if column + 1 < self.dimensions:
+            if include_captures and column + 1 < self.dimensions:
 
                 # Check if piece that can be captured is black
-                if self.board[row - 1][column + 1].startswith("b"):
+                captured = self.board[row - 1][column + 1]
+
+                if captured.startswith("b"):
 
                     # Check for any pins
-                    if not piece_pinned or pin_direction == (-1, 1):
+                    if not piece_pinned or pin_direction in ((-1, 1), (1, -1)):
                         moves.append(
-                            Move((row, column), (row - 1, column + 1), self.board)
+                            Move.from_id(
+                                start_id
+                                | ((row - 1) * 8 + column + 1) << END_SHIFT
+                                | CAPTURED_IDS[captured]
+                            )
                         )
 
                 elif (row - 1, column + 1) == self.en_passant_square:
-                    if not piece_pinned or pin_direction == (-1, 1):
+                    if not piece_pinned or pin_direction in ((-1, 1), (1, -1)):
 
                         # Fixing weird en passant bug
                         attacking_piece = blocking_piece = None
@@ -632,22 +1804,22 @@ class GameState:
                                 if piece := self.board[row][i]:
                                     blocking_piece = piece
 
+                            # Only the first piece along the row can attack the king
                             for i in outside_range:
-                                square = self.board[row][i]
-                                if square.startswith("b"):
-                                    if square[1] == "R" or square[1] == "Q":
+                                if square := self.board[row][i]:
+                                    if square[0] == "b" and square[1] in ("R", "Q"):
                                         attacking_piece = square[1]
 
-                                elif square:
-                                    blocking_piece = square
+                                    else:
+                                        blocking_piece = square
+
+                                    break
 
                         if not attacking_piece or blocking_piece:
                             moves.append(
-                                Move(
-                                    (row, column),
-                                    (row - 1, column + 1),
-                                    self.board,
-                                    True,
+                                Move.from_id(
+                                    en_passant_id
+                                    | ((row - 1) * 8 + column + 1) << END_SHIFT
                                 )
                             )
 
@@ -657,28 +1829,38 @@ class GameState:
             # Get king square to fix weird en passant bug
             king_row, king_column = self.black_king_location
 
-            if not self.board[row + 1][column]:
+            if include_pushes and not self.board[row + 1][column]:
 
                 # Check for if piece is pinned/ if it can move in direction of pin
-                if not piece_pinned or pin_direction == (1, 0):
-                    moves.append(Move((row, column), (row + 1, column), self.board))
+                if not piece_pinned or pin_direction in ((1, 0), (-1, 0)):
+                    moves.append(
+                        Move.from_id(start_id | ((row + 1) * 8 + column) << END_SHIFT)
+                    )
 
                     if row == 1:
                         if not self.board[row + 2][column]:
                             moves.append(
-                                Move((row, column), (row + 2, column), self.board)
+                                Move.from_id(
+                                    start_id | ((row + 2) * 8 + column) << END_SHIFT
+                                )
                             )
 
-            if column - 1 >= 0:
+            if include_captures and column - 1 >= 0:
+
+                captured = self.board[row + 1][column - 1]
 
-                if self.board[row + 1][column - 1].startswith("w"):
-                    if not piece_pinned or pin_direction == (1, -1):
+                if captured.startswith("w"):
+                    if not piece_pinned or pin_direction in ((1, -1), (-1, 1)):
                         moves.append(
-                            Move((row, column), (row + 1, column - 1), self.board)
+                            Move.from_id(
+                                start_id
+                                | ((row + 1) * 8 + column - 1) << END_SHIFT
+                                | CAPTURED_IDS[captured]
+                            )
                         )
 
                 elif (row + 1, column - 1) == self.en_passant_square:
-                    if not piece_pinned or pin_direction == (1, -1):
+                    if not piece_pinned or pin_direction in ((1, -1), (-1, 1)):
 
                         # Fixing weird en passant bug
                         attacking_piece = blocking_piece = None
@@ -695,35 +1877,41 @@ class GameState:
                                 if piece := self.board[row][i]:
                                     blocking_piece = piece
 
+                            # Only the first piece along the row can attack the king
                             for i in outside_range:
-                                square = self.board[row][i]
-                                if square.startswith("w"):
-                                    if square[1] == "R" or square[1] == "Q":
+                                if square := self.board[row][i]:
+                                    if square[0] == "w" and square[1] in ("R", "Q"):
                                         attacking_piece = square[1]
 
-                                elif square:
-                                    blocking_piece = square
+                                    else:
+                                        blocking_piece = square
+
+                                    break
 
                         if not attacking_piece or blocking_piece:
                             moves.append(
-                                Move(
-                                    (row, column),
-                                    (row + 1, column - 1),
-                                    self.board,
-                                    True,
+                                Move.from_id(
+                                    en_passant_id
+                                    | ((row + 1) * 8 + column - 1) << END_SHIFT
                                 )
                             )
 
-            if column + 1 < self.dimensions:
+            if include_captures and column + 1 < self.dimensions:
+
+                captured = self.board[row + 1][column + 1]
 
-                if self.board[row + 1][column + 1].startswith("w"):
-                    if not piece_pinned or pin_direction == (1, 1):
+                if captured.startswith("w"):
+                    if not piece_pinned or pin_direction in ((1, 1), (-1, -1)):
                         moves.append(
-                            Move((row, column), (row + 1, column + 1), self.board)
+                            Move.from_id(
+                                start_id
+                                | ((row + 1) * 8 + column + 1) << END_SHIFT
+                                | CAPTURED_IDS[captured]
+                            )
                         )
 
                 elif (row + 1, column + 1) == self.en_passant_square:
-                    if not piece_pinned or pin_direction == (1, 1):
+                    if not piece_pinned or pin_direction in ((1, 1), (-1, -1)):
 
                         # Fixing weird en passant bug
                         attacking_piece = blocking_piece = None
@@ -740,268 +1928,203 @@ class GameState:
                                 if piece := self.board[row][i]:
                                     blocking_piece = piece
 
+                            # Only the first piece along the row can attack the king
                             for i in outside_range:
-                                square = self.board[row][i]
-                                if square.startswith("w"):
-                                    if square[1] == "R" or square[1] == "Q":
+                                if square := self.board[row][i]:
+                                    if square[0] == "w" and square[1] in ("R", "Q"):
                                         attacking_piece = square[1]
 
-                                elif square:
-                                    blocking_piece = square
+                                    else:
+                                        blocking_piece = square
+
+                                    break
 
                         if not attacking_piece or blocking_piece:
                             moves.append(
-                                Move(
-                                    (row, column),
-                                    (row + 1, column + 1),
-                                    self.board,
-                                    True,
+                                Move.from_id(
+                                    en_passant_id
+                                    | ((row + 1) * 8 + column + 1) << END_SHIFT
                                 )
                             )
 
-    def get_rook_moves(self, row: int, column: int, moves: list) -> None:
+    def get_rook_moves(
+        self, row: int, column: int, moves: list, move_types: int = ALL_MOVES
+    ) -> None:
         """Appends to list all of the rook moves"""
 
-        piece_pinned = False
-        pin_direction = ()
-
-        for pin in self.pins.copy():
-            if pin[0] == row and pin[1] == column:
-                piece_pinned = True
-                pin_direction = (pin[2], pin[3])
-
-                # If it is not the queen as you also need to check for bishop diagonal for queen
-                if self.board[row][column][1] != "Q":
-                    self.pins.remove(pin)
-
-        directions = ((-1, 0), (0, -1), (1, 0), (0, 1))
-        opponent = "b" if self.white_move else "w"
-
-        for direction in directions:
-            for i in range(1, 8):
-
-                # Get the maximum the rook can move
-                counter_row = row + direction[0] * i
-                counter_column = column + direction[1] * i
-
-                # If it is still in the board
-                if (
-                    0 <= counter_row < self.dimensions
-                    and 0 <= counter_column < self.dimensions
-                ):
-
-                    # If piece is not pinned/ move in direction of pin
-                    if (
-                        not piece_pinned
-                        or pin_direction == direction
-                        or pin_direction == (-direction[0], -direction[1])
-                    ):
-
-                        # If there is a piece
-                        if piece := self.board[counter_row][counter_column]:
-
-                            # If it is an enemy piece
-                            if piece.startswith(opponent):
-                                moves.append(
-                                    Move(
-                                        (row, column),
-                                        (counter_row, counter_column),
-                                        self.board,
-                                    )
-                                )
-                            break
-
-                        # Else if it is an empty square
-                        else:
-                            moves.append(
-                                Move(
-                                    (row, column),
-                                    (counter_row, counter_column),
-                                    self.board,
-                                )
-                            )
+        self.get_slider_moves(row, column, moves, range(4, 8), move_types)
 
-                else:
-                    break
-
-    def get_bishop_moves(self, row: int, column: int, moves: list) -> None:
+    def get_bishop_moves(
+        self, row: int, column: int, moves: list, move_types: int = ALL_MOVES
+    ) -> None:
         """Appends to list all of the bishop moves"""
 
-        # To check for pinned pieces
-        piece_pinned = False
-        pin_direction = ()
+        self.get_slider_moves(row, column, moves, range(4), move_types)
 
-        for pin in self.pins.copy():
-            if pin[0] == row and pin[1] == column:
-                piece_pinned = True
-                pin_direction = (pin[2], pin[3])
-
-                self.pins.remove(pin)
+    def get_slider_moves(
+        self,
+        row: int,
+        column: int,
+        moves: list,
+        directions: range,
+        move_types: int = ALL_MOVES,
+    ) -> None:
+        """Appends to list all of the moves of a sliding piece in the given directions"""
 
-                break
+        # If the piece is pinned, it can only move along the line of the pin
+        pin_direction = self.pins.get((row, column))
 
-        directions = ((-1, -1), (1, -1), (1, 1), (-1, 1))
         opponent = "b" if self.white_move else "w"
+        rays = RAY_SQUARES[row][column]
 
-        for direction in directions:
-            for i in range(1, 8):
-
-                # Get the maximum the rook bishop move
-                counter_row = row + direction[0] * i
-                counter_column = column + direction[1] * i
+        start_id = row * 8 + column | MOVED_IDS[self.board[row][column]]
 
-                # If it is still in the board
-                if (
-                    0 <= counter_row < self.dimensions
-                    and 0 <= counter_column < self.dimensions
-                ):
+        for j in directions:
+            direction = DIRECTIONS[j]
 
-                    # If not pinned or in direction of pin
-                    if (
-                        not piece_pinned
-                        or pin_direction == direction
-                        or pin_direction == (-direction[0], -direction[1])
-                    ):
+            if pin_direction and (
+                pin_direction != direction
+                and pin_direction != (-direction[0], -direction[1])
+            ):
+                continue
 
-                        # If there is a piece
-                        if piece := self.board[counter_row][counter_column]:
+            for end in rays[j]:
 
-                            # If it is an enemy piece
-                            if piece.startswith(opponent):
-                                moves.append(
-                                    Move(
-                                        (row, column),
-                                        (counter_row, counter_column),
-                                        self.board,
-                                    )
-                                )
-                            break
+                # If there is a piece
+                if piece := self.board[end[0]][end[1]]:
 
-                        # Else if it is an empty square
-                        else:
-                            moves.append(
-                                Move(
-                                    (row, column),
-                                    (counter_row, counter_column),
-                                    self.board,
-                                )
+                    # If it is an enemy piece
+                    if piece.startswith(opponent) and move_types != QUIET_MOVES:
+                        moves.append(
+                            Move.from_id(
+                                start_id
+                                | (end[0] * 8 + end[1]) << END_SHIFT
+                                | CAPTURED_IDS[piece]
                             )
-
-                else:
+                        )
                     break
 
-    def get_knight_moves(self, row: int, column: int, moves: list) -> None:
-        """Appends to list all of the knight moves"""
+                # Else if it is an empty square
+                elif move_types != NOISY_MOVES:
+                    moves.append(
+                        Move.from_id(start_id | (end[0] * 8 + end[1]) << END_SHIFT)
+                    )
 
-        # Check for if piece is pinned (direction doesn't matter for knight)
-        piece_pinned = False
-
-        for pin in self.pins.copy():
-            if pin[0] == row and pin[1] == column:
-                piece_pinned = True
-
-                self.pins.remove(pin)
-                break
-
-        # All the moves that a knight can make from its position
-        knight_moves = (
-            (-2, -1),
-            (-2, 1),
-            (-1, -2),
-            (-1, 2),
-            (1, -2),
-            (1, 2),
-            (2, -1),
-            (2, 1),
-        )
-        opponent = "b" if self.white_move else "w"
+    def get_knight_moves(
+        self, row: int, column: int, moves: list, move_types: int = ALL_MOVES
+    ) -> None:
+        """Appends to list all of the knight moves"""
 
-        for move in knight_moves:
-            move_row = row + move[0]
-            move_column = column + move[1]
+        # If the piece is pinned it can't move (direction doesn't matter for knight)
+        if (row, column) in self.pins:
+            return
 
-            if 0 <= move_row < self.dimensions and 0 <= move_column < self.dimensions:
+        opponent = "b" if self.white_move else "w"
 
-                # If it is not pinned
-                if not piece_pinned:
+        start_id = row * 8 + column | MOVED_IDS[self.board[row][column]]
 
-                    # If there is a piece
-                    if piece := self.board[move_row][move_column]:
-                        if piece.startswith(opponent):
-                            moves.append(
-                                Move((row, column), (move_row, move_column), self.board)
-                            )
+        for end in KNIGHT_SQUARES[row][column]:
 
-                    # Else if it is an empty square
-                    else:
-                        moves.append(
-                            Move((row, column), (move_row, move_column), self.board)
+            # If there is a piece
+            if piece := self.board[end[0]][end[1]]:
+                if piece.startswith(opponent) and move_types != QUIET_MOVES:
+                    moves.append(
+                        Move.from_id(
+                            start_id
+                            | (end[0] * 8 + end[1]) << END_SHIFT
+                            | CAPTURED_IDS[piece]
                         )
+                    )
+
+            # Else if it is an empty square
+            elif move_types != NOISY_MOVES:
+                moves.append(
+                    Move.from_id(start_id | (end[0] * 8 + end[1]) << END_SHIFT)
+                )
 
-    def get_queen_moves(self, row: int, column: int, moves: list) -> None:
+    def get_queen_moves(
+        self, row: int, column: int, moves: list, move_types: int = ALL_MOVES
+    ) -> None:
         """Appends to list all of the queen moves"""
 
-        self.get_rook_moves(row, column, moves)
-        self.get_bishop_moves(row, column, moves)
+        self.get_rook_moves(row, column, moves, move_types)
+        self.get_bishop_moves(row, column, moves, move_types)
 
-    def get_king_moves(self, row: int, column: int, moves: list) -> None:
+    def get_king_moves(
+        self, row: int, column: int, moves: list, move_types: int = ALL_MOVES
+    ) -> None:
         """Appends to list all of the king moves"""
 
-        # All the moves that a king can make from its position
-        king_moves = (
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, -1),
-            (0, 1),
-            (1, 0),
-            (1, -1),
-            (1, 1),
-        )
         turn = "w" if self.white_move else "b"
+        start_id = row * 8 + column | MOVED_IDS[turn + "K"]
 
-        for move in king_moves:
-            move_row = row + move[0]
-            move_column = column + move[1]
+        for end in KING_SQUARES[row][column]:
+            move_row, move_column = end
+            piece_captured = self.board[move_row][move_column]
 
-            if 0 <= move_row < self.dimensions and 0 <= move_column < self.dimensions:
+            # Skip the moves which are not of the type asked for
+            if move_types != ALL_MOVES and (move_types == NOISY_MOVES) != bool(
+                piece_captured
+            ):
+                continue
 
-                # If it is not self's piece (i.e. either empty or opponent piece)
-                if not self.board[move_row][move_column].startswith(turn):
+            # If it is not self's piece (i.e. either empty or opponent piece)
+            if not piece_captured.startswith(turn):
 
-                    # Place king on new square and check for checks
-                    if turn == "w":
-                        self.white_king_location = (move_row, move_column)
-                    else:
-                        self.black_king_location = (move_row, move_column)
+                # Pseudo legal king moves are checked once they are made
+                if self.pseudo_legal:
+                    moves.append(
+                        Move.from_id(
+                            start_id
+                            | (move_row * 8 + move_column) << END_SHIFT
+                            | CAPTURED_IDS[piece_captured]
+                        )
+                    )
 
-                    in_check, _, checks = self.check_for_pins_checks()
+                    continue
 
-                    if not in_check:
-                        moves.append(
-                            Move((row, column), (move_row, move_column), self.board)
+                # Place king on new square and check for checks
+                if turn == "w":
+                    self.white_king_location = (move_row, move_column)
+                else:
+                    self.black_king_location = (move_row, move_column)
+
+                in_check, _, checks = self.check_for_pins_checks()
+
+                if not in_check:
+                    moves.append(
+                        Move.from_id(
+                            start_id
+                            | (move_row * 8 + move_column) << END_SHIFT
+                            | CAPTURED_IDS[piece_captured]
                         )
+                    )
 
-                    # Return king back to original position
-                    if turn == "w":
-                        self.white_king_location = (row, column)
-                    else:
-                        self.black_king_location = (row, column)
+                # Return king back to original position
+                if turn == "w":
+                    self.white_king_location = (row, column)
+                else:
+                    self.black_king_location = (row, column)
 
     def get_castle_moves(
         self, row: int, column: int, moves: list, turn_colour: str
     ) -> None:
         """Appends to list all of the castle moves"""
 
+        opponent_colour = "b" if turn_colour == "w" else "w"
+
         def get_king_castle_moves() -> Move:
             """Returns a Move class of the king side castling move"""
             if not self.board[row][column + 1] and not self.board[row][column + 2]:
-                if not self.square_attacked(
-                    (row, column + 1)
-                ) and not self.square_attacked((row, column + 2)):
+                if not self.is_attacked(
+                    (row, column + 1), opponent_colour
+                ) and not self.is_attacked((row, column + 2), opponent_colour):
                     moves.append(
                         Move(
-                            (row, column), (row, column + 2), self.board, is_castle=True
+                            (row, column),
+                            (row, column + 2),
+                            is_castle=True,
+                            piece_moved=turn_colour + "K",
                         )
                     )
 
@@ -1011,12 +2134,15 @@ class GameState:
                 and not self.board[row][column - 2]
                 and not self.board[row][column - 3]
             ):
-                if not self.square_attacked(
-                    (row, column - 1)
-                ) and not self.square_attacked((row, column - 2)):
+                if not self.is_attacked(
+                    (row, column - 1), opponent_colour
+                ) and not self.is_attacked((row, column - 2), opponent_colour):
                     moves.append(
                         Move(
-                            (row, column), (row, column - 2), self.board, is_castle=True
+                            (row, column),
+                            (row, column - 2),
+                            is_castle=True,
+                            piece_moved=turn_colour + "K",
                         )
                     )
 
@@ -1024,17 +2150,61 @@ class GameState:
         if self.in_check:
             return
 
-        if (self.white_move and self.current_castle_rights.white_king_side) or (
-            not self.white_move and self.current_castle_rights.black_king_side
+        if self.castle_rights & (
+            WHITE_KING_SIDE if self.white_move else BLACK_KING_SIDE
         ):
             get_king_castle_moves()
 
-        if (self.white_move and self.current_castle_rights.white_queen_side) or (
-            not self.white_move and self.current_castle_rights.black_queen_side
+        if self.castle_rights & (
+            WHITE_QUEEN_SIDE if self.white_move else BLACK_QUEEN_SIDE
         ):
             get_queen_castle_moves()
 
 
+# Every piece has an index in an encoded Move, 0 being an empty square
+PIECE_INDICES = {
+    "": 0,
+    "wp": 1,
+    "wN": 2,
+    "wB": 3,
+    "wR": 4,
+    "wQ": 5,
+    "wK": 6,
+    "bp": 7,
+    "bN": 8,
+    "bB": 9,
+    "bR": 10,
+    "bQ": 11,
+    "bK": 12,
+}
+INDEX_PIECES = tuple(PIECE_INDICES)
+
+PROMOTION_INDICES = {"": 0, "N": 1, "B": 2, "R": 3, "Q": 4}
+INDEX_PROMOTIONS = tuple(PROMOTION_INDICES)
+
+# The (row, column) of each square number, which is row * 8 + column
+SQUARES = tuple((square >> 3, square & 7) for square in range(64))
+
+# Layout of an encoded Move, from the least significant bit: start square (6 bits),
+# end square (6 bits), en passant, castle and promotion flags (1 bit each),
+# promotion type (3 bits), piece moved (4 bits), piece captured (4 bits)
+END_SHIFT = 6
+EN_PASSANT_FLAG = 1 << 12
+CASTLE_FLAG = 1 << 13
+PROMOTION_FLAG = 1 << 14
+PROMOTION_SHIFT = 15
+PIECE_MOVED_SHIFT = 18
+PIECE_CAPTURED_SHIFT = 22
+
+# The piece fields of an encoded Move, for building moves without a lookup per field
+MOVED_IDS = {
+    piece: index << PIECE_MOVED_SHIFT for piece, index in PIECE_INDICES.items()
+}
+CAPTURED_IDS = {
+    piece: index << PIECE_CAPTURED_SHIFT for piece, index in PIECE_INDICES.items()
+}
+
+
 class Move:
 
     # Dict to map standard chess notation to the list of lists and vice versa
@@ -1044,68 +2214,166 @@ class Move:
     files_to_columns = {"a": 0, "b": 1, "c": 2, "d": 3, "e": 4, "f": 5, "g": 6, "h": 7}
     columns_to_files = {v: k for k, v in files_to_columns.items()}
 
+    # Everything about the move is packed into a single int, so no other attributes are needed
+    __slots__ = ("id",)
+
     def __init__(
         self,
         start: tuple,
         end: tuple,
-        board: GameState,
+        board: list[list[str]] = None,
         is_en_passant: bool = False,
         is_castle: bool = False,
+        piece_moved: str = "",
+        piece_captured: str = "",
+        promotion_type: str = "",
     ) -> None:
         """
         Generates a chess move which keeps track of the move to be made, as well as
         the piece that is being moved and the piece that is being captured
 
+        The move generators pass in the pieces directly, if a board is given instead the
+        pieces are looked up, and en passant and castling moves are detected from the board
+
         Args:
             start (tuple): row, column of initial starting square
             end (tuple): row, column of square for the piece to be moved to
-            board (GameState.board): The current board
+            board (GameState.board): The current board, if the pieces are not given
             is_en_passant (bool): Whether or not the move is an en passant
             is_castle (bool): Whether the current move is a castling move
+            piece_moved (str): The piece being moved
+            piece_captured (str): The piece being captured, if any
+            promotion_type (str): The piece type to promote to, if it is known
         """
 
-        # Uncouples the tuple
-        self.start_row, self.start_column = self.start = start
-        self.end_row, self.end_column = self.end = end
+        start_row, start_column = start
+        end_row, end_column = end
 
-        # Stores the piece moved and piece captured (if any)
-        self.piece_moved = board[self.start_row][self.start_column]
-        self.piece_captured = board[self.end_row][self.end_column]
+        if board is not None:
+            piece_moved = board[start_row][start_column]
+            piece_captured = board[end_row][end_column]
 
-        # A unique identifier to make it easier for comparing
-        self.move = [start, end]
+            # A pawn moving diagonally to an empty square can only be en passant
+            if piece_moved[1:] == "p" and start_column != end_column:
+                if not piece_captured:
+                    is_en_passant = True
 
-        # To keep track of if it is a pawn promotion
-        self.is_pawn_promotion = (self.piece_moved == "wp" and self.end_row == 0) or (
-            self.piece_moved == "bp" and self.end_row == 7
-        )
+            # A king moving 2 squares can only be castling
+            elif piece_moved[1:] == "K" and abs(start_column - end_column) == 2:
+                is_castle = True
 
-        # Keep track of if move is en passant
-        self.is_en_passant = is_en_passant
+            if is_en_passant:
+                piece_captured = board[start_row][end_column]
+
+        move_id = (
+            start_row * 8 + start_column
+            | (end_row * 8 + end_column) << END_SHIFT
+            | PIECE_INDICES[piece_moved] << PIECE_MOVED_SHIFT
+            | PIECE_INDICES[piece_captured] << PIECE_CAPTURED_SHIFT
+        )
 
         if is_en_passant:
-            self.piece_captured = board[self.start_row][self.end_column]
+            move_id |= EN_PASSANT_FLAG
 
-        # Keep track of if current move is a castling move
-        self.is_castle = is_castle
+        elif is_castle:
+            move_id |= CASTLE_FLAG
 
-        if self.is_castle:
+        # To keep track of if it is a pawn promotion
+        elif piece_moved[1:] == "p" and (end_row == 0 or end_row == 7):
+            move_id |= PROMOTION_FLAG
+            move_id |= PROMOTION_INDICES[promotion_type] << PROMOTION_SHIFT
 
-            # Take down if it is a king side castle
-            self.king_side_castle = (
-                True if (self.end_column - self.start_column == 2) else False
-            )
+        self.id = move_id
 
-            # Take down if it is queen side castle (can only be queen side if it is a castling move and it is not king side)
-            self.queen_side_castle = not self.king_side_castle
+    @classmethod
+    def from_id(cls, move_id: int):
+        """Returns the Move with the given encoding"""
 
-        # If it is not a castling move, it cannot be either castle
-        else:
-            self.king_side_castle = self.queen_side_castle = False
+        move = cls.__new__(cls)
+        move.id = move_id
+
+        return move
+
+    @property
+    def start_square(self) -> int:
+        """The number of the starting square, i.e. row * 8 + column"""
+        return self.id & 63
+
+    @property
+    def end_square(self) -> int:
+        """The number of the ending square, i.e. row * 8 + column"""
+        return self.id >> END_SHIFT & 63
+
+    @property
+    def start(self) -> tuple:
+        return SQUARES[self.id & 63]
+
+    @property
+    def end(self) -> tuple:
+        return SQUARES[self.id >> END_SHIFT & 63]
+
+    @property
+    def start_row(self) -> int:
+        return (self.id & 63) >> 3
+
+    @property
+    def start_column(self) -> int:
+        return self.id & 7
+
+    @property
+    def end_row(self) -> int:
+        return (self.id >> END_SHIFT & 63) >> 3
+
+    @property
+    def end_column(self) -> int:
+        return self.id >> END_SHIFT & 7
+
+    @property
+    def move(self) -> list[tuple]:
+        """The starting and ending square of the move"""
+        return [self.start, self.end]
+
+    @property
+    def piece_moved(self) -> str:
+        return INDEX_PIECES[self.id >> PIECE_MOVED_SHIFT & 15]
+
+    @property
+    def piece_captured(self) -> str:
+        return INDEX_PIECES[self.id >> PIECE_CAPTURED_SHIFT & 15]
+
+    @property
+    def promotion_type(self) -> str:
+        """The piece type to promote to, empty if it is not a promotion or not known"""
+        return INDEX_PROMOTIONS[self.id >> PROMOTION_SHIFT & 7]
+
+    @property
+    def is_pawn_promotion(self) -> bool:
+        return bool(self.id & PROMOTION_FLAG)
+
+    @property
+    def is_en_passant(self) -> bool:
+        return bool(self.id & EN_PASSANT_FLAG)
+
+    @property
+    def is_castle(self) -> bool:
+        return bool(self.id & CASTLE_FLAG)
+
+    @property
+    def king_side_castle(self) -> bool:
+        return bool(self.id & CASTLE_FLAG) and self.end_column == 6
+
+    @property
+    def queen_side_castle(self) -> bool:
+        return bool(self.id & CASTLE_FLAG) and self.end_column == 2
 
     def __eq__(self, other):
         if isinstance(other, Move):
-            return self.move == other.move
+            return self.id == other.id
+
+        return NotImplemented
+
+    def __hash__(self):
+        return self.id
 
     def get_chess_notation(self) -> str:
         """
@@ -1175,124 +2443,3 @@ class Move:
 
     def __str__(self):
         return self.get_chess_notation()
-
-
-class CastleRights:
-
-    def __init__(
-        self,
-        white_king_side: bool,
-        black_king_side: bool,
-        white_queen_side: bool,
-        black_queen_side: bool,
-    ):
-        """
-        Creates an object which holds information about either side's castling rights
-
-        Args:
-            white_king_side (bool): Whether white can still castle king side
-            black_king_side (bool): Whether black can still castle king side
-            white_queen_side (bool): Whether white can still castle queen side
-            black_queen_side (bool): Whether black can still castle queen side
-        """
-
-        self.white_king_side = white_king_side
-        self.black_king_side = black_king_side
-        self.white_queen_side = white_queen_side
-        self.black_queen_side = black_queen_side
-
-    def update_castle_rights(self, move) -> None:
-        """
-        Update castle rights of either colour given a move
-
-        Args:
-            move (Move): Any chess move that was made using the Move class
-        """
-
-        # If either king moves, either side loses castling rights
-        if move.piece_moved == "wK":
-            self.white_king_side = False
-            self.white_queen_side = False
-
-        elif move.piece_moved == "bK":
-            self.black_king_side = False
-            self.black_queen_side = False
-
-        # If white's king side rook is captured or moved, white can no longer castle king side
-        elif move.start == (7, 7) or move.end == (7, 7):
-            self.white_king_side = False
-
-        # If white's queen side rook is captured of moved, white can no longer castle queen side
-        elif move.start == (7, 0) or move.end == (7, 0):
-            self.white_queen_side = False
-
-        # Applying the same logic for black
-        elif move.start == (0, 7) or move.end == (0, 7):
-            self.black_king_side = False
-
-        elif move.start == (0, 0) or move.end == (0, 0):
-            self.black_queen_side = False
-
-    def copy(self):
-        """Returns a copy of the current object"""
-
-        return CastleRights(
-            self.white_king_side,
-            self.black_king_side,
-            self.white_queen_side,
-            self.black_queen_side,
-        )
-
-    def can_castle(self) -> bool:
-        """Returns a bool based on if either side can still castle"""
-
-        return (
-            self.white_king_side
-            or self.black_king_side
-            or self.white_queen_side
-            or self.black_queen_side
-        )
-
-    def colour_can_castle(self: str, turn: str) -> bool:
-        """Returns a bool based on if the turn/ colour given can still castle"""
-
-        if turn == "w":
-            return self.white_king_side or self.white_queen_side
-
-        elif turn == "b":
-            return self.black_king_side or self.black_queen_side
-
-        else:
-            raise ValueError("Incorrect turn colour given")
-
-    def __str__(self):
-        return f"White: {self.white_king_side, self.white_queen_side}, Black: {self.black_king_side, self.black_queen_side}"
-
-
-class DrawChecker:
-    """
-    Keeps track of if the game state is a draw
-    """
-    
-    def __init__(self, board: list[list[str]], move_counter: int = 0) -> None:
-        
-        self.past_boards ={tuple(tuple(row) for row in board): 1}
-        
-        self.move_counter = move_counter
-        
-    def update_checker(self, board: list[list[str]], move_counter: int) -> None:
-        
-        self.past_boards[tuple(tuple(row) for row in board)] = self.past_boards.get(tuple(tuple(row) for row in board), 0) + 1
-
-        self.move_counter += move_counter
-    
-    def check_for_draw(self) -> bool:
-        
-        for count in self.past_boards.values():
-            if count >= 3:
-                return True
-            
-        if self.move_counter == 100:
-            return True
-        
-        return False
\ No newline at end of file
@@ -0,0 +1,108 @@
+from .chess_logic import INDEX_PIECES, PIECE_INDICES, SQUARES, GameState
+
+# A position is packed into POSITION_SIZE bytes:
+#
+#   bytes 0-31   the piece on each square as a nibble, the index of the piece in an encoded
+#                Move (0 for an empty square). Squares are numbered row * 8 + column, so
+#                square 0 is a8, and the even square of each pair is in the low nibble
+#   byte 32      the castling rights in bits 0-3 (as in GameState.castle_rights), and bit 4
+#                set if it is black to move
+#   byte 33      the en passant column plus 1, 0 if en passant is not possible
+#   bytes 34-35  the halfmove clock, little endian
+#   bytes 36-37  the fullmove number, little endian
+#
+# Positions of this fixed size can be stored one after another and read from any offset
+
+POSITION_SIZE = 38
+
+BLACK_MOVE_BIT = 1 << 4
+
+
+def encode(game_state: GameState) -> bytes:
+    """Returns the position of a game state packed into POSITION_SIZE bytes"""
+
+    data = bytearray(POSITION_SIZE)
+    board = game_state.board
+
+    for square in range(0, 64, 2):
+        row, column = SQUARES[square]
+
+        data[square >> 1] = (
+            PIECE_INDICES[board[row][column]]
+            | PIECE_INDICES[board[row][column + 1]] << 4
+        )
+
+    data[32] = game_state.castle_rights | (
+        0 if game_state.white_move else BLACK_MOVE_BIT
+    )
+
+    if game_state.en_passant_square:
+        data[33] = game_state.en_passant_square[1] + 1
+
+    fullmove_number = (game_state.start_ply + len(game_state.move_log)) // 2 + 1
+
+    data[34:36] = game_state.halfmove_clock.to_bytes(2, "little")
+    data[36:38] = fullmove_number.to_bytes(2, "little")
+
+    return bytes(data)
+
+
+def decode(data, offset: int = 0, game_state: GameState | None = None) -> GameState:
+    """
+    Returns the game state of a position packed by encode. The data can be any bytes-like
+    object, such as a memoryview of many positions, which is read in place. Raises ValueError
+    if the data is not a position
+
+    Args:
+        data (bytes | bytearray | memoryview): the packed positions
+        offset (int): the index of the first byte of the position
+        game_state (GameState | None): a game state to set the position on, instead of a new one
+
+    Returns:
+        GameState: the game state of the position
+    """
+
+    if len(data) < offset + POSITION_SIZE:
+        raise ValueError("Not enough data for a position")
+
+    board = [[""] * 8 for _ in range(8)]
+
+    for square in range(0, 64, 2):
+        row, column = SQUARES[square]
+        pieces = data[offset + (square >> 1)]
+
+        # Only 13 of the 16 nibbles are pieces
+        try:
+            board[row][column] = INDEX_PIECES[pieces & 15]
+            board[row][column + 1] = INDEX_PIECES[pieces >> 4]
+
+        except IndexError:
+            raise ValueError(f"Incorrect pieces at square {square}") from None
+
+    flags = data[offset + 32]
+
+    if flags >> 5:
+        raise ValueError(f"Incorrect flags: {flags}")
+
+    en_passant_column = data[offset + 33]
+    white_move = not flags & BLACK_MOVE_BIT
+
+    if en_passant_column:
+        en_passant_square = (2 if white_move else 5, en_passant_column - 1)
+
+    else:
+        en_passant_square = ()
+
+    if game_state is None:
+        game_state = GameState()
+
+    game_state.set_position(
+        board,
+        white_move,
+        flags & 15,
+        en_passant_square,
+        data[offset + 34] | data[offset + 35] << 8,
+        data[offset + 36] | data[offset + 37] << 8,
+    )
+
+    return game_state
@@ -0,0 +1,226 @@
+import random
+
+# Magic bitboard attack tables for the sliding pieces.
+#
+# For every square, the squares which can block a rook or bishop (not including the edge of
+# the board) are masked out of the occupied squares, multiplied by a magic number and shifted,
+# giving a unique index into a table of precomputed attack sets. The attack set of a slider
+# is therefore a single table lookup.
+#
+# Squares are numbered row * 8 + column, the same as in bitboard_logic. The magic numbers
+# were generated with find_magic, running this file prints a new set.
+
+
+FULL_BOARD = (1 << 64) - 1
+
+ROOK_DIRECTIONS = ((-1, 0), (0, -1), (1, 0), (0, 1))
+BISHOP_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+ROOK_MAGICS = [
+    0x128012C0008000E0, 0x0240002000401001, 0x4100200041001008, 0x8280100008018004,
+    0x2080080002040080, 0x1300010004008208, 0x04000208A9101408, 0x020000204A018F04,
+    0x1080800040008020, 0x0000C01000402001, 0x0080808010002000, 0x0408800800801000,
+    0x0010800801040080, 0x4804800400804200, 0x0304800D00800200, 0x010200040081006A,
+    0x8280044020084000, 0x042000C010004021, 0x2010002004080020, 0x0040210010000900,
+    0x0008004004020041, 0x0004008080040200, 0x1C20040070610208, 0x1020A20000508104,
+    0x0100C00380008120, 0x4001200280400080, 0x0200100080200080, 0x0000401200082200,
+    0xC02C080080040080, 0x0840040080020080, 0x2102004040800100, 0x0042079A00004104,
+    0x0000400424800280, 0x4820100020400040, 0x5010002000801880, 0x9061080081801002,
+    0x208A050011000800, 0x000200080E003094, 0xA010018204003008, 0x2000288042001401,
+    0x400181C000228000, 0x0200402010004000, 0x8388928600420021, 0x400021001001000A,
+    0x2100080011010004, 0x1002020004008080, 0x0802000804020001, 0x88004410408A0001,
+    0x010508C030800100, 0x4000400080310100, 0x0030200010048080, 0x2000800800100080,
+    0x0100040008008080, 0x0022000204008080, 0x0108020170284400, 0x1001010084004200,
+    0x0004890141902202, 0x0100881100220042, 0x0100102001000841, 0x4408050020081001,
+    0x0002008884201002, 0x2002000490410802, 0x0020014800900204, 0x0100082081044402,
+]
+
+BISHOP_MAGICS = [
+    0x0010104088840042, 0x0110104081004062, 0x0091142082000100, 0x0108208821008100,
+    0x0101104000080000, 0x010104200404001C, 0x0C01040202C00010, 0x0001004800841080,
+    0xCA8B46100E280102, 0x001010D00085024C, 0x4180089881020120, 0x8010082050411000,
+    0x0800020210100000, 0x0002120905201200, 0xC000040404040510, 0x0110410101100200,
+    0x0042201408020C27, 0xA882000404440C20, 0x0002000102040100, 0x800200202202C200,
+    0x4002005012101401, 0x2441014880600200, 0x0214020104018400, 0x000180004414410A,
+    0x0105410C10020800, 0x0004200084013400, 0x200582045004001B, 0x1000404004010200,
+    0x0001001081004021, 0x2400430202008628, 0x000604C144230800, 0x04004840008A1804,
+    0x4010045000220210, 0x2012100400500120, 0x10001C0205900081, 0x0020880800360A00,
+    0x8500460020060080, 0x0420008209010110, 0x0010020250008C00, 0x8010A40100004104,
+    0x00008208400022C8, 0x0008410450402100, 0x0008920110004104, 0x43A8011044002024,
+    0x0029102021900602, 0x2270101000212040, 0x0020C41112004040, 0x3004840550C42200,
+    0x5002022202404480, 0x0402822309200840, 0x0032010423240048, 0x2000CA0384110008,
+    0x4001140410440000, 0x2092E50810011010, 0x0140040852005041, 0x00200200C1010104,
+    0x40120202020104E0, 0xA000010042300500, 0x400048004A009001, 0x4200800400411081,
+    0x0010040604105400, 0x0107004210024080, 0x0004423004210040, 0xC220023088010040,
+]
+
+
+def get_ray_attacks(square: int, occupied: int, directions: tuple) -> int:
+    """Returns the attack set of a slider by stepping along each direction"""
+
+    attacks = 0
+    row, column = square >> 3, square & 7
+
+    for row_offset, column_offset in directions:
+        new_row, new_column = row + row_offset, column + column_offset
+
+        while 0 <= new_row < 8 and 0 <= new_column < 8:
+            bit = 1 << (new_row * 8 + new_column)
+            attacks |= bit
+
+            # Stop after the first piece in the way
+            if occupied & bit:
+                break
+
+            new_row, new_column = new_row + row_offset, new_column + column_offset
+
+    return attacks
+
+
+def get_relevant_mask(square: int, directions: tuple) -> int:
+    """Returns the squares which can block a slider, not including the last square of each ray"""
+
+    mask = 0
+    row, column = square >> 3, square & 7
+
+    for row_offset, column_offset in directions:
+        new_row, new_column = row + row_offset, column + column_offset
+
+        while 0 <= new_row + row_offset < 8 and 0 <= new_column + column_offset < 8:
+            mask |= 1 << (new_row * 8 + new_column)
+            new_row, new_column = new_row + row_offset, new_column + column_offset
+
+    return mask
+
+
+def get_subsets(mask: int) -> list[int]:
+    """Returns every subset of the bits in the mask"""
+
+    subsets = []
+    subset = 0
+
+    while True:
+        subsets.append(subset)
+        subset = (subset - mask) & mask
+
+        if not subset:
+            return subsets
+
+
+def get_attack_table(
+    square: int, mask: int, magic: int, shift: int, directions: tuple
+) -> list[int]:
+    """Returns the attack sets of a square, indexed by the magic index of the occupancy"""
+
+    table = [0] * (1 << (64 - shift))
+
+    for occupied in get_subsets(mask):
+        table[(occupied * magic & FULL_BOARD) >> shift] = get_ray_attacks(
+            square, occupied, directions
+        )
+
+    return table
+
+
+def find_magic(square: int, directions: tuple, seed: int = 1) -> int:
+    """Searches for a magic number which maps every occupancy of a square to its attack set"""
+
+    generator = random.Random(seed)
+
+    mask = get_relevant_mask(square, directions)
+    shift = 64 - mask.bit_count()
+
+    occupancies = get_subsets(mask)
+    attacks = [
+        get_ray_attacks(square, occupied, directions) for occupied in occupancies
+    ]
+
+    while True:
+
+        # Magic numbers with few bits set work best
+        magic = (
+            generator.getrandbits(64)
+            & generator.getrandbits(64)
+            & generator.getrandbits(64)
+        )
+
+        if ((mask * magic & FULL_BOARD) >> 56).bit_count() < 6:
+            continue
+
+        table = {}
+
+        for occupied, attack in zip(occupancies, attacks):
+            index = (occupied * magic & FULL_BOARD) >> shift
+
+            if table.setdefault(index, attack) != attack:
+                break
+
+        else:
+            return magic
+
+
+ROOK_MASKS = [get_relevant_mask(square, ROOK_DIRECTIONS) for square in range(64)]
+BISHOP_MASKS = [get_relevant_mask(square, BISHOP_DIRECTIONS) for square in range(64)]
+
+ROOK_SHIFTS = [64 - mask.bit_count() for mask in ROOK_MASKS]
+BISHOP_SHIFTS = [64 - mask.bit_count() for mask in BISHOP_MASKS]
+
+ROOK_TABLES = [
+    get_attack_table(
+        square,
+        ROOK_MASKS[square],
+        ROOK_MAGICS[square],
+        ROOK_SHIFTS[square],
+        ROOK_DIRECTIONS,
+    )
+    for square in range(64)
+]
+BISHOP_TABLES = [
+    get_attack_table(
+        square,
+        BISHOP_MASKS[square],
+        BISHOP_MAGICS[square],
+        BISHOP_SHIFTS[square],
+        BISHOP_DIRECTIONS,
+    )
+    for square in range(64)
+]
+
+# Everything needed for a lookup, grouped by square to save on list indexing
+ROOK_ENTRIES = list(zip(ROOK_MASKS, ROOK_MAGICS, ROOK_SHIFTS, ROOK_TABLES))
+BISHOP_ENTRIES = list(zip(BISHOP_MASKS, BISHOP_MAGICS, BISHOP_SHIFTS, BISHOP_TABLES))
+
+
+def get_rook_attacks(square: int, occupied: int) -> int:
+    """Returns the attack set of a rook on a square"""
+
+    mask, magic, shift, table = ROOK_ENTRIES[square]
+
+    return table[((occupied & mask) * magic & FULL_BOARD) >> shift]
+
+
+def get_bishop_attacks(square: int, occupied: int) -> int:
+    """Returns the attack set of a bishop on a square"""
+
+    mask, magic, shift, table = BISHOP_ENTRIES[square]
+
+    return table[((occupied & mask) * magic & FULL_BOARD) >> shift]
+
+
+def get_queen_attacks(square: int, occupied: int) -> int:
+    """Returns the attack set of a queen on a square"""
+
+    return get_rook_attacks(square, occupied) | get_bishop_attacks(square, occupied)
+
+
+if __name__ == "__main__":
+
+    # Prints a new set of magic numbers
+    for name, directions in (("ROOK", ROOK_DIRECTIONS), ("BISHOP", BISHOP_DIRECTIONS)):
+        magics = [find_magic(square, directions, square) for square in range(64)]
+        print(f"{name}_MAGICS = [")
+
+        for i in range(0, 64, 4):
+            print("    " + " ".join(f"0x{magic:016X}," for magic in magics[i : i + 4]))
+
+        print("]")
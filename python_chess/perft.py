@@ -0,0 +1,306 @@
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from .chess_logic import STARTING_FEN, GameState, Move
+from .bitboard_logic import BitboardGameState
+
+# Pawn promotions are generated as a single move, but each piece promoted to is a separate move
+PROMOTION_TYPES = ("Q", "R", "B", "N")
+
+# The game state and cache of a worker process, set once when the process is started
+worker_game_state = None
+worker_cache = None
+
+
+def get_move_name(move, promotion_type: str = "") -> str:
+    """Returns the squares of a move followed by the piece promoted to, e.g. e7e8q"""
+
+    return (
+        move.get_rank_file(move.start_row, move.start_column)
+        + move.get_rank_file(move.end_row, move.end_column)
+        + promotion_type.lower()
+    )
+
+
+def count_leaves(game_state: GameState, moves: list) -> int:
+    """Returns the number of legal moves in a position without making them"""
+
+    if game_state.pseudo_legal:
+        moves = [move for move in moves if game_state.has_legal_move([move])]
+
+    promotions = sum(1 for move in moves if move.is_pawn_promotion)
+
+    return len(moves) + promotions * (len(PROMOTION_TYPES) - 1)
+
+
+def perft(game_state: GameState, depth: int, cache: dict | None = None) -> int:
+    """
+    Counts the positions reachable from the game state in exactly depth moves
+
+    Args:
+        game_state (GameState): the position to count from
+        depth (int): the number of moves to make
+        cache (dict | None): a dict of subtree counts to reuse, which can be shared between calls
+
+    Returns:
+        int: the number of positions at the given depth
+    """
+
+    if depth == 0:
+        return 1
+
+    if cache is not None:
+        key = (game_state.hash, depth)
+
+        if key in cache:
+            return cache[key]
+
+    moves = game_state.get_valid_moves()
+
+    # Count the last moves rather than making each of them
+    if depth == 1:
+        nodes = count_leaves(game_state, moves)
+
+    else:
+        nodes = 0
+        in_check = game_state.in_check
+
+        for move in moves:
+            for promotion_type in PROMOTION_TYPES if move.is_pawn_promotion else ("",):
+                game_state.make_move(move, promotion_type)
+
+                if not (
+                    game_state.pseudo_legal and game_state.king_left_in_check(in_check)
+                ):
+                    nodes += perft(game_state, depth - 1, cache)
+
+                game_state.undo_move()
+
+    if cache is not None:
+        cache[key] = nodes
+
+    return nodes
+
+
+def divide(game_state: GameState, depth: int, cache: dict | None = None) -> dict:
+    """
+    Counts the positions reachable in exactly depth moves, split by the first move
+
+    Args:
+        game_state (GameState): the position to count from
+        depth (int): the number of moves to make, at least 1
+        cache (dict | None): a dict of subtree counts to reuse, which can be shared between calls
+
+    Returns:
+        dict: the name of each legal move to the number of positions after it
+    """
+
+    counts = {}
+    moves = game_state.get_valid_moves()
+    in_check = game_state.in_check
+
+    for move in moves:
+        for promotion_type in PROMOTION_TYPES if move.is_pawn_promotion else ("",):
+            game_state.make_move(move, promotion_type)
+
+            if not (
+                game_state.pseudo_legal and game_state.king_left_in_check(in_check)
+            ):
+                counts[get_move_name(move, promotion_type)] = perft(
+                    game_state, depth - 1, cache
+                )
+
+            game_state.undo_move()
+
+    return counts
+
+
+def get_work_units(game_state: GameState, split_depth: int) -> list[tuple]:
+    """
+    Returns every sequence of legal moves of length split_depth from the game state, as
+    tuples of (move id, promotion type), in the order the moves are generated
+
+    Args:
+        game_state (GameState): the position to split
+        split_depth (int): the number of moves in each sequence
+
+    Returns:
+        list[tuple]: the sequences of moves
+    """
+
+    if split_depth == 0:
+        return [()]
+
+    units = []
+    moves = game_state.get_valid_moves()
+    in_check = game_state.in_check
+
+    for move in moves:
+        for promotion_type in PROMOTION_TYPES if move.is_pawn_promotion else ("",):
+            game_state.make_move(move, promotion_type)
+
+            if not (
+                game_state.pseudo_legal and game_state.king_left_in_check(in_check)
+            ):
+                for unit in get_work_units(game_state, split_depth - 1):
+                    units.append(((move.id, promotion_type),) + unit)
+
+            game_state.undo_move()
+
+    return units
+
+
+def start_worker(game_state: GameState, use_cache: bool) -> None:
+    """Keeps a copy of the game state in a worker process, to be used by every work unit"""
+
+    global worker_game_state, worker_cache
+
+    worker_game_state = game_state
+    worker_cache = {} if use_cache else None
+
+
+def count_work_unit(depth: int, unit: tuple) -> int:
+    """Counts the positions at the depth after making the moves of a work unit"""
+
+    for move_id, promotion_type in unit:
+        worker_game_state.make_move(Move.from_id(move_id), promotion_type)
+
+    nodes = perft(worker_game_state, depth - len(unit), worker_cache)
+
+    for _ in unit:
+        worker_game_state.undo_move()
+
+    return nodes
+
+
+def parallel_divide(
+    game_state: GameState,
+    depth: int,
+    workers: int | None = None,
+    split_depth: int = 1,
+    use_cache: bool = False,
+) -> dict:
+    """
+    Does the same as divide, but splits the moves of the first plies into work units which
+    are counted by separate processes
+
+    Args:
+        game_state (GameState): the position to count from
+        depth (int): the number of moves to make, at least 1
+        workers (int | None): the number of processes, defaults to the number of processors
+        split_depth (int): the number of plies split into work units, 1 or 2
+        use_cache (bool): whether each process keeps its own cache of subtree counts
+
+    Returns:
+        dict: the name of each legal move to the number of positions after it
+    """
+
+    units = get_work_units(game_state, min(split_depth, depth))
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=start_worker,
+        initargs=(game_state, use_cache),
+    ) as executor:
+        # The results are in the same order as the units, so every run adds up the same way
+        results = executor.map(partial(count_work_unit, depth), units)
+
+        counts = {}
+
+        for unit, nodes in zip(units, results):
+            move_id, promotion_type = unit[0]
+            move_name = get_move_name(Move.from_id(move_id), promotion_type)
+            counts[move_name] = counts.get(move_name, 0) + nodes
+
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Counts the positions at each depth")
+    parser.add_argument("depth", type=int, help="the number of moves to search")
+    parser.add_argument(
+        "--fen", default=STARTING_FEN, help="the position to count from"
+    )
+    parser.add_argument(
+        "--divide", action="store_true", help="print the count after each first move"
+    )
+    parser.add_argument(
+        "--cache", action="store_true", help="reuse the counts of repeated positions"
+    )
+    parser.add_argument(
+        "--bitboard", action="store_true", help="use the bitboard move generator"
+    )
+    parser.add_argument(
+        "--pseudo-legal", action="store_true", help="generate pseudo legal moves"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="the number of processes to count with, 0 for one per processor",
+    )
+    parser.add_argument(
+        "--split-depth",
+        type=int,
+        default=1,
+        choices=(1, 2),
+        help="the number of plies split between the processes",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="also count in a single process and print the speedup",
+    )
+    args = parser.parse_args()
+
+    # Every move counted is a first move, so there has to be at least one
+    if args.depth < 1:
+        parser.error("depth must be at least 1")
+
+    game_state_class = BitboardGameState if args.bitboard else GameState
+    game_state = game_state_class.from_fen(args.fen)
+    game_state.pseudo_legal = args.pseudo_legal
+
+    def count() -> tuple[dict, float]:
+        start_time = time.perf_counter()
+
+        if args.workers == 1:
+            counts = divide(game_state, args.depth, {} if args.cache else None)
+
+        else:
+            counts = parallel_divide(
+                game_state,
+                args.depth,
+                args.workers or None,
+                args.split_depth,
+                args.cache,
+            )
+
+        return counts, time.perf_counter() - start_time
+
+    counts, time_taken = count()
+    nodes = sum(counts.values())
+
+    if args.divide:
+        for move_name, move_nodes in counts.items():
+            print(f"{move_name}: {move_nodes}")
+
+    print(f"Nodes searched: {nodes}")
+    print(f"Time taken: {time_taken:.2f}s")
+    print(f"Nodes per second: {nodes / max(time_taken, 1e-9):.0f}")
+
+    if args.compare and args.workers != 1:
+        start_time = time.perf_counter()
+        single_nodes = perft(game_state, args.depth, {} if args.cache else None)
+        single_time = time.perf_counter() - start_time
+
+        if single_nodes != nodes:
+            print(f"Single process count differs: {single_nodes}")
+
+        print(f"Single process time taken: {single_time:.2f}s")
+        print(f"Speedup: {single_time / max(time_taken, 1e-9):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+class peSTO_pst:
+
+    mg_values = {"p": 82, "N": 337, "B": 365, "R": 477, "Q": 1025, "K": 0}
+
+    eg_values = {"p": 94, "N": 281, "B": 297, "R": 512, "Q": 936, "K": 0}
+
+    mg_pawn_table = [
+        [0, 0, 0, 0, 0, 0, 0, 0],
+        [98, 134, 61, 95, 68, 126, 34, -11],
+        [-6, 7, 26, 31, 65, 56, 25, -20],
+        [-14, 13, 6, 21, 23, 12, 17, -23],
+        [-27, -2, -5, 18, 18, 6, 10, -25],
+        [-26, -4, -4, -10, 3, 3, 33, -12],
+        [-35, -1, -20, -23, -15, 24, 38, -22],
+        [0, 0, 0, 0, 0, 0, 0, 0],
+    ]
+
+    eg_pawn_table = [
+        [0, 0, 0, 0, 0, 0, 0, 0],
+        [178, 173, 158, 134, 147, 132, 165, 187],
+        [94, 100, 85, 67, 56, 53, 82, 84],
+        [32, 24, 13, 5, -2, 4, 17, 17],
+        [13, 9, -3, -7, -7, -8, 3, -1],
+        [4, 7, -6, 1, 0, -5, -1, -8],
+        [13, 8, 8, 10, 13, 0, 2, -7],
+        [0, 0, 0, 0, 0, 0, 0, 0],
+    ]
+
+    mg_knight_table = [
+        [-167, -89, -34, -49, 61, -97, -15, -107],
+        [-73, -41, 72, 36, 23, 62, 7, -17],
+        [-47, 60, 37, 65, 84, 129, 73, 44],
+        [-9, 17, 19, 53, 37, 69, 18, 22],
+        [-13, 4, 16, 13, 28, 19, 21, -8],
+        [-23, -9, 12, 10, 19, 17, 25, -16],
+        [-29, -53, -12, -3, -1, 18, -14, -19],
+        [-105, -21, -58, -33, -17, -28, -19, -23],
+    ]
+
+    eg_knight_table = [
+        [-58, -38, -13, -28, -31, -27, -63, -99],
+        [-25, -8, -25, -2, -9, -25, -24, -52],
+        [-24, -20, 10, 9, -1, -9, -19, -41],
+        [-17, 3, 22, 22, 22, 11, 8, -18],
+        [-18, -6, 16, 25, 16, 17, 4, -18],
+        [-23, -3, -1, 15, 10, -3, -20, -22],
+        [-42, -20, -10, -5, -2, -20, -23, -44],
+        [-29, -51, -23, -15, -22, -18, -50, -64],
+    ]
+
+    mg_bishop_table = [
+        [-29, 4, -82, -37, -25, -42, 7, -8],
+        [-26, 16, -18, -13, 30, 59, 18, -47],
+        [-16, 37, 43, 40, 35, 50, 37, -2],
+        [-4, 5, 19, 50, 37, 37, 7, -2],
+        [-6, 13, 13, 26, 34, 12, 10, 4],
+        [0, 15, 15, 15, 14, 27, 18, 10],
+        [4, 15, 16, 0, 7, 21, 33, 1],
+        [-33, -3, -14, -21, -13, -12, -39, -21],
+    ]
+
+    eg_bishop_table = [
+        [-8, -4, 7, -12, -3, -13, -4, -14],
+        [-14, -21, -11, -8, -7, -9, -17, -24],
+        [2, -8, 0, -1, -2, 6, 0, 4],
+        [-3, 9, 12, 9, 14, 10, 3, 2],
+        [-6, 3, 13, 19, 7, 10, -3, -9],
+        [-12, -3, 8, 10, 13, 3, -7, -15],
+        [-14, -18, -7, -1, 4, -9, -15, -27],
+        [-23, -9, -23, -5, -9, -16, -5, -17],
+    ]
+
+    mg_rook_table = [
+        [32, 42, 32, 51, 63, 9, 31, 43],
+        [27, 32, 58, 62, 80, 67, 26, 44],
+        [-5, 19, 26, 36, 17, 45, 61, 16],
+        [-24, -11, 7, 26, 24, 35, -8, -20],
+        [-36, -26, -12, -1, 9, -7, 6, -23],
+        [-45, -25, -16, -17, 3, 0, -5, -33],
+        [-44, -16, -20, -9, -1, 11, -6, -71],
+        [-19, -13, 1, 17, 16, 7, -37, -26],
+    ]
+
+    eg_rook_table = [
+        [13, 10, 18, 15, 12, 12, 8, 5],
+        [11, 13, 13, 11, -3, 3, 8, 3],
+        [7, 7, 7, 5, 4, -3, -5, -3],
+        [4, 3, 13, 1, 2, 1, -1, 2],
+        [3, 5, 8, 4, -5, -6, -8, -11],
+        [-4, 0, -5, -1, -7, -12, -8, -16],
+        [-6, -6, 0, 2, -9, -9, -11, -3],
+        [-9, 2, 3, -1, -5, -13, 4, -20],
+    ]
+
+    mg_queen_table = [
+        [-28, 0, 29, 12, 59, 44, 43, 45],
+        [-24, -39, -5, 1, -16, 57, 28, 54],
+        [-13, -17, 7, 8, 29, 56, 47, 57],
+        [-27, -27, -16, -16, -1, 17, -2, 1],
+        [-9, -26, -9, -10, -2, -4, 3, -3],
+        [-14, 2, -11, -2, -5, 2, 14, 5],
+        [-35, -8, 11, 2, 8, 15, -3, 1],
+        [-1, -18, -9, 10, -15, -25, -31, -50],
+    ]
+
+    eg_queen_table = [
+        [-9, 22, 22, 27, 27, 19, 10, 20],
+        [-17, 20, 32, 41, 58, 25, 30, 0],
+        [-20, 6, 9, 49, 47, 35, 19, 9],
+        [3, 22, 24, 45, 57, 40, 57, 36],
+        [-18, 28, 19, 47, 31, 34, 39, 23],
+        [-16, -27, 15, 6, 9, 17, 10, 5],
+        [-22, -23, -30, -16, -16, -23, -36, -32],
+        [-33, -28, -22, -43, -5, -32, -20, -41],
+    ]
+
+    mg_king_table = [
+        [-65, 23, 16, -15, -56, -34, 2, 13],
+        [29, -1, -20, -7, -8, -4, -38, -29],
+        [-9, 24, 2, -16, -20, 6, 22, -22],
+        [-17, -20, -12, -27, -30, -25, -14, -36],
+        [-49, -1, -27, -39, -46, -44, -33, -51],
+        [-14, -14, -22, -46, -44, -30, -15, -27],
+        [1, 7, -8, -64, -43, -16, 9, 8],
+        [-15, 36, 12, -54, 8, -28, 24, 14],
+    ]
+
+    eg_king_table = [
+        [-74, -35, -18, -18, -11, 15, 4, -17],
+        [-12, 17, 14, 17, 17, 38, 23, 11],
+        [10, 17, 23, 15, 20, 45, 44, 13],
+        [-8, 22, 24, 27, 26, 33, 26, 3],
+        [-18, -4, 21, 24, 27, 23, 9, -11],
+        [-19, -3, 11, 21, 23, 16, 7, -9],
+        [-27, -11, 4, 13, 14, 4, -5, -17],
+        [-53, -34, -21, -11, -28, -14, -24, -43],
+    ]
+
+    mg_tables = {
+        "p": mg_pawn_table,
+        "N": mg_knight_table,
+        "B": mg_bishop_table,
+        "R": mg_rook_table,
+        "Q": mg_queen_table,
+        "K": mg_king_table,
+    }
+
+    eg_tables = {
+        "p": eg_pawn_table,
+        "N": eg_knight_table,
+        "B": eg_bishop_table,
+        "R": eg_rook_table,
+        "Q": eg_queen_table,
+        "K": eg_king_table,
+    }
+
+    game_phase_indicator = {"p": 0, "N": 1, "B": 1, "R": 2, "Q": 4, "K": 0}
+
+    def __init__(self) -> None:
+        pass
+
+    @classmethod
+    def get_square_evaluation(
+        cls, square: tuple, colour: str, piece_type: str
+    ) -> tuple[int, int]:
+        """
+        Returns the evaluation of a specific piece on a specific square
+
+        Returns a tuple of [middle game eval, end game eval]
+        """
+
+        row, column = square
+
+        # If it is a black piece, we need to swap the square and column to be from their perspective
+        if colour == "b":
+            row = 7 - row
+
+        # Calculate middle game and endgame score
+        mg_score = cls.mg_tables[piece_type][row][column] + cls.mg_values[piece_type]
+        eg_score = cls.eg_tables[piece_type][row][column] + cls.eg_values[piece_type]
+
+        return mg_score, eg_score
+
+    @classmethod
+    def get_board_evaluation(cls, piece_squares: dict[str, set]) -> float:
+        """
+        Returns the evaluation of the entire board, given the squares of every piece
+
+        A larger number means that its better for white and vice versa
+        """
+
+        # To keep track of which phase it is
+        mg_phase = 0
+
+        # To keep track of both side's scores
+        white_mg_score = white_eg_score = 0
+        black_mg_score = black_eg_score = 0
+
+        for piece, squares in piece_squares.items():
+
+            # Only the squares that have a piece on it are looked at
+            colour, piece_type = piece
+
+            for square in squares:
+                mg_phase += cls.game_phase_indicator[piece_type]
+
+                # Get the tuple of scores of the piece
+                mg_score, eg_score = cls.get_square_evaluation(
+                    square, colour, piece_type
+                )
+
+                # Adds the scores to the respective counters
+                if colour == "w":
+                    white_mg_score += mg_score
+                    white_eg_score += eg_score
+
+                else:
+                    black_mg_score += mg_score
+                    black_eg_score += eg_score
+
+        if mg_phase > 24:
+            mg_phase = 24
+
+        eg_phase = 24 - mg_phase
+
+        mg_score = white_mg_score - black_mg_score
+        eg_score = white_eg_score - black_eg_score
+
+        return (mg_score * mg_phase + eg_score * eg_phase) / 24
+
+
+def get_square_scores(tables: dict, values: dict) -> dict[str, list[int]]:
+    """
+    Returns the score of each piece on each square, indexed by row * 8 + column, which
+    includes the value of the piece. Black's scores are negative, so the scores of every
+    piece can be added up
+    """
+
+    square_scores = {}
+
+    for piece_type, table in tables.items():
+        white_scores = [
+            table[row][column] + values[piece_type]
+            for row in range(8)
+            for column in range(8)
+        ]
+
+        # Black's pieces use the table from their side of the board
+        black_scores = [
+            -(table[7 - row][column] + values[piece_type])
+            for row in range(8)
+            for column in range(8)
+        ]
+
+        square_scores["w" + piece_type] = white_scores
+        square_scores["b" + piece_type] = black_scores
+
+    return square_scores
+
+
+# The tables flattened so that a score can be looked up with a piece and a square index
+MG_SCORES = get_square_scores(peSTO_pst.mg_tables, peSTO_pst.mg_values)
+EG_SCORES = get_square_scores(peSTO_pst.eg_tables, peSTO_pst.eg_values)
+
+# How much each piece adds to the game phase, which is 24 at the start of the game
+GAME_PHASES = {
+    colour + piece_type: phase
+    for colour in "wb"
+    for piece_type, phase in peSTO_pst.game_phase_indicator.items()
+}
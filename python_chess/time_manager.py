@@ -0,0 +1,156 @@
+import time
+
+# Seconds kept back for the time taken to make the move, so the clock never runs out
+MOVE_OVERHEAD = 0.05
+
+# The number of moves the remaining time is shared between when moves to go is not known
+DEFAULT_MOVES_TO_GO = 30
+
+# How much of the increment is spent on each move, the rest builds up on the clock
+INCREMENT_SHARE = 0.75
+
+# The hard limit as a multiple of the time given to a move, if there is that much on the clock
+HARD_LIMIT_SCALE = 3
+
+# How much each recent change of the best move stretches the soft limit, the count of
+# recent changes halves every iteration
+BEST_MOVE_CHANGE_SCALE = 0.5
+
+# How much each iteration with the same best move shrinks the soft limit, and the least it
+# can be shrunk to
+STABLE_ITERATION_SCALE = 0.1
+MIN_STABLE_SCALE = 0.5
+
+# A fall in the evaluation of more than this between iterations stretches the soft limit,
+# by up to MAX_SCORE_DROP_SCALE
+SCORE_DROP_MARGIN = 30
+MAX_SCORE_DROP_SCALE = 2
+
+# How many times longer the next iteration is expected to take until it can be measured, and
+# the range it is kept in, as the first iterations are too short to measure well
+DEFAULT_BRANCHING_FACTOR = 4
+MIN_BRANCHING_FACTOR = 2
+MAX_BRANCHING_FACTOR = 8
+
+
+class TimeManager:
+    """
+    Decides how long to search for a move from the time left on the clock. The soft limit is
+    the time the search aims to use, which is changed after each iteration, and the hard
+    limit is the time at which the search is stopped part way through an iteration
+    """
+
+    def __init__(
+        self,
+        remaining_time: float,
+        increment: float = 0,
+        moves_to_go: int | None = None,
+        max_time: float | None = None,
+    ) -> None:
+        """
+        Args:
+            remaining_time (float): the seconds left on the clock
+            increment (float): the seconds added to the clock after each move
+            moves_to_go (int | None): the number of moves until the next time control
+            max_time (float | None): the most seconds to spend on the move, whatever the clock
+        """
+
+        self.start_time = time.perf_counter()
+
+        available_time = max(remaining_time - MOVE_OVERHEAD, 0)
+
+        self.base_time = (
+            available_time / (moves_to_go or DEFAULT_MOVES_TO_GO)
+            + increment * INCREMENT_SHARE
+        )
+        self.hard_limit = min(self.base_time * HARD_LIMIT_SCALE, available_time)
+
+        if max_time is not None:
+            self.hard_limit = min(self.hard_limit, max_time)
+
+        self.soft_limit = min(self.base_time, self.hard_limit)
+
+        self.best_move = None
+        self.evaluation = None
+        self.best_move_changes = 0
+        self.stable_iterations = 0
+
+        # The times taken by the last two iterations
+        self.iteration_time = 0
+        self.last_iteration_time = 0
+        self.iteration_end_time = self.start_time
+
+    def get_elapsed_time(self) -> float:
+        """Returns the seconds since the search started"""
+
+        return time.perf_counter() - self.start_time
+
+    def get_deadline(self) -> float:
+        """Returns the time.perf_counter() time at which the search has to stop"""
+
+        return self.start_time + self.hard_limit
+
+    def update(self, best_move, evaluation: float) -> None:
+        """
+        Changes the soft limit after an iteration is completed. It is stretched if the best
+        move keeps changing or the evaluation drops, and shrunk if the best move is stable
+
+        Args:
+            best_move (Move): the best move of the iteration
+            evaluation (float): the evaluation of the best move, for the player to move
+        """
+
+        end_time = time.perf_counter()
+
+        self.last_iteration_time = self.iteration_time
+        self.iteration_time = end_time - self.iteration_end_time
+        self.iteration_end_time = end_time
+
+        self.best_move_changes /= 2
+
+        if self.best_move is not None and best_move != self.best_move:
+            self.best_move_changes += 1
+            self.stable_iterations = 0
+
+        elif self.best_move is not None:
+            self.stable_iterations += 1
+
+        scale = (1 + self.best_move_changes * BEST_MOVE_CHANGE_SCALE) * max(
+            1 - self.stable_iterations * STABLE_ITERATION_SCALE, MIN_STABLE_SCALE
+        )
+
+        if (
+            self.evaluation is not None
+            and self.evaluation - evaluation > SCORE_DROP_MARGIN
+        ):
+            scale *= min(1 + (self.evaluation - evaluation) / 100, MAX_SCORE_DROP_SCALE)
+
+        self.best_move = best_move
+        self.evaluation = evaluation
+        self.soft_limit = min(self.base_time * scale, self.hard_limit)
+
+    def should_start_iteration(self) -> bool:
+        """
+        Returns bool of if there is time to search another iteration, which there is not once
+        the soft limit has passed, or if the iteration is unlikely to finish before the hard
+        limit
+        """
+
+        elapsed_time = self.get_elapsed_time()
+
+        if elapsed_time >= self.soft_limit:
+            return False
+
+        # Each iteration takes about as many times longer than the last as the one before it
+        if self.last_iteration_time > 0:
+            branching_factor = min(
+                max(
+                    self.iteration_time / self.last_iteration_time, MIN_BRANCHING_FACTOR
+                ),
+                MAX_BRANCHING_FACTOR,
+            )
+
+        else:
+            branching_factor = DEFAULT_BRANCHING_FACTOR
+
+        return elapsed_time + self.iteration_time * branching_factor < self.hard_limit
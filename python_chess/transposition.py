@@ -0,0 +1,142 @@
+from array import array
+
+# The bound types of a stored score: the exact score, at least the score (it caused a beta
+# cutoff) or at most the score (no move raised alpha)
+EXACT_BOUND = 1
+LOWER_BOUND = 2
+UPPER_BOUND = 3
+
+# Each entry is 3 signed 64 bit integers: the position hash, the id of the best move and the
+# packed depth (8 bits), bound (2 bits), age (6 bits) and score (the rest). An info of 0 is an
+# empty entry, as every stored entry has a bound
+ENTRY_FIELDS = 3
+ENTRY_BYTES = ENTRY_FIELDS * 8
+
+# Entries are grouped into buckets, a position can be stored in any entry of its bucket
+BUCKET_SIZE = 4
+
+BOUND_SHIFT = 8
+AGE_SHIFT = 10
+SCORE_SHIFT = 16
+AGE_MASK = 63
+
+# Evaluations are multiples of 1 / 24, so they are stored exactly as integers
+SCORE_SCALE = 24
+
+
+class TranspositionTable:
+    """
+    Table of the results of searched positions, keyed by the position hash. The entries are
+    kept in one preallocated array, so its size in memory never changes
+    """
+
+    def __init__(self, megabytes: float = 16) -> None:
+        """
+        Args:
+            megabytes (float): the memory budget of the table
+        """
+
+        self.bucket_count = max(
+            int(megabytes * 1024 * 1024) // (ENTRY_BYTES * BUCKET_SIZE), 1
+        )
+        self.entries = array("q", [0]) * (
+            self.bucket_count * BUCKET_SIZE * ENTRY_FIELDS
+        )
+
+        # Increased for every search, so that entries from earlier searches are replaced first
+        self.age = 0
+
+    def clear(self) -> None:
+        """Empties the table"""
+
+        self.entries = array("q", [0]) * len(self.entries)
+        self.age = 0
+
+    def new_search(self) -> None:
+        """Marks the entries stored so far as being from an older search"""
+
+        self.age = (self.age + 1) & AGE_MASK
+
+    def get_bucket(self, position_hash: int) -> tuple[int, int]:
+        """Returns the key of the hash and the index of the first entry of its bucket"""
+
+        # The hash is unsigned, but the array stores signed integers
+        key = position_hash - (1 << 63)
+        index = position_hash % self.bucket_count * BUCKET_SIZE * ENTRY_FIELDS
+
+        return key, index
+
+    def probe(self, position_hash: int) -> tuple[int, int, float, int] | None:
+        """
+        Returns the (depth, bound, score, best move id) stored for a position, or None if the
+        position is not in the table. A best move id of 0 means there is no best move
+        """
+
+        key, index = self.get_bucket(position_hash)
+        entries = self.entries
+
+        for index in range(index, index + BUCKET_SIZE * ENTRY_FIELDS, ENTRY_FIELDS):
+            if entries[index] == key and (info := entries[index + 2]):
+                return (
+                    info & 255,
+                    info >> BOUND_SHIFT & 3,
+                    (info >> SCORE_SHIFT) / SCORE_SCALE,
+                    entries[index + 1],
+                )
+
+        return None
+
+    def store(
+        self, position_hash: int, depth: int, bound: int, score: float, move_id: int
+    ) -> None:
+        """
+        Stores the result of a search of a position. It replaces the entry of the same
+        position, or else the entry of its bucket which is oldest and then shallowest
+
+        Args:
+            position_hash (int): the hash of the position
+            depth (int): the depth the position was searched to
+            bound (int): EXACT_BOUND, LOWER_BOUND or UPPER_BOUND
+            score (float): the score of the position for the player to move
+            move_id (int): the id of the best move, 0 if there is none
+        """
+
+        key, index = self.get_bucket(position_hash)
+        entries = self.entries
+
+        replace_index = index
+        replace_value = None
+
+        for index in range(index, index + BUCKET_SIZE * ENTRY_FIELDS, ENTRY_FIELDS):
+            info = entries[index + 2]
+
+            if entries[index] == key and info:
+                replace_index = index
+
+                # Keep the best move of the position if the search didn't find one
+                if not move_id:
+                    move_id = entries[index + 1]
+
+                break
+
+            if not info:
+                replace_index = index
+                replace_value = -1
+                continue
+
+            # Each search an entry is older counts for more than a ply of depth
+            age_difference = (self.age - (info >> AGE_SHIFT & AGE_MASK)) & AGE_MASK
+            value = (info & 255) - age_difference * 8
+
+            if replace_value is None or value < replace_value:
+                replace_index = index
+                replace_value = value
+
+        entries[replace_index] = key
+        entries[replace_index + 1] = move_id
+        entries[replace_index + 2] = (
+            round(score * SCORE_SCALE) << SCORE_SHIFT
+            | self.age << AGE_SHIFT
+            | bound << BOUND_SHIFT
+            | min(max(depth, 0), 255)
+        )
@@ -0,0 +1,60 @@
+import pytest
+from python_chess import chess_ai
+from python_chess.chess_logic import GameState
+from python_chess.pesto import EG_SCORES, MG_SCORES, peSTO_pst
+from tests.test_move_generation import PERFT_POSITIONS, WALK_DEPTH, walk_positions
+
+
+def mirror_fen(fen: str) -> str:
+    """Returns the FEN of the position with the board flipped and the colours swapped"""
+
+    board, colour, castling, en_passant, *clocks = fen.split()
+
+    board = "/".join(reversed(board.split("/"))).swapcase()
+    colour = "b" if colour == "w" else "w"
+    castling = "".join(sorted(castling.swapcase())) if castling != "-" else "-"
+
+    if en_passant != "-":
+        en_passant = en_passant[0] + str(9 - int(en_passant[1]))
+
+    return " ".join([board, colour, castling, en_passant, *clocks])
+
+
+@pytest.mark.parametrize("fen", [fen for fen, _ in PERFT_POSITIONS.values()])
+def test_running_evaluation(fen: str) -> None:
+    game_state = GameState.from_fen(fen)
+    game_state.debug_evaluation = True
+
+    for game_state in walk_positions(game_state, WALK_DEPTH):
+        piece_squares = game_state.piece_squares
+
+        # The running scores are the sums of the scores of every piece on its square
+        assert game_state.mg_score == sum(
+            MG_SCORES[piece][row * 8 + column]
+            for piece, squares in piece_squares.items()
+            for row, column in squares
+        ), game_state.to_fen()
+        assert game_state.eg_score == sum(
+            EG_SCORES[piece][row * 8 + column]
+            for piece, squares in piece_squares.items()
+            for row, column in squares
+        ), game_state.to_fen()
+
+        evaluation = peSTO_pst.get_board_evaluation(piece_squares)
+        valid_moves = game_state.get_valid_moves()
+
+        assert game_state.get_evaluation() == evaluation, game_state.to_fen()
+
+        if valid_moves and not game_state.check_for_draw():
+            assert chess_ai.get_board_evaluation(game_state, valid_moves) == evaluation
+
+
+@pytest.mark.parametrize("fen", [fen for fen, _ in PERFT_POSITIONS.values()])
+def test_mirrored_evaluation(fen: str) -> None:
+    # The evaluation is from white's side, so it changes sign when the colours are swapped
+    for game_state in walk_positions(GameState.from_fen(fen), 1):
+        mirrored_game_state = GameState.from_fen(mirror_fen(game_state.to_fen()))
+
+        assert (
+            mirrored_game_state.get_evaluation() == -game_state.get_evaluation()
+        ), game_state.to_fen()
@@ -0,0 +1,131 @@
+import random
+
+import pytest
+from python_chess.chess_logic import STARTING_FEN, GameState
+from python_chess.encoding import POSITION_SIZE, decode, encode
+from tests.test_move_generation import PERFT_POSITIONS
+
+# The perft positions, and positions with en passant squares and some of the castling rights
+FENS = [fen for fen, _ in PERFT_POSITIONS.values()] + [
+    "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2",
+    "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1",
+    "r3k2r/8/8/8/8/8/8/R3K2R w Kq - 5 20",
+    "r3k2r/8/8/8/8/8/8/R3K2R b Qk - 0 40",
+]
+
+
+@pytest.mark.parametrize("fen", FENS)
+def test_fen_round_trip(fen: str) -> None:
+    assert GameState.from_fen(fen).to_fen() == fen
+
+
+@pytest.mark.parametrize("fen", FENS)
+def test_encoding_round_trip(fen: str) -> None:
+    game_state = GameState.from_fen(fen)
+    decoded_game_state = decode(encode(game_state))
+
+    assert decoded_game_state.to_fen() == fen
+    assert decoded_game_state.hash == game_state.hash
+
+
+def test_decode_from_offset() -> None:
+    data = memoryview(b"".join(encode(GameState.from_fen(fen)) for fen in FENS))
+
+    for i, fen in enumerate(FENS):
+        assert decode(data, i * POSITION_SIZE).to_fen() == fen
+
+    with pytest.raises(ValueError):
+        decode(data, len(FENS) * POSITION_SIZE - 1)
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "8/8/8/8/8/8/8/7R w - - 0 1",
+        "4k3/8/8/8/8/8/8/7R w - - 0 1",
+        "4k3/8/8/8/8/8/8/2K1K2R w - - 0 1",
+        "4k3/8/8/8/8/8/8/4K2R w X - 0 1",
+        "4k3/8/8/8/8/8/4K2R w - - 0 1",
+        # Castling rights without the king or rook on its starting square
+        "4k3/8/8/8/8/8/8/6K1 w K - 0 1",
+        "4k3/8/8/8/8/8/8/4K2R w Q - 0 1",
+        "r3k3/8/8/8/8/8/8/4K2R w Kkq - 0 1",
+        # En passant squares which aren't squares, or aren't behind a pawn of the other colour
+        "4k3/8/8/8/8/8/8/4K3 w - e 0 1",
+        "4k3/8/8/8/8/8/8/4K3 w - e9 0 1",
+        "4k3/8/8/8/8/8/8/4K3 w - i6 0 1",
+        "4k3/8/8/8/8/8/8/4K3 w - e3 0 1",
+        "4k3/8/8/8/8/8/8/4K3 b - e6 0 1",
+    ],
+)
+def test_incorrect_fen(fen: str) -> None:
+    game_state = GameState()
+
+    with pytest.raises(ValueError):
+        game_state.set_fen(fen)
+
+    # The game state is left as it was
+    assert game_state.to_fen() == STARTING_FEN
+    assert game_state.white_king_location == (7, 4)
+    assert game_state.black_king_location == (0, 4)
+
+
+@pytest.mark.parametrize(
+    "index, value",
+    [
+        # A piece nibble which isn't a piece, in the low and the high nibble
+        (0, 13),
+        (0, 15 << 4),
+        # Unused flag bits
+        (32, 1 << 5),
+        # An en passant column which isn't a column
+        (33, 9),
+    ],
+)
+def test_incorrect_encoding(index: int, value: int) -> None:
+    data = bytearray(encode(GameState()))
+    data[index] = value
+
+    with pytest.raises(ValueError):
+        decode(data)
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "4k3/8/8/8/8/8/8/6K1 w - - 0 1",
+        "4k3/8/8/8/8/8/8/R3K3 b - - 0 1",
+    ],
+)
+def test_incorrect_encoded_castle_rights(fen: str) -> None:
+    data = bytearray(encode(GameState.from_fen(fen)))
+
+    # White king side castling without a rook on its starting square
+    data[32] |= 1
+    game_state = GameState()
+
+    with pytest.raises(ValueError):
+        decode(data, game_state=game_state)
+
+    # The game state is left as it was
+    assert game_state.to_fen() == STARTING_FEN
+
+
+def test_corrupt_encoding() -> None:
+    generator = random.Random(0)
+    data = encode(GameState())
+
+    # Random changes either give a valid position or are rejected with ValueError
+    for _ in range(1000):
+        corrupt_data = bytearray(data)
+
+        for _ in range(generator.randint(1, 4)):
+            corrupt_data[generator.randrange(POSITION_SIZE)] = generator.getrandbits(8)
+
+        try:
+            game_state = decode(corrupt_data)
+
+        except ValueError:
+            continue
+
+        assert decode(encode(game_state)).to_fen() == game_state.to_fen()
@@ -0,0 +1,141 @@
+import pytest
+from python_chess.bitboard_logic import BitboardGameState
+from python_chess.chess_logic import STARTING_FEN, GameState
+from python_chess.perft import perft
+
+# The standard perft positions and the number of positions reachable from each in 1, 2, 3...
+# moves, from https://www.chessprogramming.org/Perft_Results
+PERFT_POSITIONS = {
+    "start": (STARTING_FEN, [20, 400, 8902, 197281]),
+    "kiwipete": (
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        [48, 2039, 97862, 4085603],
+    ),
+    "position 3": (
+        "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+        [14, 191, 2812, 43238, 674624],
+    ),
+    "position 4": (
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        [6, 264, 9467, 422333],
+    ),
+    "position 5": (
+        "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+        [44, 1486, 62379, 2103487],
+    ),
+    "position 6": (
+        "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+        [46, 2079, 89890, 3894594],
+    ),
+}
+
+# Positions which have caught bugs, each named after the bug
+REGRESSION_POSITIONS = {
+    "pawn pinned on its file": "8/1Kp5/3p4/1P6/3R4/5pk1/1r4P1/8 w - - 2 9",
+}
+
+# The deepest perft run by the tests, deeper counts are kept for running by hand
+MAX_TEST_DEPTH = 3
+
+# The number of moves made from each position to reach the positions the generators are
+# compared in
+WALK_DEPTH = 2
+
+
+def walk_positions(game_state: GameState, depth: int):
+    """Yields the game state in every position reachable in up to depth moves"""
+
+    yield game_state
+
+    if not depth:
+        return
+
+    for move in game_state.get_valid_moves():
+        game_state.make_move(move, "Q" if move.is_pawn_promotion else "")
+        yield from walk_positions(game_state, depth - 1)
+        game_state.undo_move()
+
+
+@pytest.mark.parametrize("pseudo_legal", [False, True])
+@pytest.mark.parametrize("game_state_class", [GameState, BitboardGameState])
+@pytest.mark.parametrize(
+    "fen, depth, nodes",
+    [
+        (fen, depth, nodes)
+        for fen, counts in PERFT_POSITIONS.values()
+        for depth, nodes in enumerate(counts[:MAX_TEST_DEPTH], 1)
+    ],
+)
+def test_perft(
+    fen: str, depth: int, nodes: int, game_state_class: type, pseudo_legal: bool
+) -> None:
+    game_state = game_state_class.from_fen(fen, pseudo_legal=pseudo_legal)
+
+    assert perft(game_state, depth) == nodes
+
+
+@pytest.mark.parametrize("fen", [fen for fen, _ in PERFT_POSITIONS.values()])
+def test_captures_are_the_noisy_valid_moves(fen: str) -> None:
+    for game_state in walk_positions(GameState.from_fen(fen), WALK_DEPTH):
+        noisy_moves = {
+            move
+            for move in game_state.get_valid_moves()
+            if move.piece_captured or move.is_pawn_promotion
+        }
+
+        assert set(game_state.get_captures()) == noisy_moves, game_state.to_fen()
+
+
+@pytest.mark.parametrize("fen", [fen for fen, _ in PERFT_POSITIONS.values()])
+def test_evasions_are_the_valid_moves_in_check(fen: str) -> None:
+    positions_in_check = 0
+
+    for game_state in walk_positions(GameState.from_fen(fen), WALK_DEPTH):
+        valid_moves = set(game_state.get_valid_moves())
+
+        if game_state.in_check:
+            positions_in_check += 1
+
+            assert set(game_state.get_evasions()) == valid_moves, game_state.to_fen()
+
+        else:
+            assert not game_state.get_evasions(), game_state.to_fen()
+
+    # The start position can't reach check in 2 moves, every other position can
+    if fen != STARTING_FEN:
+        assert positions_in_check
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [fen for fen, _ in PERFT_POSITIONS.values()] + list(REGRESSION_POSITIONS.values()),
+)
+def test_generators_agree(fen: str) -> None:
+    game_state = GameState.from_fen(fen)
+    bitboard_game_state = BitboardGameState.from_fen(fen)
+
+    for _ in walk_positions(game_state, WALK_DEPTH - 1):
+        bitboard_game_state.set_fen(game_state.to_fen())
+        valid_moves = set(bitboard_game_state.get_valid_moves())
+
+        assert set(game_state.get_valid_moves()) == valid_moves, game_state.to_fen()
+        assert all(game_state.is_legal(move) for move in valid_moves)
+        assert all(bitboard_game_state.is_legal(move) for move in valid_moves)
+
+
+def test_promotion_type() -> None:
+    game_state = GameState.from_fen("4k3/1P6/8/8/8/8/8/4K3 w - - 0 1")
+    move = game_state.get_legal_move((1, 1), (0, 1))
+
+    game_state.make_move(move, "n")
+    assert game_state.to_fen() == "1N2k3/8/8/8/8/8/8/4K3 b - - 0 1"
+
+    game_state.undo_move()
+
+    # A bad type is rejected before the position is changed
+    for promotion_type in ("X", "K", "p"):
+        with pytest.raises(ValueError):
+            game_state.make_move(move, promotion_type)
+
+        assert game_state.to_fen() == "4k3/1P6/8/8/8/8/8/4K3 w - - 0 1"
+        assert game_state.hash == game_state.get_hash()